@@ -1,18 +1,54 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 import os
+import threading
+import time
+import fitz
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 import json
-from resume_parser import extract_text_from_pdf, extract_text_from_docx, parse_resume_text, process_resume_file
-from job_matcher import analyze_job_match
+from resume_parser import (
+    PARSER_VERSION, current_parser_version, extract_text_from_pdf, extract_text_from_docx, get_nlp_status,
+    NER_BATCH_SIZE, ParseLimitError, parse_resume_text, process_resume_batch,
+    process_resume_bytes
+)
+from job_matcher import SCORING_MODES, analyze_job_match, compile_job_profile
+from job_ranker import rank_by_relevance
+from utils.bm25 import BM25Index, index_text
+from utils.job_queue import JobQueue
+from utils.metrics import MetricsRegistry, page_count_label, timed
+from utils.parse_cache import ParseCache
+from utils.resume_store import ResumeStore
+from utils.skill_taxonomy import get_skill_taxonomy_status
 
 app = Flask(__name__)
 
+# Responses keep the API's key order; sorting every nested result dict is pure overhead
+app.json.sort_keys = False
+
 # Configuration
-app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# Ensure upload directory exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+app.config['BATCH_MAX_CONTENT_LENGTH'] = int(os.environ.get('BATCH_MAX_CONTENT_LENGTH', 256 * 1024 * 1024))  # 256MB per batch
+app.config['BATCH_MAX_FILES'] = int(os.environ.get('BATCH_MAX_FILES', 500))
+app.config['BATCH_MAX_WORKERS'] = int(os.environ.get('BATCH_MAX_WORKERS', os.cpu_count() or 1))
+app.config['PARSE_CACHE_PATH'] = os.environ.get('PARSE_CACHE_PATH', 'data/cache/parse_cache.sqlite3')
+app.config['PARSE_CACHE_MEMORY_ENTRIES'] = int(os.environ.get('PARSE_CACHE_MEMORY_ENTRIES', 256))
+app.config['PARSE_CACHE_DISK_ENTRIES'] = int(os.environ.get('PARSE_CACHE_DISK_ENTRIES', 10000))
+app.config['PARSE_CACHE_TTL'] = int(os.environ.get('PARSE_CACHE_TTL', 7 * 24 * 3600))  # 7 days
+app.config['RESUME_STORE_PATH'] = os.environ.get('RESUME_STORE_PATH', 'data/store/resumes.sqlite3')
+app.config['RESUME_STORE_MAX_ROWS'] = int(os.environ.get('RESUME_STORE_MAX_ROWS', 100000))
+app.config['RESUME_STORE_TTL'] = int(os.environ.get('RESUME_STORE_TTL', 30 * 24 * 3600))  # 30 days
+app.config['SEARCH_MAX_RESULTS'] = int(os.environ.get('SEARCH_MAX_RESULTS', 100))
+app.config['MATCH_MAX_JOBS'] = int(os.environ.get('MATCH_MAX_JOBS', 20))
+app.config['BM25_K1'] = float(os.environ.get('BM25_K1', 1.5))
+app.config['BM25_B'] = float(os.environ.get('BM25_B', 0.75))
+app.config['JOB_QUEUE_PATH'] = os.environ.get('JOB_QUEUE_PATH', 'data/jobs/jobs.sqlite3')
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', os.cpu_count() or 1))
+app.config['JOB_MAX_PENDING'] = int(os.environ.get('JOB_MAX_PENDING', 1000))
+app.config['JOB_RESULT_TTL'] = int(os.environ.get('JOB_RESULT_TTL', 3600))  # 1 hour
+app.config['JOB_TIMEOUT'] = int(os.environ.get('JOB_TIMEOUT', 900))  # 15 minutes
+app.config['METRICS_PATH'] = os.environ.get('METRICS_PATH', 'data/metrics/metrics.sqlite3')
+app.config['METRICS_FLUSH_INTERVAL'] = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
@@ -21,6 +57,239 @@ def allowed_file(filename):
     """Check if file has allowed extension"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Parse results keyed by file content, shared by /upload and /upload/batch
+parse_cache = ParseCache(
+    app.config['PARSE_CACHE_PATH'] or None,
+    current_parser_version,
+    max_memory_entries=app.config['PARSE_CACHE_MEMORY_ENTRIES'],
+    max_disk_entries=app.config['PARSE_CACHE_DISK_ENTRIES'],
+    ttl_seconds=app.config['PARSE_CACHE_TTL']
+)
+
+# Every parsed resume, indexed by skill, location and degree for /search
+resume_store = ResumeStore(
+    app.config['RESUME_STORE_PATH'],
+    max_rows=app.config['RESUME_STORE_MAX_ROWS'],
+    ttl_seconds=app.config['RESUME_STORE_TTL']
+)
+
+# BM25 statistics over the stored resumes, for relevance scoring and /rank
+relevance_index = BM25Index(k1=app.config['BM25_K1'], b=app.config['BM25_B'])
+relevance_seq = None  # last resume store change applied to relevance_index
+_relevance_lock = threading.Lock()
+
+def get_relevance_index():
+    """Return the relevance index after applying the resume store changes since the last sync"""
+    global relevance_index, relevance_seq
+    with _relevance_lock:
+        changes = resume_store.changes_since(relevance_seq) if relevance_seq is not None else None
+        if changes is None:
+            # First use, or too far behind the change log: rebuild from every stored resume
+            index = BM25Index(k1=app.config['BM25_K1'], b=app.config['BM25_B'])
+            relevance_seq = resume_store.last_change()
+            for resume_id, parsed in resume_store.iter_since(0):
+                index.add(resume_id, index_text(parsed))
+            relevance_index = index
+        elif changes[1]:
+            # Replaced resumes are re-indexed and deleted ones dropped
+            relevance_seq, changed_ids = changes
+            relevance_index.remove(changed_ids)
+            for resume_id in changed_ids:
+                parsed = resume_store.get(resume_id)
+                if parsed is not None:
+                    relevance_index.add(resume_id, index_text(parsed))
+        else:
+            relevance_seq = changes[0]
+    return relevance_index
+
+# Request counters and stage timings for /metrics, summed across server workers through METRICS_PATH
+metrics = MetricsRegistry(app.config['METRICS_PATH'] or None, flush_interval=app.config['METRICS_FLUSH_INTERVAL'])
+resume_requests = metrics.counter(
+    'resume_parser_requests_total', 'Resumes handled, by endpoint, file type, outcome and page count',
+    ['endpoint', 'file_type', 'outcome', 'pages']
+)
+resume_request_seconds = metrics.histogram(
+    'resume_parser_request_seconds', 'Seconds to handle one resume, by endpoint', ['endpoint']
+)
+resume_stage_seconds = metrics.histogram(
+    'resume_parser_stage_seconds', 'Seconds spent in each parsing and matching stage', ['stage']
+)
+
+def wants_timings():
+    """Whether the client asked for a timings block in the response"""
+    return request.values.get('timings', '').lower() in ('1', 'true', 'yes')
+
+def record_resume_metrics(endpoint, filename, outcome, parsed_results=None, timings=None):
+    """Count one handled resume and observe its stage timings"""
+    extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+    file_type = extension if extension in ALLOWED_EXTENSIONS else 'other'
+    page_count = (parsed_results or {}).get('file_info', {}).get('page_count')
+    resume_requests.inc(endpoint, file_type, outcome, page_count_label(page_count))
+    
+    for stage, seconds in (timings or {}).items():
+        if stage == 'total':
+            resume_request_seconds.observe(seconds, endpoint)
+        else:
+            resume_stage_seconds.observe(seconds, stage)
+
+def format_timings(timings):
+    """Stage timings in milliseconds for a JSON response"""
+    return {f'{stage}_ms': round(seconds * 1000, 3) for stage, seconds in timings.items()}
+
+# Process pool for batch uploads, created on first use so each server worker gets its own
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+def get_batch_executor():
+    """Return the shared process pool used to parse batch uploads"""
+    global _batch_executor
+    # Threaded workers may start several batches at once; only one of them creates the pool
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ProcessPoolExecutor(max_workers=app.config['BATCH_MAX_WORKERS'])
+        return _batch_executor
+
+def parse_and_match(file_bytes, filename, job_profile):
+    """Parse one in-memory resume and match it against an already compiled job profile
+    
+    Runs in a pool worker, so stage timings travel back in the result under 'timings'.
+    """
+    started = time.perf_counter()
+    timings = {}
+    parsed_results = process_resume_bytes(file_bytes, filename, timings)
+    if job_profile is not None:
+        with timed(timings, 'job_match'):
+            parsed_results['job_match'] = analyze_job_match(parsed_results, job_profile, timings=timings)
+    timings['total'] = time.perf_counter() - started
+    parsed_results['timings'] = timings
+    return parsed_results
+
+def parse_and_match_many(items, job_profile):
+    """Parse a chunk of in-memory resumes with batched NER and match each against the job profile
+    
+    Runs in a pool worker. items are (bytes, filename) pairs; returns one
+    entry per item in order, either a parse_and_match result or the
+    Exception that item raised.
+    """
+    item_timings = [{} for _ in items]
+    results = process_resume_batch(items, item_timings)
+    for parsed_results, timings in zip(results, item_timings):
+        if isinstance(parsed_results, Exception):
+            continue
+        if job_profile is not None:
+            with timed(timings, 'job_match'):
+                parsed_results['job_match'] = analyze_job_match(parsed_results, job_profile, timings=timings)
+        timings['total'] = sum(timings.values())
+        parsed_results['timings'] = timings
+    return results
+
+def save_parsed_results(cache_key, parsed_results):
+    """Cache and store the parse alone and return its resume id; job matches depend on the description and are not reused
+    
+    A failed cache or store write (e.g. a locked or full SQLite file) is
+    logged and does not fail the request; the resume id is then None.
+    """
+    # Key by the taxonomy the parse ran with; the pool or sandbox process may have had another loaded
+    cache_key = parse_cache.with_version(cache_key, current_parser_version(parsed_results.get('taxonomy_version')))
+    job_match = parsed_results.pop('job_match', None)
+    timings = parsed_results.pop('timings', None)
+    try:
+        parse_cache.set(cache_key, parsed_results)
+    except Exception as e:
+        app.logger.warning(f'Could not cache parse result: {str(e)}')
+    resume_id = None
+    try:
+        resume_id = resume_store.add(parsed_results, cache_key)
+    except Exception as e:
+        app.logger.warning(f'Could not store parse result: {str(e)}')
+    if job_match is not None:
+        parsed_results['job_match'] = job_match
+    if timings is not None:
+        parsed_results['timings'] = timings
+    return resume_id
+
+def stored_resume_id(cache_key, parsed_results):
+    """Resume id for a cache hit, storing the parse again if the store no longer has it (None if the store fails)"""
+    try:
+        resume_id = resume_store.id_for(cache_key)
+        if resume_id is None:
+            resume_id = resume_store.add(parsed_results, cache_key)
+        return resume_id
+    except Exception as e:
+        app.logger.warning(f'Could not store parse result: {str(e)}')
+        return None
+
+def finish_pooled_parse(endpoint, cache_key, parsed_results, include_timings=False):
+    """Save a parse_and_match result and record its metrics, keeping timings only if requested
+    
+    Returns the result and its resume id.
+    """
+    resume_id = save_parsed_results(cache_key, parsed_results)
+    timings = parsed_results.pop('timings', {})
+    record_resume_metrics(endpoint, parsed_results['file_info']['filename'], 'parsed', parsed_results, timings)
+    if include_timings:
+        parsed_results['timings'] = format_timings(timings)
+    return parsed_results, resume_id
+
+# Background parse jobs; the pool is sized separately from the web workers
+job_queue = JobQueue(
+    app.config['JOB_QUEUE_PATH'],
+    lambda: ProcessPoolExecutor(max_workers=app.config['JOB_WORKERS']),
+    max_pending=app.config['JOB_MAX_PENDING'],
+    result_ttl=app.config['JOB_RESULT_TTL'],
+    job_timeout=app.config['JOB_TIMEOUT']
+)
+
+# Synthetic resume pushed through the whole pipeline at boot (see gunicorn.conf.py)
+WARM_UP_RESUME = """Jordan Lee
+Pune, Maharashtra
+Email: jordan.lee@example.com | Phone: +91 9876543210
+LinkedIn: linkedin.com/in/jordan-lee | GitHub: github.com/jordanlee
+
+Education
+Bachelor of Technology in Computer Science
+State Institute of Technology
+2018 - 2022
+
+Projects
+Recommendation System using Python and Machine Learning
+Built a recommendation engine with Python, Flask and SQL deployed on AWS.
+
+Skills
+Python, SQL, React, Node.js, Machine Learning, Docker, Git
+"""
+WARM_UP_JOB_DESCRIPTION = "Software Engineer with 2+ years of Python, SQL and React experience."
+
+warm_up_state = {'done': False, 'seconds': None, 'timings': {}, 'error': None}
+_warm_up_lock = threading.Lock()
+
+def warm_up():
+    """Parse and match a synthetic PDF resume once so models, regexes and caches are loaded
+    
+    Called in the gunicorn master before workers fork (preload_app), so the
+    loaded state is shared copy-on-write by every worker.
+    """
+    with _warm_up_lock:
+        if warm_up_state['done']:
+            return warm_up_state
+        started = time.perf_counter()
+        timings = {}
+        try:
+            doc = fitz.open()
+            doc.new_page().insert_textbox(fitz.Rect(36, 36, 576, 806), WARM_UP_RESUME, fontsize=10)
+            pdf_bytes = doc.tobytes()
+            doc.close()
+            # Never sandboxed: the point is to load state in this process
+            parsed = process_resume_bytes(pdf_bytes, 'warm-up.pdf', timings, sandboxed=False)
+            with timed(timings, 'job_match'):
+                analyze_job_match(parsed, WARM_UP_JOB_DESCRIPTION, timings=timings)
+        except Exception as e:
+            warm_up_state['error'] = str(e)
+        warm_up_state['seconds'] = round(time.perf_counter() - started, 3)
+        warm_up_state['timings'] = format_timings(timings)
+        warm_up_state['done'] = True
+    return warm_up_state
+
 @app.route('/')
 def index():
     """Main page route"""
@@ -41,50 +310,365 @@ def upload_file():
         
         file = request.files['resume']
         job_description = request.form.get('job_description', '')
+        scoring = request.form.get('scoring', 'rules').lower()
         
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
+        if scoring not in SCORING_MODES:
+            return jsonify({'error': f"scoring must be one of {', '.join(SCORING_MODES)}"}), 400
+        
         if file and allowed_file(file.filename):
-            # Save uploaded file
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            started = time.perf_counter()
+            timings = {}
+            file_bytes = file.read()
+            cache_key = parse_cache.key_for(file_bytes)
             
-            try:
-                # Process the resume file with AI parsing
-                parsed_results = process_resume_file(filepath)
-                
-                # Add job matching analysis if job description provided
-                if job_description.strip():
-                    job_match_results = analyze_job_match(parsed_results, job_description)
-                    parsed_results['job_match'] = job_match_results
-                
-                # Clean up uploaded file after successful processing
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                
-                return jsonify({
-                    'success': True,
-                    'results': parsed_results
-                })
-                
-            except Exception as parsing_error:
-                # Clean up file on parsing error
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                return jsonify({'error': f'Error parsing resume: {str(parsing_error)}'}), 500
+            # Identical files were already parsed; only the job match needs to run
+            with timed(timings, 'cache_lookup'):
+                parsed_results = parse_cache.get(cache_key)
+            cached = parsed_results is not None
+            
+            if cached:
+                resume_id = stored_resume_id(cache_key, parsed_results)
+            else:
+                try:
+                    # Process the resume in memory with AI parsing
+                    parsed_results = process_resume_bytes(file_bytes, secure_filename(file.filename), timings)
+                    resume_id = save_parsed_results(cache_key, parsed_results)
+                    
+                except ParseLimitError as limit_error:
+                    # The sandboxed parse was stopped; the document, not the server, is at fault
+                    record_resume_metrics('upload', file.filename, limit_error.reason, timings=timings)
+                    return jsonify({'error': str(limit_error), 'error_type': f'parse_{limit_error.reason}'}), 422
+                except Exception as parsing_error:
+                    record_resume_metrics('upload', file.filename, 'error', timings=timings)
+                    return jsonify({'error': f'Error parsing resume: {str(parsing_error)}'}), 500
+            
+            parsed_results['file_info']['filename'] = secure_filename(file.filename)
+            
+            # Add job matching analysis if job description provided
+            if job_description.strip():
+                with timed(timings, 'job_match'):
+                    job_match_results = analyze_job_match(
+                        parsed_results, job_description, scoring=scoring,
+                        relevance_index=get_relevance_index() if scoring == 'bm25' else None,
+                        timings=timings
+                    )
+                parsed_results['job_match'] = job_match_results
+            
+            timings['total'] = time.perf_counter() - started
+            record_resume_metrics('upload', file.filename, 'cached' if cached else 'parsed', parsed_results, timings)
+            
+            response = {
+                'success': True,
+                'cached': cached,
+                'resume_id': resume_id,
+                'results': parsed_results
+            }
+            if wants_timings():
+                response['timings'] = format_timings(timings)
+            return jsonify(response)
         
         else:
+            record_resume_metrics('upload', file.filename, 'rejected')
             return jsonify({'error': 'Invalid file type. Please upload PDF, DOC, or DOCX files.'}), 400
             
+    except RequestEntityTooLarge:
+        raise  # answered by the 413 handler
     except Exception as e:
         return jsonify({'error': f'An error occurred during file upload: {str(e)}'}), 500
 
+@app.route('/upload/batch', methods=['POST'])
+def upload_batch():
+    """Parse many resumes in parallel against a single job description"""
+    try:
+        # Batches may be much larger than a single upload
+        request.max_content_length = app.config['BATCH_MAX_CONTENT_LENGTH']
+        
+        files = [file for file in request.files.getlist('resumes') if file.filename]
+        job_description = request.form.get('job_description', '')
+        
+        if not files:
+            return jsonify({'error': 'No files selected'}), 400
+        
+        if len(files) > app.config['BATCH_MAX_FILES']:
+            return jsonify({'error': f"Too many files. Maximum is {app.config['BATCH_MAX_FILES']} per batch."}), 400
+        
+        # Compile the job description once for the whole batch
+        job_profile = compile_job_profile(job_description) if job_description.strip() else None
+        
+        results = []
+        pending = []
+        include_timings = wants_timings()
+        
+        for file in files:
+            if not allowed_file(file.filename):
+                record_resume_metrics('batch', file.filename, 'rejected')
+                results.append({
+                    'filename': file.filename,
+                    'success': False,
+                    'error': 'Invalid file type. Please upload PDF, DOC, or DOCX files.'
+                })
+                continue
+            
+            file_bytes = file.read()
+            cache_key = parse_cache.key_for(file_bytes)
+            parsed_results = parse_cache.get(cache_key)
+            
+            if parsed_results is not None:
+                # Already parsed; match in-process instead of using the pool
+                started = time.perf_counter()
+                timings = {}
+                parsed_results['file_info']['filename'] = secure_filename(file.filename)
+                if job_profile is not None:
+                    with timed(timings, 'job_match'):
+                        parsed_results['job_match'] = analyze_job_match(parsed_results, job_profile, timings=timings)
+                timings['total'] = time.perf_counter() - started
+                record_resume_metrics('batch', file.filename, 'cached', parsed_results, timings)
+                if include_timings:
+                    parsed_results['timings'] = format_timings(timings)
+                results.append({
+                    'filename': file.filename, 'success': True, 'cached': True,
+                    'resume_id': stored_resume_id(cache_key, parsed_results), 'results': parsed_results
+                })
+                continue
+            
+            results.append({'filename': file.filename, 'cached': False})
+            pending.append((results[-1], (file_bytes, secure_filename(file.filename)), cache_key))
+        
+        # Uncached files are parsed in chunks, one per pool task, so each task batches its NER calls
+        chunk_size = max(1, min(NER_BATCH_SIZE, -(-len(pending) // app.config['BATCH_MAX_WORKERS'])))
+        chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        futures = [
+            get_batch_executor().submit(parse_and_match_many, [item for _, item, _ in chunk], job_profile)
+            for chunk in chunks
+        ]
+        
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunk_results = future.result()
+            except Exception as pool_error:
+                chunk_results = [pool_error] * len(chunk)
+            
+            for (result, _, cache_key), parsed_results in zip(chunk, chunk_results):
+                try:
+                    if isinstance(parsed_results, Exception):
+                        raise parsed_results
+                    parsed_results['file_info']['filename'] = secure_filename(result['filename'])
+                    parsed_results, resume_id = finish_pooled_parse('batch', cache_key, parsed_results, include_timings)
+                    result['success'] = True
+                    result['resume_id'] = resume_id
+                    result['results'] = parsed_results
+                except ParseLimitError as limit_error:
+                    record_resume_metrics('batch', result['filename'], limit_error.reason)
+                    result['success'] = False
+                    result['error'] = str(limit_error)
+                    result['error_type'] = f'parse_{limit_error.reason}'
+                except Exception as parsing_error:
+                    record_resume_metrics('batch', result['filename'], 'error')
+                    result['success'] = False
+                    result['error'] = f'Error parsing resume: {str(parsing_error)}'
+        
+        return jsonify({
+            'success': True,
+            'total': len(results),
+            'succeeded': sum(1 for result in results if result['success']),
+            'results': results
+        })
+    
+    except RequestEntityTooLarge:
+        raise  # answered by the 413 handler
+    except Exception as e:
+        return jsonify({'error': f'An error occurred during batch upload: {str(e)}'}), 500
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """Queue a resume for background parsing and return a job id immediately"""
+    try:
+        if 'resume' not in request.files or request.files['resume'].filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        file = request.files['resume']
+        job_description = request.form.get('job_description', '')
+        
+        if not allowed_file(file.filename):
+            record_resume_metrics('jobs', file.filename, 'rejected')
+            return jsonify({'error': 'Invalid file type. Please upload PDF, DOC, or DOCX files.'}), 400
+        
+        filename = secure_filename(file.filename)
+        file_bytes = file.read()
+        cache_key = parse_cache.key_for(file_bytes)
+        parsed_results = parse_cache.get(cache_key)
+        
+        if parsed_results is not None:
+            # Already parsed; the job is finished as soon as matching is done
+            parsed_results['file_info']['filename'] = filename
+            if job_description.strip():
+                parsed_results['job_match'] = analyze_job_match(parsed_results, job_description)
+            record_resume_metrics('jobs', filename, 'cached', parsed_results)
+            job_id = job_queue.complete(parsed_results)
+        else:
+            job_profile = compile_job_profile(job_description) if job_description.strip() else None
+            job_id = job_queue.submit(
+                parse_and_match, file_bytes, filename, job_profile,
+                on_result=lambda parsed: finish_pooled_parse('jobs', cache_key, parsed)[0]
+            )
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'done' if parsed_results is not None else 'queued',
+            'status_url': f'/jobs/{job_id}'
+        }), 202
+    
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 503
+    except RequestEntityTooLarge:
+        raise  # answered by the 413 handler
+    except Exception as e:
+        return jsonify({'error': f'An error occurred while queueing the resume: {str(e)}'}), 500
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    """Report a parse job's status, with its results or error once finished"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+def split_query_values(name):
+    """Read a comma-separated (or repeated) query parameter as a list of values"""
+    values = []
+    for raw in request.args.getlist(name):
+        values.extend(value.strip() for value in raw.split(',') if value.strip())
+    return values
+
+@app.route('/search')
+def search_resumes():
+    """Search stored resumes by skills, location and degree without re-parsing"""
+    try:
+        mode = request.args.get('mode', 'all').lower()
+        if mode not in ('all', 'any'):
+            return jsonify({'error': "mode must be 'all' or 'any'"}), 400
+        
+        limit = min(request.args.get('limit', 20, type=int), app.config['SEARCH_MAX_RESULTS'])
+        results = resume_store.search(
+            skills=split_query_values('skills'),
+            locations=split_query_values('location'),
+            degrees=split_query_values('degree'),
+            match_all=(mode == 'all'),
+            limit=max(limit, 1)
+        )
+        
+        if not results['terms']:
+            return jsonify({'error': 'Provide at least one of skills, location or degree'}), 400
+        
+        return jsonify({'success': True, 'mode': mode, **results})
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'An error occurred during search: {str(e)}'}), 500
+
+@app.route('/rank', methods=['POST'])
+def rank_stored_resumes():
+    """Rank every stored resume by BM25 relevance to a job description"""
+    try:
+        job_description = request.form.get('job_description', '')
+        if not job_description.strip():
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        top_k = min(request.form.get('top_k', 20, type=int), app.config['SEARCH_MAX_RESULTS'])
+        index = get_relevance_index()
+        results = rank_by_relevance(index, job_description, max(top_k, 1))
+        
+        for result in results:
+            parsed = resume_store.get(result['resume_id']) or {}
+            result['name'] = parsed.get('personal_info', {}).get('name', '')
+            result['filename'] = parsed.get('file_info', {}).get('filename', '')
+            result['skills'] = parsed.get('skills', [])
+        
+        return jsonify({'success': True, 'corpus_size': len(index), 'results': results})
+    
+    except Exception as e:
+        return jsonify({'error': f'An error occurred during ranking: {str(e)}'}), 500
+
+@app.route('/match', methods=['POST'])
+def match_stored_resume():
+    """Match a previously parsed resume against one or more job descriptions without re-parsing it"""
+    try:
+        resume_id = request.form.get('resume_id', type=int)
+        if resume_id is None:
+            return jsonify({'error': 'No resume_id provided'}), 400
+        
+        job_descriptions = [jd for jd in request.form.getlist('job_description') if jd.strip()]
+        scoring = request.form.get('scoring', 'rules').lower()
+        
+        if not job_descriptions:
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        if len(job_descriptions) > app.config['MATCH_MAX_JOBS']:
+            return jsonify({'error': f"Too many job descriptions. Maximum is {app.config['MATCH_MAX_JOBS']} per request."}), 400
+        
+        if scoring not in SCORING_MODES:
+            return jsonify({'error': f"scoring must be one of {', '.join(SCORING_MODES)}"}), 400
+        
+        parsed_results = resume_store.get(resume_id)
+        if parsed_results is None:
+            return jsonify({'error': 'Resume not found. Upload it again to get a new resume_id.'}), 404
+        
+        started = time.perf_counter()
+        timings = {}
+        relevance = get_relevance_index() if scoring == 'bm25' else None
+        with timed(timings, 'job_match'):
+            results = [
+                analyze_job_match(parsed_results, job_description, scoring=scoring,
+                                  relevance_index=relevance, timings=timings)
+                for job_description in job_descriptions
+            ]
+        timings['total'] = time.perf_counter() - started
+        resume_request_seconds.observe(timings['total'], 'match')
+        
+        response = {'success': True, 'resume_id': resume_id, 'results': results}
+        if wants_timings():
+            response['timings'] = format_timings(timings)
+        return jsonify(response)
+    
+    except Exception as e:
+        return jsonify({'error': f'An error occurred during matching: {str(e)}'}), 500
+
+@app.route('/ready')
+def ready():
+    """Readiness probe: model status and boot warm-up timing; 503 if warm-up failed"""
+    # Servers started without the gunicorn config warm up on the first probe instead
+    state = warm_up()
+    status = {
+        'ready': state['error'] is None,
+        'pid': os.getpid(),
+        'parser_version': PARSER_VERSION,
+        'model': get_nlp_status(),
+        'skill_taxonomy': get_skill_taxonomy_status(),
+        'warm_up': state
+    }
+    return jsonify(status), 200 if status['ready'] else 503
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Expose request counters and stage timing histograms in Prometheus text format"""
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/cache/stats')
+def cache_stats():
+    """Report parse cache hit/miss counters"""
+    return jsonify(parse_cache.stats())
+
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error"""
-    return jsonify({'error': 'File too large. Maximum size is 16MB.'}), 413
+    # /upload/batch raises its own limit for the request
+    limit = request.max_content_length or app.config['MAX_CONTENT_LENGTH']
+    return jsonify({'error': f'File too large. Maximum size is {limit // (1024 * 1024)}MB.'}), 413
 
 @app.errorhandler(404)
 def not_found(e):
@@ -100,4 +684,5 @@ if __name__ == '__main__':
     print("🚀 AI Resume Parser starting...")
     print("📄 Navigate to http://localhost:5000 to use the application")
     print("🧠 AI-powered resume parsing enabled!")
+    warm_up()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
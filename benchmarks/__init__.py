@@ -0,0 +1 @@
+# Placeholder file
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the resume extractors on synthetic resumes
+Times each extractor, the PDF/DOCX text extractors and job matching
+separately over the standard synthetic resume matrix, writes a JSON report
+and optionally compares it against a stored baseline report.
+
+Usage: python -m benchmarks.extractors [--json report.json] [--baseline baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resume_parser
+from job_matcher import analyze_job_match
+from benchmarks.synthetic_resumes import generate_resume_text, render_docx, render_pdf, standard_specs
+
+JOB_DESCRIPTION = (
+    "We are hiring a Software Engineer with 3+ years of experience in Python, SQL and React. "
+    "Experience with Machine Learning, Node.js and Analytics is a plus."
+)
+
+# Fast calls are looped until one measurement takes at least this long
+MIN_BATCH_SECONDS = 0.005
+
+def best_time(func, argument, repeats: int) -> float:
+    """Return the best per-call wall time in milliseconds of func(argument) over several batches"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func(argument)
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_BATCH_SECONDS:
+            break
+        number *= 2
+
+    best = elapsed / number
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats - 1):
+            started = time.perf_counter()
+            for _ in range(number):
+                func(argument)
+            best = min(best, (time.perf_counter() - started) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best * 1000
+
+def build_cases(seed: int):
+    """Generate every synthetic resume once, with its renderings and parse result"""
+    cases = []
+    for spec in standard_specs(seed):
+        text = generate_resume_text(spec)
+        cases.append({
+            'spec': spec,
+            'text': text,
+            'pdf': render_pdf(text),
+            'docx': render_docx(text),
+            'parsed': resume_parser.parse_resume_text(text)
+        })
+    return cases
+
+def benchmark_targets():
+    """Name -> (function, which input of a case it takes)"""
+    return {
+        'extract_personal_info': (resume_parser.extract_personal_info, 'text'),
+        'extract_skills': (resume_parser.extract_skills, 'text'),
+        'extract_experience': (resume_parser.extract_experience, 'text'),
+        'extract_education': (resume_parser.extract_education, 'text'),
+        'extract_projects': (resume_parser.extract_projects, 'text'),
+        'extract_text_from_pdf': (resume_parser.extract_text_from_pdf, 'pdf'),
+        'extract_text_from_docx': (resume_parser.extract_text_from_docx, 'docx'),
+        'analyze_job_match': (lambda parsed: analyze_job_match(parsed, JOB_DESCRIPTION), 'parsed')
+    }
+
+def cpu_model() -> str:
+    """Best-effort CPU model name, since platform.processor() is often empty on Linux"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or 'unknown'
+
+def environment():
+    """Describe the machine and library versions a report was produced with"""
+    versions = {}
+    for module_name in ('fitz', 'docx', 'spacy', 'numpy'):
+        try:
+            module = __import__(module_name)
+            versions[module_name] = getattr(module, 'VersionBind', None) or getattr(module, '__version__', 'unknown')
+        except ImportError:
+            versions[module_name] = None
+    return {
+        'platform': platform.platform(),
+        'cpu': cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'spacy_model': resume_parser.SPACY_MODEL if resume_parser.get_nlp() is not None else None,
+        'libraries': versions
+    }
+
+def run(seed: int, repeats: int):
+    """Time every target on every case and aggregate per target and per resume length"""
+    cases = build_cases(seed)
+    results = {}
+    for name, (func, field) in benchmark_targets().items():
+        timings = [best_time(func, case[field], repeats) for case in cases]
+        by_length = defaultdict(float)
+        for case, timing in zip(cases, timings):
+            by_length[str(case['spec'].length)] += timing
+        results[name] = {
+            'total_ms': round(sum(timings), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'max_ms': round(max(timings), 3),
+            'total_ms_by_length': {length: round(total, 3) for length, total in by_length.items()}
+        }
+    return {
+        'meta': {
+            'parser_version': resume_parser.PARSER_VERSION,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'spacy_enabled': resume_parser.get_nlp() is not None,
+            'seed': seed,
+            'repeats': repeats,
+            'cases': len(cases),
+            'environment': environment()
+        },
+        'results': results
+    }
+
+def compare(report, baseline, tolerance: float):
+    """Return (name, baseline ms, current ms, ratio, regressed) rows for targets in both reports"""
+    rows = []
+    for name, current in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None or not previous['total_ms']:
+            continue
+        ratio = current['total_ms'] / previous['total_ms']
+        rows.append((name, previous['total_ms'], current['total_ms'], ratio, ratio > 1 + tolerance))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', help='Write the report to this JSON file')
+    parser.add_argument('--baseline', help='Compare against this previously written report')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Slowdown ratio above which a target counts as regressed (default 0.25)')
+    args = parser.parse_args()
+
+    # Load the NLP model up front so its start-up is not charged to the first extractor
+    resume_parser.get_nlp()
+    report = run(args.seed, args.repeats)
+
+    print(f"{'target':<24} {'total ms':>10} {'mean ms':>9} {'max ms':>9}")
+    for name, result in report['results'].items():
+        print(f"{name:<24} {result['total_ms']:>10.2f} {result['mean_ms']:>9.3f} {result['max_ms']:>9.3f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('spacy_enabled') != report['meta']['spacy_enabled']:
+            print("\nWarning: baseline and current run differ in spaCy availability")
+        baseline_environment = baseline.get('meta', {}).get('environment', {})
+        if baseline_environment.get('cpu') != report['meta']['environment']['cpu']:
+            print(f"\nWarning: baseline was produced on a different CPU ({baseline_environment.get('cpu', 'unknown')})")
+
+        rows = compare(report, baseline, args.tolerance)
+        print(f"\n{'target':<24} {'baseline':>10} {'current':>10} {'ratio':>7}")
+        for name, previous, current, ratio, regressed in rows:
+            print(f"{name:<24} {previous:>10.2f} {current:>10.2f} {ratio:>6.2f}x{'  REGRESSED' if regressed else ''}")
+
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
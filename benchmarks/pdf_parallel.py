@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs parallel PDF text extraction
+Finds the page count at which the parallel path starts beating the serial one
+on this machine, to choose PDF_PARALLEL_MIN_PAGES.
+
+Usage: python -m benchmarks.pdf_parallel [--workers N] [--pages 8 16 32 ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import fitz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resume_parser
+
+LINE = "Developed scalable data pipelines in Python and SQL for analytics dashboards and reporting. "
+
+def build_pdf(page_count: int, lines_per_page: int = 60) -> bytes:
+    """Build an in-memory PDF with dense text on every page"""
+    doc = fitz.open()
+    for page_number in range(page_count):
+        page = doc.new_page()
+        text = "\n".join(f"{page_number}.{line} {LINE}" for line in range(lines_per_page))
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=6)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def time_extraction(data: bytes, workers: int, repeats: int) -> float:
+    """Return the best wall time in seconds over several runs"""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        resume_parser.extract_pdf_text(data, max_pages=0, max_chars=0, parallel_workers=workers)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--pages', type=int, nargs='+', default=[4, 8, 16, 32, 64, 128, 256])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    # Let every document take the parallel path so both modes are measured
+    resume_parser.PDF_PARALLEL_MIN_PAGES = 0
+
+    # Start the pool before timing so process startup is not counted
+    time_extraction(build_pdf(args.workers), args.workers, 1)
+
+    rows = []
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    for page_count in args.pages:
+        data = build_pdf(page_count)
+        serial = time_extraction(data, 0, args.repeats)
+        parallel = time_extraction(data, args.workers, args.repeats)
+        rows.append({'pages': page_count, 'serial_ms': serial * 1000, 'parallel_ms': parallel * 1000})
+        print(f"{page_count:>6} {serial * 1000:>10.1f} {parallel * 1000:>12.1f} {serial / parallel:>7.2f}x")
+
+    # Crossover: smallest page count from which parallel stays faster
+    crossover = None
+    for row in reversed(rows):
+        if row['parallel_ms'] >= row['serial_ms']:
+            break
+        crossover = row['pages']
+
+    if crossover is None:
+        print(f"\nParallel extraction with {args.workers} workers never beat serial in this range")
+    else:
+        print(f"\nParallel extraction with {args.workers} workers wins from {crossover} pages;"
+              f" set PDF_PARALLEL_MIN_PAGES={crossover}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'workers': args.workers, 'crossover_pages': crossover, 'results': rows}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
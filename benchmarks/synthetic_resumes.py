@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic resume generator
+Builds resumes of varying length, section layout and skill density from a
+seed, as plain text or rendered to PDF and DOCX, for benchmarking the parser.
+
+Usage: python -m benchmarks.synthetic_resumes [--count N] [--seed S] [--out DIR]
+"""
+
+import argparse
+import os
+import random
+import sys
+from dataclasses import dataclass
+from io import BytesIO
+from typing import List
+
+import docx
+import fitz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_taxonomy import get_skill_taxonomy
+
+FIRST_NAMES = ['Priya', 'Rahul', 'Ananya', 'Arjun', 'Sneha', 'Vikram', 'Maria', 'James', 'Wei', 'Fatima']
+LAST_NAMES = ['Sharma', 'Verma', 'Iyer', 'Reddy', 'Nair', 'Garcia', 'Smith', 'Chen', 'Khan', 'Patel']
+CITIES = ['Bengaluru, Karnataka', 'Pune, Maharashtra', 'Mumbai, Maharashtra', 'Hyderabad, Telangana',
+          'Chennai, Tamil Nadu', 'Delhi, India', 'Austin, TX', 'London, UK']
+COMPANIES = ['Infosys', 'TCS', 'Wipro', 'Acme Analytics', 'Globex Labs', 'Initech', 'Umbrella Systems']
+POSITIONS = ['Software Engineer', 'Data Analyst', 'ML Engineer', 'Backend Developer', 'Marketing Analyst']
+DEGREES = [
+    'Bachelor of Engineering in Computer Science', 'B.Tech in Information Technology',
+    'Master of Science in Data Science', 'MBA in Marketing', 'B.Sc Physics', 'M.Tech in Software Systems'
+]
+INSTITUTIONS = ['RV College of Engineering', 'IIT Bombay', 'Anna University', 'Delhi University',
+                'State Institute of Technology', 'National College']
+PROJECT_SUBJECTS = ['Chatbot', 'Recommendation System', 'Fraud Detection Model', 'Inventory Dashboard',
+                    'Image Classification Platform', 'Sales Prediction Tool', 'Web Scraping Automation']
+FILLER = [
+    'Collaborated with cross-functional teams to deliver features on schedule.',
+    'Improved response times by profiling and optimizing critical code paths.',
+    'Wrote documentation and onboarding guides for new team members.',
+    'Designed and maintained automated test suites for core services.',
+    'Presented results to stakeholders and incorporated their feedback.'
+]
+SECTIONS = ['summary', 'education', 'experience', 'projects', 'skills']
+HEADING_STYLES = ['title', 'upper', 'colon']
+
+@dataclass
+class ResumeSpec:
+    """Knobs for one synthetic resume"""
+    seed: int = 0
+    length: int = 2               # Experience entries and projects; also scales filler
+    skill_density: float = 0.1    # Fraction of the skill taxonomy to list
+    layout: str = 'standard'      # 'standard', 'shuffled' or 'minimal'
+    heading_style: str = 'title'  # 'title', 'upper' or 'colon'
+
+def _heading(name: str, style: str) -> str:
+    if style == 'upper':
+        return name.upper()
+    if style == 'colon':
+        return f"{name.title()}:"
+    return name.title()
+
+def generate_resume_text(spec: ResumeSpec) -> str:
+    """Return the text of a resume; the same spec always gives the same text"""
+    rng = random.Random(spec.seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(' ', '.')
+
+    lines = [
+        name,
+        rng.choice(CITIES),
+        f"Email: {handle}@example.com | Phone: +91 {rng.randint(7000000000, 9999999999)}",
+        f"LinkedIn: linkedin.com/in/{handle.replace('.', '-')} | GitHub: github.com/{handle.replace('.', '')}",
+        ''
+    ]
+
+    skill_names = get_skill_taxonomy().skills
+    skill_count = max(1, int(len(skill_names) * spec.skill_density))
+    skills = rng.sample(skill_names, min(skill_count, len(skill_names)))
+
+    body = {
+        'summary': [' '.join(rng.choice(FILLER) for _ in range(1 + spec.length // 2))],
+        'education': [],
+        'experience': [],
+        'projects': [],
+        'skills': [', '.join(skills[i:i + 10]) for i in range(0, len(skills), 10)]
+    }
+    for _ in range(max(1, spec.length // 2)):
+        start = rng.randint(2008, 2020)
+        body['education'] += [rng.choice(DEGREES), rng.choice(INSTITUTIONS), f"{start} - {start + 4}",
+                              f"CGPA: {rng.randint(60, 99) / 10}"]
+    for _ in range(spec.length):
+        start = rng.randint(2012, 2022)
+        body['experience'] += [f"{rng.choice(POSITIONS)} at {rng.choice(COMPANIES)}", f"{start} - {start + 2}"]
+        body['experience'] += [f"- {rng.choice(FILLER)}" for _ in range(2 + spec.length // 3)]
+    for _ in range(spec.length):
+        used = ', '.join(rng.sample(skills, min(3, len(skills))))
+        body['projects'] += [f"{rng.choice(PROJECT_SUBJECTS)} using {used}",
+                             f"Built and deployed the system with {used}. {rng.choice(FILLER)}"]
+
+    if spec.layout == 'minimal':
+        order = ['education', 'skills']
+    elif spec.layout == 'shuffled':
+        order = SECTIONS[:]
+        rng.shuffle(order)
+    else:
+        order = SECTIONS
+
+    for section in order:
+        lines.append(_heading(section, spec.heading_style))
+        lines.extend(body[section])
+        lines.append('')
+    return '\n'.join(lines)
+
+def render_pdf(text: str, lines_per_page: int = 60) -> bytes:
+    """Render text into an in-memory PDF, one text box per page"""
+    doc = fitz.open()
+    lines = text.split('\n')
+    for start in range(0, max(len(lines), 1), lines_per_page):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), '\n'.join(lines[start:start + lines_per_page]), fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def render_docx(text: str) -> bytes:
+    """Render text into an in-memory DOCX, one paragraph per line"""
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def standard_specs(seed: int = 0) -> List[ResumeSpec]:
+    """The spec matrix used by the benchmarks: each length/density/layout combination"""
+    specs = []
+    for length in (1, 4, 12):
+        for skill_density in (0.02, 0.1, 0.4):
+            for index, layout in enumerate(('standard', 'shuffled', 'minimal')):
+                specs.append(ResumeSpec(
+                    seed=seed + len(specs),
+                    length=length,
+                    skill_density=skill_density,
+                    layout=layout,
+                    heading_style=HEADING_STYLES[index]
+                ))
+    return specs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--count', type=int, help='Write only the first N resumes of the standard matrix')
+    parser.add_argument('--out', default='tests/sample_resumes', help='Directory to write .txt/.pdf/.docx files to')
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    specs = standard_specs(args.seed)[:args.count]
+    for spec in specs:
+        text = generate_resume_text(spec)
+        stem = os.path.join(args.out, f"synthetic_{spec.seed:03d}_{spec.layout}_l{spec.length}")
+        with open(stem + '.txt', 'w', encoding='utf-8') as f:
+            f.write(text)
+        with open(stem + '.pdf', 'wb') as f:
+            f.write(render_pdf(text))
+        with open(stem + '.docx', 'wb') as f:
+            f.write(render_docx(text))
+    print(f"Wrote {len(specs)} resumes (txt, pdf, docx) to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Gunicorn serving configuration
+The app is imported once in the master (preload_app) and warmed up there
+before workers fork, so the spaCy model, compiled regexes and skill
+matchers are shared copy-on-write instead of loaded by every worker.
+Every setting below can be overridden from the environment.
+"""
+
+import gc
+import os
+
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Recycle workers after this many requests (plus jitter so they do not restart together)
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+warm_up_at_boot = os.environ.get('WARM_UP', '1') != '0'
+
+
+def when_ready(server):
+    # Runs in the master after the preloaded app is imported and before any worker forks
+    if not (preload_app and warm_up_at_boot):
+        return
+
+    from app import warm_up
+    state = warm_up()
+    if state['error']:
+        server.log.warning(f"Warm-up failed: {state['error']}")
+    else:
+        server.log.info(f"Warm-up finished in {state['seconds']}s")
+
+    # Move everything loaded so far out of the garbage collector's reach so
+    # collections in the workers do not touch (and un-share) those pages
+    gc.freeze()
+
+
+def worker_exit(server, worker):
+    # Runs in a worker as it exits (including max_requests recycling): hand its last metrics to the shared file
+    from app import metrics
+    metrics.flush()
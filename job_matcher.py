@@ -1,8 +1,20 @@
+import hashlib
 import re
-from typing import Dict, List, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from utils.bm25 import BM25Index, index_text
+from utils.metrics import timed
+from utils.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy
 
-def extract_job_requirements(job_description: str) -> Dict[str, Any]:
+# Number of compiled job profiles kept for reuse
+JOB_PROFILE_CACHE_SIZE = 128
+
+# 'rules' scores by required-skill overlap; 'bm25' by text relevance over the stored corpus
+SCORING_MODES = ('rules', 'bm25')
+
+def extract_job_requirements(job_description: str, taxonomy: Optional[SkillTaxonomy] = None) -> Dict[str, Any]:
     """Extract requirements from job description"""
     requirements = {
         'required_skills': [],
@@ -22,15 +34,8 @@ def extract_job_requirements(job_description: str) -> Dict[str, Any]:
         requirements['job_field'] = 'data_science'
     
     # Extract skills
-    common_skills = [
-        'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL',
-        'Marketing', 'Analytics', 'Branding', 'Campaign Management',
-        'Data Analysis', 'Machine Learning', 'AI'
-    ]
-    
-    for skill in common_skills:
-        if skill.lower() in text_lower:
-            requirements['required_skills'].append(skill)
+    taxonomy = taxonomy or get_skill_taxonomy()
+    requirements['required_skills'] = taxonomy.job_skill_matcher.find(job_description)
     
     # Extract experience requirements
     exp_patterns = [
@@ -47,27 +52,105 @@ def extract_job_requirements(job_description: str) -> Dict[str, Any]:
     
     return requirements
 
-def analyze_job_match(resume_data: dict, job_description: str) -> dict:
-    """Enhanced job matching with field compatibility detection"""
+def field_score(text_lower: str, keywords: List[str]) -> int:
+    """Count the field keywords that occur in lower-cased text"""
+    return sum(1 for keyword in keywords if keyword in text_lower)
+
+class JobProfile:
+    """A job description compiled once for matching against many resumes
+    
+    Carries the normalized text, the extracted requirements and the field
+    scores that analyze_job_match would otherwise re-derive on every call,
+    plus the skill taxonomy they were derived with.
+    """
+    
+    __slots__ = ('description', 'digest', 'text_lower', 'taxonomy', 'requirements',
+                 'required_skills', 'experience_years', 'tech_score', 'marketing_score')
+    
+    def __init__(self, job_description: str, digest: Optional[str] = None,
+                 taxonomy: Optional[SkillTaxonomy] = None):
+        self.description = job_description
+        self.digest = digest or job_description_digest(job_description)
+        self.text_lower = job_description.lower()
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        self.requirements = extract_job_requirements(job_description, self.taxonomy)
+        self.required_skills = frozenset(skill.lower() for skill in self.requirements['required_skills'])
+        self.experience_years = self.requirements['experience_years']
+        self.tech_score = field_score(self.text_lower, self.taxonomy.field_keywords.get('technical', []))
+        self.marketing_score = field_score(self.text_lower, self.taxonomy.field_keywords.get('marketing', []))
+
+def job_description_digest(job_description: str) -> str:
+    """Return the SHA-256 hex digest identifying a job description"""
+    return hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+
+_job_profiles: 'OrderedDict[str, JobProfile]' = OrderedDict()
+_job_profiles_lock = threading.Lock()
+
+def compile_job_profile(job_description: str, taxonomy: Optional[SkillTaxonomy] = None) -> JobProfile:
+    """Return the JobProfile for a job description, reusing a recently compiled one
     
-    # Extract job requirements
-    job_requirements = extract_job_requirements(job_description)
+    A cached profile built with another skill taxonomy version is rebuilt.
+    """
+    digest = job_description_digest(job_description)
+    taxonomy = taxonomy or get_skill_taxonomy()
+    with _job_profiles_lock:
+        profile = _job_profiles.get(digest)
+        if profile is not None and profile.taxonomy.version == taxonomy.version:
+            _job_profiles.move_to_end(digest)
+            return profile
+    
+    profile = JobProfile(job_description, digest, taxonomy)
+    with _job_profiles_lock:
+        _job_profiles[digest] = profile
+        while len(_job_profiles) > JOB_PROFILE_CACHE_SIZE:
+            _job_profiles.popitem(last=False)
+    return profile
+
+def relevance_percentage(score: float, max_score: float) -> float:
+    """Scale a BM25 score to 0-100 against the best score the query allows"""
+    return round(min(score / max_score * 100, 100.0), 1) if max_score > 0 else 0.0
+
+def score_relevance(resume_data: dict, job_description: str, index: BM25Index) -> dict:
+    """BM25 relevance of a parsed resume to a job description using the index's corpus statistics"""
+    score = index.score(job_description, index_text(resume_data))
+    return {
+        'match_percentage': relevance_percentage(score, index.max_score(job_description)),
+        'bm25_score': round(score, 3),
+        'corpus_size': len(index)
+    }
+
+def analyze_job_match(resume_data: dict, job: Union[str, JobProfile],
+                      scoring: str = 'rules', relevance_index: Optional[BM25Index] = None,
+                      timings: Optional[Dict[str, float]] = None) -> dict:
+    """Enhanced job matching with field compatibility detection
+    
+    job may be the raw description or a JobProfile from compile_job_profile;
+    pass the profile when matching many resumes against one posting. With
+    scoring='bm25' the overall score is the resume's BM25 relevance to the
+    description, computed with relevance_index's corpus statistics.
+    If timings is given, per-stage seconds are added to it.
+    """
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"scoring must be one of {', '.join(SCORING_MODES)}")
+    if scoring == 'bm25' and relevance_index is None:
+        raise ValueError("scoring='bm25' requires a relevance_index")
+    
+    # Compile job requirements (memoized by description hash)
+    with timed(timings, 'job_profile'):
+        profile = job if isinstance(job, JobProfile) else compile_job_profile(job)
+    job_requirements = dict(profile.requirements, required_skills=list(profile.requirements['required_skills']))
     
     # Detect resume field vs job field mismatch
     resume_skills = [skill.lower() for skill in resume_data.get('skills', [])]
-    job_text_lower = job_description.lower()
-    
-    # Define field categories
-    tech_skills = ['python', 'java', 'javascript', 'ai', 'ml', 'programming', 'software', 'development', 'algorithm']
-    marketing_skills = ['marketing', 'branding', 'campaign', 'analytics', 'lead generation', 'engagement', 'advertising']
     
-    # Check resume field
-    resume_tech_score = sum(1 for skill in resume_skills if any(tech in skill for tech in tech_skills))
-    resume_marketing_score = sum(1 for skill in resume_skills if any(marketing in skill for marketing in marketing_skills))
+    # Check resume field, with the same taxonomy the job profile was built with
+    fields = profile.taxonomy.field_keywords
+    resume_tech_score = sum(1 for skill in resume_skills if field_score(skill, fields.get('technical', [])))
+    resume_marketing_score = sum(1 for skill in resume_skills if field_score(skill, fields.get('marketing', [])))
     
     # Check job field
-    job_tech_score = sum(1 for tech in tech_skills if tech in job_text_lower)
-    job_marketing_score = sum(1 for marketing in marketing_skills if marketing in job_text_lower)
+    job_tech_score = profile.tech_score
+    job_marketing_score = profile.marketing_score
     
     # Determine field compatibility
     is_field_mismatch = False
@@ -107,8 +190,8 @@ def analyze_job_match(resume_data: dict, job_description: str) -> dict:
         }
     
     # Calculate skills match with field penalty
-    resume_skill_set = set(skill.lower() for skill in resume_data.get('skills', []))
-    job_skill_set = set(skill.lower() for skill in job_requirements.get('required_skills', []))
+    resume_skill_set = set(resume_skills)
+    job_skill_set = profile.required_skills
     
     if job_skill_set:
         matched_skills = resume_skill_set.intersection(job_skill_set)
@@ -143,6 +226,12 @@ def analyze_job_match(resume_data: dict, job_description: str) -> dict:
         education_match['match_percentage'] * base_weights['education']
     )
     
+    # Relevance mode replaces the fixed-weight blend
+    if scoring == 'bm25':
+        with timed(timings, 'relevance'):
+            relevance_match = score_relevance(resume_data, profile.description, relevance_index)
+        overall_score = relevance_match['match_percentage']
+    
     # Apply additional penalty for field mismatch
     if is_field_mismatch:
         overall_score = min(overall_score, 25)  # Cap at 25% for field mismatch
@@ -164,7 +253,7 @@ def analyze_job_match(resume_data: dict, job_description: str) -> dict:
             "Emphasize your learning ability and project experience"
         ]
     
-    return {
+    results = {
         'overall_score': round(overall_score, 1),
         'skills_match': skills_match,
         'experience_match': experience_match,
@@ -175,6 +264,10 @@ def analyze_job_match(resume_data: dict, job_description: str) -> dict:
         'field_mismatch': is_field_mismatch,
         'analysis_timestamp': datetime.now().isoformat()
     }
+    if scoring == 'bm25':
+        results['scoring'] = scoring
+        results['relevance_match'] = relevance_match
+    return results
 
 def get_realistic_match_summary(score: float, is_mismatch: bool, is_student: bool) -> str:
     """Generate realistic match summary"""
@@ -190,4 +283,5 @@ def get_realistic_match_summary(score: float, is_mismatch: bool, is_student: boo
         return "Low compatibility. Consider developing relevant skills or pursuing different opportunities."
 
 # Export functions
-__all__ = ['analyze_job_match', 'extract_job_requirements']
+__all__ = ['analyze_job_match', 'extract_job_requirements', 'JobProfile', 'compile_job_profile',
+           'field_score', 'SCORING_MODES', 'score_relevance', 'relevance_percentage']
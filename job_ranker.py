@@ -0,0 +1,178 @@
+import numpy as np
+from typing import Dict, List, Any, Optional, Sequence, Union
+from job_matcher import JobProfile, compile_job_profile, field_score, relevance_percentage
+from utils.bm25 import BM25Index
+from utils.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy
+
+# Same weights and fixed component scores as analyze_job_match
+SKILLS_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.3
+EDUCATION_WEIGHT = 0.2
+STUDENT_EXPERIENCE_SCORE = 25
+PROFESSIONAL_EXPERIENCE_SCORE = 75
+EDUCATION_SCORE = 80
+NO_SKILLS_LISTED_SCORE = 50
+MISMATCH_SKILLS_CAP = 20
+MISMATCH_OVERALL_CAP = 25
+
+def skill_index(taxonomy: SkillTaxonomy) -> Dict[str, int]:
+    """Column of each job-description skill (lower-cased) in the indicator matrices"""
+    return {skill.lower(): index for index, skill in enumerate(taxonomy.job_skill_matcher.terms)}
+
+class EncodedResumes:
+    """Parsed resumes encoded as a skill-indicator matrix plus per-resume field flags"""
+
+    def __init__(self, resumes: Sequence[Dict[str, Any]], taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        index = skill_index(self.taxonomy)
+        tech_keywords = self.taxonomy.field_keywords.get('technical', [])
+        marketing_keywords = self.taxonomy.field_keywords.get('marketing', [])
+        count = len(resumes)
+        self.skills = np.zeros((count, len(index)), dtype=np.float64)
+        self.tech_score = np.zeros(count, dtype=np.int32)
+        self.marketing_score = np.zeros(count, dtype=np.int32)
+        self.is_student = np.zeros(count, dtype=bool)
+
+        # Resumes repeat the same skill strings, so classify each string once
+        skill_fields: Dict[str, tuple] = {}
+
+        for row, resume in enumerate(resumes):
+            for skill in (skill.lower() for skill in resume.get('skills', [])):
+                column = index.get(skill)
+                if column is not None:
+                    self.skills[row, column] = 1.0
+
+                fields = skill_fields.get(skill)
+                if fields is None:
+                    fields = (
+                        field_score(skill, tech_keywords) > 0,
+                        field_score(skill, marketing_keywords) > 0
+                    )
+                    skill_fields[skill] = fields
+                self.tech_score[row] += fields[0]
+                self.marketing_score[row] += fields[1]
+
+            self.is_student[row] = any(
+                exp.get('company', '').lower().startswith('no professional') or
+                exp.get('position', '').lower().startswith('student') or
+                exp.get('description', '').lower().count('student') > 0
+                for exp in resume.get('experience', [])
+            )
+
+    def __len__(self) -> int:
+        return self.skills.shape[0]
+
+class EncodedJobs:
+    """Job profiles encoded as a required-skill indicator matrix plus field scores"""
+
+    def __init__(self, jobs: Sequence[Union[str, JobProfile]], taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        # Profiles compiled with another taxonomy version are rebuilt so every column lines up
+        self.profiles = [
+            job if isinstance(job, JobProfile) and job.taxonomy.version == self.taxonomy.version
+            else compile_job_profile(job.description if isinstance(job, JobProfile) else job, self.taxonomy)
+            for job in jobs
+        ]
+        index = skill_index(self.taxonomy)
+        count = len(self.profiles)
+        self.skills = np.zeros((count, len(index)), dtype=np.float64)
+        for row, profile in enumerate(self.profiles):
+            for skill in profile.required_skills:
+                self.skills[row, index[skill]] = 1.0
+        self.required_count = self.skills.sum(axis=1)
+        self.tech_score = np.array([profile.tech_score for profile in self.profiles], dtype=np.int32)
+        self.marketing_score = np.array([profile.marketing_score for profile in self.profiles], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self.skills.shape[0]
+
+def score_matrices(resumes: EncodedResumes, jobs: EncodedJobs) -> Dict[str, np.ndarray]:
+    """Score every (resume, job) pair at once; each matrix is resumes x jobs
+
+    Mirrors analyze_job_match: skills, field-mismatch and overall scores.
+    Both sides must have been encoded with the same skill taxonomy version.
+    """
+    if resumes.taxonomy.version != jobs.taxonomy.version:
+        raise ValueError('resumes and jobs were encoded with different skill taxonomy versions')
+    matched = resumes.skills @ jobs.skills.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skills = np.where(
+            jobs.required_count > 0,
+            matched / jobs.required_count * 100,
+            NO_SKILLS_LISTED_SCORE
+        )
+
+    field_mismatch = (
+        ((resumes.tech_score > 3)[:, None] & (jobs.marketing_score > 2)[None, :]) |
+        ((resumes.marketing_score > 3)[:, None] & (jobs.tech_score > 2)[None, :])
+    )
+    skills = np.where(field_mismatch, np.minimum(skills, MISMATCH_SKILLS_CAP), skills)
+
+    experience = np.where(resumes.is_student, STUDENT_EXPERIENCE_SCORE, PROFESSIONAL_EXPERIENCE_SCORE)
+    overall = (
+        skills * SKILLS_WEIGHT +
+        experience[:, None] * EXPERIENCE_WEIGHT +
+        EDUCATION_SCORE * EDUCATION_WEIGHT
+    )
+    overall = np.where(field_mismatch, np.minimum(overall, MISMATCH_OVERALL_CAP), overall)
+
+    return {
+        'skills': skills,
+        'field_mismatch': field_mismatch,
+        'overall': np.round(overall, 1)
+    }
+
+def rank_resumes(resumes: Union[Sequence[Dict[str, Any]], EncodedResumes],
+                 jobs: Union[Sequence[Union[str, JobProfile]], EncodedJobs],
+                 top_k: int = 10) -> List[List[Dict[str, Any]]]:
+    """Return the top_k resumes for every job, best first
+
+    Already encoded resumes or jobs can be passed to skip re-encoding. Each
+    entry holds the resume's index in resumes and its scores; ties keep
+    input order.
+    """
+    if isinstance(resumes, EncodedResumes):
+        taxonomy = resumes.taxonomy
+    elif isinstance(jobs, EncodedJobs):
+        taxonomy = jobs.taxonomy
+    else:
+        taxonomy = get_skill_taxonomy()
+    encoded_resumes = resumes if isinstance(resumes, EncodedResumes) else EncodedResumes(resumes, taxonomy)
+    encoded_jobs = jobs if isinstance(jobs, EncodedJobs) else EncodedJobs(jobs, taxonomy)
+    scores = score_matrices(encoded_resumes, encoded_jobs)
+    overall = scores['overall']
+
+    rankings = []
+    for column in range(len(encoded_jobs)):
+        order = np.argsort(-overall[:, column], kind='stable')[:top_k]
+        rankings.append([
+            {
+                'resume_index': int(row),
+                'overall_score': float(overall[row, column]),
+                'skills_score': float(scores['skills'][row, column]),
+                'field_mismatch': bool(scores['field_mismatch'][row, column])
+            }
+            for row in order
+        ])
+    return rankings
+
+def rank_by_relevance(index: BM25Index, job: Union[str, JobProfile], top_k: int = 10) -> List[Dict[str, Any]]:
+    """Return the top_k indexed resumes by BM25 relevance to a job description, best first
+
+    Scores the whole corpus in one pass over the description's posting
+    lists; resumes sharing no term with the description are left out.
+    """
+    description = job.description if isinstance(job, JobProfile) else job
+    max_score = index.max_score(description)
+    return [
+        {
+            'resume_id': resume_id,
+            'relevance_score': relevance_percentage(score, max_score),
+            'bm25_score': round(score, 3)
+        }
+        for resume_id, score in index.rank(description, top_k)
+    ]
+
+# Export functions
+__all__ = ['EncodedResumes', 'EncodedJobs', 'score_matrices', 'rank_resumes', 'rank_by_relevance']
@@ -0,0 +1,70 @@
+import re
+
+# Text the API reports when a field could not be extracted, shared by the
+# parser and the modules that read its results
+NAME_PLACEHOLDER = "Name not clearly identified in resume"
+EMAIL_PLACEHOLDER = "Email address not found in resume"
+PHONE_PLACEHOLDER = "Phone number not provided"
+LOCATION_PLACEHOLDER = "Location not specified"
+LINKEDIN_PLACEHOLDER = "LinkedIn profile not provided"
+GITHUB_PLACEHOLDER = "GitHub profile not found"
+WEBSITE_PLACEHOLDER = "Personal website not mentioned"
+SKILLS_PLACEHOLDER = "No technical skills clearly identified - consider adding a skills section"
+
+STUDENT_EXPERIENCE = {
+    'company': 'No professional work experience',
+    'position': 'Student - No work history found',
+    'duration': '0 years',
+    'description': 'This is a student resume with academic projects only. Consider highlighting internships, part-time work, or volunteer experience.'
+}
+EXPERIENCE_COMPANY_PLACEHOLDER = 'Company from resume'
+EXPERIENCE_POSITION_PLACEHOLDER = 'Position from resume'
+EXPERIENCE_DESCRIPTION_PLACEHOLDER = 'Professional work experience extracted from resume'
+
+INSTITUTION_PLACEHOLDER = 'Educational Institution'
+YEAR_PLACEHOLDER = 'Year not specified'
+GPA_PLACEHOLDER = 'Not provided'
+NO_EDUCATION = {
+    'institution': 'Academic education information not clearly identified',
+    'degree': 'Please ensure academic qualifications are clearly formatted in your resume',
+    'year': 'N/A',
+    'gpa': GPA_PLACEHOLDER
+}
+
+# Academic education patterns folded into one named-group alternation; the group
+# names double as the normalized degree kinds the resume store indexes
+EDUCATION_ACADEMIC_PATTERN = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in [
+    ('bachelor_engineering', r'\b(?:b\.?e\.?|bachelor.*?engineering|be\s+computer)\b'),
+    ('bachelor_technology', r'\b(?:b\.?tech|bachelor.*?technology)\b'),
+    ('bachelor_science', r'\b(?:b\.?sc\.?|bachelor.*?science)\b'),
+    ('bachelor_arts', r'\b(?:b\.?a\.?|bachelor.*?arts)\b'),
+    ('master_engineering', r'\b(?:m\.?e\.?|master.*?engineering)\b'),
+    ('master_technology', r'\b(?:m\.?tech|master.*?technology)\b'),
+    ('master_science', r'\b(?:m\.?sc\.?|master.*?science)\b'),
+    ('master_arts', r'\b(?:m\.?a\.?|master.*?arts)\b'),
+    ('mba', r'\b(?:mba|master.*?business)\b'),
+    ('doctorate', r'\b(?:phd|ph\.d\.?|doctorate)\b'),
+    ('field', r'\b(?:computer science|electronics|mechanical|civil)\b'),
+    ('college', r'\b(?:engineering college|institute of technology)\b'),
+    ('institution', r'\b(?:university|college|institute).*?(?:technology|engineering|science)\b'),
+    ('pre_university', r'\b(?:kseeb|cbse|icse|state board).*?(?:12th|plus.*?two|intermediate|puc)\b'),
+    ('secondary', r'\b(?:10th|sslc|matriculation)\b'),
+    ('high_school', r'\b(?:high school|secondary school)\b'),
+]))
+
+TECHNOLOGIES_PLACEHOLDER = "Technologies not specified in resume"
+PROJECT_DESCRIPTION_PLACEHOLDER = "Project description not provided in resume"
+NO_PROJECTS = {
+    'name': 'No projects section found',
+    'description': 'Consider adding academic or personal projects to strengthen your resume and demonstrate your technical abilities',
+    'technologies': ['Project technologies not specified']
+}
+
+
+__all__ = [
+    'NAME_PLACEHOLDER', 'EMAIL_PLACEHOLDER', 'PHONE_PLACEHOLDER', 'LOCATION_PLACEHOLDER', 'LINKEDIN_PLACEHOLDER',
+    'GITHUB_PLACEHOLDER', 'WEBSITE_PLACEHOLDER', 'SKILLS_PLACEHOLDER', 'STUDENT_EXPERIENCE',
+    'EXPERIENCE_COMPANY_PLACEHOLDER', 'EXPERIENCE_POSITION_PLACEHOLDER', 'EXPERIENCE_DESCRIPTION_PLACEHOLDER',
+    'INSTITUTION_PLACEHOLDER', 'YEAR_PLACEHOLDER', 'GPA_PLACEHOLDER', 'NO_EDUCATION', 'EDUCATION_ACADEMIC_PATTERN',
+    'TECHNOLOGIES_PLACEHOLDER', 'PROJECT_DESCRIPTION_PLACEHOLDER', 'NO_PROJECTS'
+]
@@ -1,58 +1,547 @@
 import os
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from io import BytesIO
 import fitz  # PyMuPDF for PDF text extraction
 import docx  # python-docx for DOCX files
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime
+from resume_models import (
+    NAME_PLACEHOLDER, EMAIL_PLACEHOLDER, PHONE_PLACEHOLDER, LOCATION_PLACEHOLDER, LINKEDIN_PLACEHOLDER,
+    GITHUB_PLACEHOLDER, WEBSITE_PLACEHOLDER, SKILLS_PLACEHOLDER, STUDENT_EXPERIENCE,
+    EXPERIENCE_COMPANY_PLACEHOLDER, EXPERIENCE_POSITION_PLACEHOLDER, EXPERIENCE_DESCRIPTION_PLACEHOLDER,
+    INSTITUTION_PLACEHOLDER, YEAR_PLACEHOLDER, GPA_PLACEHOLDER, NO_EDUCATION, EDUCATION_ACADEMIC_PATTERN,
+    TECHNOLOGIES_PLACEHOLDER, PROJECT_DESCRIPTION_PLACEHOLDER, NO_PROJECTS
+)
+from utils.metrics import timed
+from utils.resume_document import ResumeDocument
+from utils.sandbox import ParseLimitError, SandboxPool
+from utils.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy
 
-# Load spaCy language model globally with enhanced error handling
-try:
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
-    USE_SPACY = True
-    print("✅ spaCy loaded successfully")
-except ImportError:
-    print("⚠️  spaCy not installed, using basic text processing")
-    spacy = None
-    nlp = None
-    USE_SPACY = False
-except OSError:
-    print("⚠️  spaCy model 'en_core_web_sm' not found. Using basic text processing")
-    print("   To install: python -m spacy download en_core_web_sm")
-    spacy = None
-    nlp = None
-    USE_SPACY = False
-except Exception as e:
-    print(f"⚠️  spaCy initialization failed: {str(e)}. Using basic text processing")
-    spacy = None
-    nlp = None
-    USE_SPACY = False
-
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file using PyMuPDF"""
+# Bump whenever parse output changes so cached results from older parsers are ignored
+PARSER_VERSION = '2.4'
+
+# spaCy is loaded lazily on first use, with only the components NER needs.
+# Set USE_SPACY=0 to skip it entirely and use basic text processing.
+SPACY_MODEL = os.environ.get('SPACY_MODEL', 'en_core_web_sm')
+SPACY_EXCLUDE = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+USE_SPACY = os.environ.get('USE_SPACY', '1') != '0'
+spacy = None
+nlp = None
+nlp_load_seconds: Optional[float] = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first call; None if unavailable"""
+    global spacy, nlp, USE_SPACY, nlp_load_seconds, _nlp_loaded
+    if _nlp_loaded or not USE_SPACY:
+        return nlp
+    
+    with _nlp_lock:
+        if _nlp_loaded:
+            return nlp
+        
+        started = time.perf_counter()
+        try:
+            import spacy as spacy_module
+            nlp = spacy_module.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+            spacy = spacy_module
+            nlp_load_seconds = time.perf_counter() - started
+            print(f"✅ spaCy loaded successfully in {nlp_load_seconds:.2f}s (components: {', '.join(nlp.pipe_names)})")
+        except ImportError:
+            print("⚠️  spaCy not installed, using basic text processing")
+            USE_SPACY = False
+        except OSError:
+            print(f"⚠️  spaCy model '{SPACY_MODEL}' not found. Using basic text processing")
+            print(f"   To install: python -m spacy download {SPACY_MODEL}")
+            USE_SPACY = False
+        except Exception as e:
+            print(f"⚠️  spaCy initialization failed: {str(e)}. Using basic text processing")
+            USE_SPACY = False
+        
+        if not USE_SPACY:
+            nlp = None
+        _nlp_loaded = True
+        return nlp
+
+def get_nlp_status() -> Dict[str, Any]:
+    """Report whether spaCy is enabled, loaded, and how long loading took"""
+    return {
+        'enabled': USE_SPACY,
+        'loaded': nlp is not None,
+        'model': SPACY_MODEL,
+        'components': list(nlp.pipe_names) if nlp is not None else [],
+        'load_seconds': round(nlp_load_seconds, 3) if nlp_load_seconds is not None else None
+    }
+
+# Caps on how much of an upload is read; 0 disables a cap
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', 30))
+MAX_TEXT_CHARS = int(os.environ.get('MAX_TEXT_CHARS', 200000))
+
+# Opt-in supervised subprocess for parsing: a wall-clock timeout and an address-space cap per document
+PARSE_SANDBOX = os.environ.get('PARSE_SANDBOX', '0') == '1'
+PARSE_TIMEOUT = float(os.environ.get('PARSE_TIMEOUT', 30))
+PARSE_MEMORY_LIMIT_MB = int(os.environ.get('PARSE_MEMORY_LIMIT_MB', 1024))
+PARSE_SANDBOX_WORKERS = int(os.environ.get('PARSE_SANDBOX_WORKERS', 1))
+
+# Opt-in parallel PDF extraction for long documents; 0 or 1 workers keeps the serial path.
+# benchmarks/pdf_parallel.py measures where the parallel path starts to win. A threshold
+# above the page cap is lowered to the cap, or capped documents could never qualify.
+PDF_PARALLEL_WORKERS = int(os.environ.get('PDF_PARALLEL_WORKERS', 0))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', 64))
+
+# Upper bound on the header text searched for the candidate's name with NER
+NER_HEADER_CHARS = 1000
+# Lines at the top of a resume, and just above its first contact line, that make up the header
+HEADER_TOP_LINES = 5
+HEADER_CONTACT_LINES = 3
+# Default number of headers spaCy processes per batch in parse_resume_texts
+NER_BATCH_SIZE = int(os.environ.get('NER_BATCH_SIZE', 64))
+
+# Skills, synonyms and field keywords come from one taxonomy file, compiled to an
+# artifact (python -m utils.skill_taxonomy) and hot-reloaded by utils.skill_taxonomy
+def current_parser_version(taxonomy_version: Optional[str] = None) -> str:
+    """Parser and skill taxonomy versions together, for keying cached parse results
+    
+    Pass the taxonomy_version a parse result recorded to key it by the
+    taxonomy it was parsed with rather than the one loaded here.
+    """
+    return f'{PARSER_VERSION}+taxonomy.{taxonomy_version or get_skill_taxonomy().version}'
+
+# Words that mark a line as the candidate's location (and never part of a name)
+LOCATION_KEYWORDS = ['bengaluru', 'bangalore', 'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata', 'karnataka', 'maharashtra', 'india']
+
+# Contact patterns as (field, priority, pattern), matched against lower-cased
+# text; a field takes the first match of its lowest-numbered priority that
+# matches anywhere. Every pattern starts with a literal character so the
+# scanner can skip straight to the characters some pattern starts with;
+# patterns that can start several ways are listed once per start.
+CONTACT_PATTERNS = [
+    ('email', 0, r'@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),       # Local part is found from the '@'
+    # Indian phone numbers
+    ('phone', 0, r'\+91[\s-]?[6-9]\d{9}'),
+    ('phone', 1, r'91[\s-]?[6-9]\d{9}'),
+    *[('phone', 2, digit + r'\d{9}') for digit in '6789'],
+    ('linkedin', 0, r'https?://(?:www\.)?linkedin\.com/in/[\w-]+/?'),      # Full URL
+    ('linkedin', 1, r'linkedin\.com/in/[\w-]+/?'),                         # Without protocol
+    ('linkedin', 2, r'www\.linkedin\.com/in/[\w-]+/?'),                    # With www
+    ('linkedin', 3, r'linkedin:\s*(?P<value>[^\s\n]+)'),                   # "LinkedIn: username"
+    ('linkedin', 4, r'linkedin\s*-\s*(?P<value>[^\s\n]+)'),                # "LinkedIn - username"
+    ('linkedin', 5, r'linkedin\s*:\s*linkedin\.com/in/(?P<value>[\w-]+)'), # "LinkedIn: linkedin.com/in/username"
+    ('github', 0, r'https?://(?:www\.)?github\.com/[\w-]+/?'),             # Full URL
+    ('github', 1, r'github\.com/[\w-]+/?'),                                # Without protocol
+    ('github', 2, r'www\.github\.com/[\w-]+/?'),                           # With www
+    ('github', 3, r'github:\s*(?P<value>[^\s\n]+)'),                       # "GitHub: username"
+    ('github', 4, r'github\s*-\s*(?P<value>[^\s\n]+)'),                    # "GitHub - username"
+    ('github', 5, r'github\s*:\s*github\.com/(?P<value>[\w-]+)'),          # "GitHub: github.com/username"
+    ('website', 0, r'www\.[\w.-]+\.[a-z]{2,}'),
+    ('website', 0, r'https?://[\w.-]+\.[a-z]{2,}'),
+    *[('address', 0, keyword) for keyword in LOCATION_KEYWORDS],
+]
+CONTACT_FIELDS = len({field for field, _, _ in CONTACT_PATTERNS})
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_LOCAL_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-')
+
+def _leading_literal(pattern: str) -> Optional[Tuple[str, str]]:
+    """Split a pattern into its leading literal character and the rest, or None if it has none"""
+    if pattern[:1] == '\\' and not pattern[1:2].isalnum():
+        char, rest = pattern[1], pattern[2:]
+    elif pattern[:1] and pattern[0] not in '\\[(.^$|?*+{':
+        char, rest = pattern[0], pattern[1:]
+    else:
+        return None
+    # An optional character is not a guaranteed start
+    if rest[:1] in ('?', '*', '{'):
+        return None
+    return char, rest
+
+def _build_contact_scanner(patterns: List[Tuple[str, int, str]]) -> Tuple[str, Dict[str, List[Tuple[str, str, int, str]]]]:
+    """Fold contact patterns into one regex with a branch per starting character
+    
+    Each branch consumes its character and then tries every pattern starting
+    with it as a lookahead, so overlapping matches (a phone number inside an
+    email, a LinkedIn URL that is also a website) are all seen in one walk.
+    Returns the regex source and, per starting character, the
+    (group, field, priority, value group) of the patterns tried there.
+    """
+    by_start = {}
+    for index, (field, priority, pattern) in enumerate(patterns):
+        char, rest = _leading_literal(pattern)
+        by_start.setdefault(char, []).append((f'{field}{index}', field, priority, rest))
+    
+    branches = []
+    groups_by_start = {}
+    for char, entries in by_start.items():
+        groups = []
+        lookaheads = []
+        for group, field, priority, rest in entries:
+            value_group = f'{group}_value' if '(?P<value>' in rest else group
+            groups.append((group, field, priority, value_group))
+            rest = rest.replace('(?P<value>', f'(?P<{value_group}>')
+            lookaheads.append(f'(?:(?=(?P<{group}>{rest})))?')
+        groups_by_start[char] = groups
+        
+        # Cheap check of the second character before trying the lookaheads
+        seconds = [_leading_literal(rest) for *_, rest in entries]
+        prefilter = ''
+        if all(seconds):
+            prefilter = '(?=[' + ''.join(sorted({re.escape(second[0]) for second in seconds})) + '])'
+        
+        any_matched = '(?!)'
+        for group, *_ in reversed(groups):
+            any_matched = f'(?({group})|{any_matched})'
+        branches.append(re.escape(char) + prefilter + ''.join(lookaheads) + any_matched)
+    
+    return '|'.join(branches), groups_by_start
+
+_contact_source, CONTACT_GROUPS = _build_contact_scanner(CONTACT_PATTERNS)
+CONTACT_SCANNER = re.compile(_contact_source)
+# For the rare text whose lower-cased form changes length, so positions would not line up
+CONTACT_SCANNER_IGNORECASE = re.compile(_contact_source, re.IGNORECASE)
+
+# Header lines holding contact details (email, 10-digit phone, profile links)
+CONTACT_HINT_PATTERN = re.compile(r'@|linkedin|github|(?:\d[\s-]?){9}\d')
+
+# Capitalized words that put a line out of the running as the candidate's name
+NOT_NAME_WORDS = {
+    'resume', 'curriculum', 'vitae', 'cv', 'bio', 'data', 'contact', 'details', 'information',
+    'summary', 'objective', 'profile', 'about', 'career', 'education', 'experience', 'skills',
+    'projects', 'certifications', 'achievements', 'internships', 'professional', 'technical', 'work',
+    'software', 'engineer', 'engineering', 'developer', 'scientist', 'analyst', 'manager',
+    'consultant', 'designer', 'architect', 'intern', 'student', 'graduate', 'fresher', 'senior',
+    'junior', 'lead', 'full', 'stack', 'backend', 'frontend', 'web', 'machine', 'learning',
+    'university', 'college', 'institute', 'school', 'street', 'road', 'nagar',
+    'cover', 'letter', 'product', 'owner', 'marketing', 'sales', 'specialist', 'executive', 'officer',
+    'director', 'coordinator', 'assistant', 'associate', 'administrator', 'representative', 'operations',
+    'city', 'state'
+}
+
+# Separators between a name and a title or location on the same line (e.g. 'Jane Doe | Engineer')
+NAME_SEPARATOR_PATTERN = re.compile(r'\s*(?:[|•·,]|\s[-–—]\s)\s*')
+
+# Summary/objective lines are never education entries
+EDUCATION_SUMMARY_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in [
+    'results-driven', 'seeking', 'objective', 'summary', 'profile',
+    'committed to', 'specializing in', 'passionate about', 'looking for',
+    'dedicated', 'motivated', 'experienced in', 'skilled in'
+]))
+
+# Keywords to EXCLUDE (certifications, training, etc.)
+EDUCATION_EXCLUDE_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in [
+    'certification', 'certificate', 'certified', 'training', 'course',
+    'workshop', 'seminar', 'bootcamp', 'online course', 'mooc',
+    'udemy', 'coursera', 'edx', 'khan academy', 'pluralsight',
+    'aws certified', 'google certified', 'microsoft certified',
+    'oracle certified', 'cisco certified', 'comptia', 'pmp',
+    'scrum master', 'agile', 'itil', 'six sigma', 'lean'
+]))
+
+EDUCATION_SECTION_END_PATTERN = re.compile(r'project|experience|skill|certification|training')
+EDUCATION_INSTITUTION_PATTERN = re.compile(
+    r'college|university|institute|school|iit|nit|technology|engineering|science'
+)
+EDUCATION_DEGREE_PATTERN = re.compile(
+    r'\b(?:engineering|science|arts|technology|bachelor|master|phd|school|college|university)\b'
+)
+YEAR_PATTERN = re.compile(r'\b(20\d{2}|19\d{2})\b')
+
+# How many lines (including the degree line) are searched for institution context
+EDUCATION_CONTEXT_LINES = 5
+
+def _limit(value: Optional[int], default: int) -> Optional[int]:
+    """Resolve a page/char cap: None means the module default, 0 or less means unlimited"""
+    value = default if value is None else value
+    return value if value and value > 0 else None
+
+def _open_pdf(source: Union[str, bytes]):
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype='pdf')
+    return fitz.open(source)
+
+def _iter_doc_pages(doc, max_pages: Optional[int]) -> Iterator[str]:
+    for page_number, page in enumerate(doc):
+        if max_pages is not None and page_number >= max_pages:
+            break
+        yield page.get_text()
+
+# Process pool for parallel page extraction, created on first use
+_pdf_executor = None
+_pdf_executor_workers = 0
+_pdf_executor_pid = None
+_pdf_executor_lock = threading.Lock()
+
+def _get_pdf_executor(workers: int) -> ProcessPoolExecutor:
+    global _pdf_executor, _pdf_executor_workers, _pdf_executor_pid
+    # Threaded servers may reach this concurrently; only one of them creates the pool
+    with _pdf_executor_lock:
+        if _pdf_executor is not None and _pdf_executor_pid != os.getpid():
+            # Inherited through fork: its management thread only exists in the parent, and
+            # shutting it down here would signal the parent's pool, so just drop it
+            _pdf_executor = None
+        if _pdf_executor is None or _pdf_executor_workers != workers:
+            if _pdf_executor is not None:
+                _pdf_executor.shutdown(wait=False)
+            _pdf_executor = ProcessPoolExecutor(max_workers=workers)
+            _pdf_executor_workers = workers
+            _pdf_executor_pid = os.getpid()
+            # Inside a multiprocessing worker, exit joins child processes before the pool's own
+            # shutdown hook runs; shut the pool down first (ahead of its queues' finalizers, which
+            # use priority 10) so that worker can exit
+            Finalize(_pdf_executor, _pdf_executor.shutdown, exitpriority=100)
+        return _pdf_executor
+
+def _extract_page_range(source: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """Extract pages [start, stop) with a document handle private to this worker"""
+    with _open_pdf(source) as doc:
+        return [doc[page_number].get_text() for page_number in range(start, stop)]
+
+def _iter_pages_parallel(source: Union[str, bytes], page_total: int, workers: int, futures: List) -> Iterator[str]:
+    """Split the page range across the pool and yield page texts back in order"""
+    chunk_size = -(-page_total // workers)
+    executor = _get_pdf_executor(workers)
+    for start in range(0, page_total, chunk_size):
+        futures.append(executor.submit(_extract_page_range, source, start, min(start + chunk_size, page_total)))
+    for future in futures:
+        yield from future.result()
+
+def iter_pdf_pages(source: Union[str, bytes], max_pages: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each PDF page in order, stopping after max_pages"""
+    with _open_pdf(source) as doc:
+        yield from _iter_doc_pages(doc, max_pages)
+
+def extract_pdf_text(source: Union[str, bytes], max_pages: Optional[int] = None,
+                     max_chars: Optional[int] = None,
+                     parallel_workers: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """Extract PDF text page by page, stopping early once the page or character cap is hit
+    
+    Documents with at least PDF_PARALLEL_MIN_PAGES pages to read (or the
+    page cap, if lower) are split across parallel_workers processes
+    (default PDF_PARALLEL_WORKERS) when that is more than one. Returns the text and extraction info:
+    page_count, pages_read and truncated.
+    """
+    max_pages = _limit(max_pages, PDF_MAX_PAGES)
+    max_chars = _limit(max_chars, MAX_TEXT_CHARS)
+    workers = PDF_PARALLEL_WORKERS if parallel_workers is None else parallel_workers
+    min_parallel_pages = min(PDF_PARALLEL_MIN_PAGES, max_pages) if max_pages is not None else PDF_PARALLEL_MIN_PAGES
+    futures = []
     try:
-        doc = fitz.open(file_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text
+        with _open_pdf(source) as doc:
+            page_count = doc.page_count
+            page_total = min(page_count, max_pages) if max_pages is not None else page_count
+            if workers > 1 and page_total >= min_parallel_pages:
+                page_texts = _iter_pages_parallel(source, page_total, workers, futures)
+            else:
+                page_texts = _iter_doc_pages(doc, max_pages)
+            
+            pages = []
+            total_chars = 0
+            truncated = max_pages is not None and page_count > max_pages
+            for page_text in page_texts:
+                if max_chars is not None and total_chars + len(page_text) > max_chars:
+                    pages.append(page_text[:max_chars - total_chars])
+                    truncated = True
+                    break
+                pages.append(page_text)
+                total_chars += len(page_text)
+        
+        return "".join(pages), {
+            'page_count': page_count,
+            'pages_read': len(pages),
+            'truncated': truncated
+        }
+    except MemoryError:
+        # Left unwrapped so the sandbox can tell a memory-limit hit from a bad file
+        raise
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {str(e)}")
+    finally:
+        # Drop page ranges that are no longer needed after an early stop
+        for future in futures:
+            future.cancel()
 
-def extract_text_from_docx(file_path: str) -> str:
-    """Extract text from DOCX file using python-docx"""
+def extract_text_from_pdf(source: Union[str, bytes], max_pages: Optional[int] = None,
+                          max_chars: Optional[int] = None) -> str:
+    """Extract text from a PDF file path or in-memory PDF bytes using PyMuPDF"""
+    return extract_pdf_text(source, max_pages, max_chars)[0]
+
+def extract_docx_text(source: Union[str, bytes], max_chars: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """Extract DOCX text paragraph by paragraph, stopping early at the character cap"""
+    max_chars = _limit(max_chars, MAX_TEXT_CHARS)
     try:
-        doc = docx.Document(file_path)
-        text = ""
+        doc = docx.Document(BytesIO(source) if isinstance(source, (bytes, bytearray)) else source)
+        paragraphs = []
+        total_chars = 0
+        truncated = False
         for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+            paragraph_text = paragraph.text + "\n"
+            if max_chars is not None and total_chars + len(paragraph_text) > max_chars:
+                paragraphs.append(paragraph_text[:max_chars - total_chars])
+                truncated = True
+                break
+            paragraphs.append(paragraph_text)
+            total_chars += len(paragraph_text)
+        return "".join(paragraphs), {'truncated': truncated}
+    except MemoryError:
+        raise
     except Exception as e:
         raise Exception(f"Error extracting text from DOCX: {str(e)}")
 
-def extract_personal_info(text: str) -> Dict[str, str]:
-    """Extract personal information with enhanced clickable link detection"""
+def extract_text_from_docx(source: Union[str, bytes], max_chars: Optional[int] = None) -> str:
+    """Extract text from a DOCX file path or in-memory DOCX bytes using python-docx"""
+    return extract_docx_text(source, max_chars)[0]
+
+def _is_name_line(line: str) -> bool:
+    """Whether a line is shaped like a person's name: 2-4 capitalized words of letters"""
+    words = line.split()
+    if not 2 <= len(words) <= 4 or len(line) > 40:
+        return False
+    for word in words:
+        if not word[0].isupper() or not all(char.isalpha() or char in ".'-" for char in word):
+            return False
+        if word.lower().strip(".'-") in NOT_NAME_WORDS or word.lower() in LOCATION_KEYWORDS:
+            return False
+    return True
+
+def _name_candidate(line: str) -> Optional[str]:
+    """The line, or its first part if separators split it (e.g. 'Jane Doe | Engineer'), when name-shaped"""
+    candidate = NAME_SEPARATOR_PATTERN.split(line, 1)[0]
+    return candidate if _is_name_line(candidate) else None
+
+def _is_name_position(index: int, contact_line: int) -> bool:
+    """Whether a line sits where names do: just above the contact details, on the first line,
+    or a few lines above contact details near the top"""
+    return (index == contact_line - 1 or index == 0 or
+            (index < HEADER_TOP_LINES and 0 < contact_line - index <= HEADER_CONTACT_LINES))
+
+def detect_name_header(source: Union[str, ResumeDocument]) -> Tuple[Optional[str], str]:
+    """Find the part of a resume that holds the candidate's name
+    
+    Every name-shaped line (or 'Name | Title' line) among the top lines and
+    the line just above the first contact line is a candidate; the first
+    line has no precedence over the line above the contact details. Returns
+    (name, '') only when exactly one candidate is in a name position, so NER
+    can be skipped. Otherwise returns (None, header) where header is the top
+    lines plus the lines just above the first contact line (contact blocks
+    are sometimes at the bottom of a PDF), for NER to search.
+    """
+    document = ResumeDocument.coerce(source)
+    lines = document.lines
+    contact_line = next(
+        (index for index, line_lower in enumerate(document.lines_lower) if CONTACT_HINT_PATTERN.search(line_lower)), -1
+    )
+    
+    candidate_lines = set(range(min(HEADER_TOP_LINES, len(lines))))
+    if contact_line > 0:
+        candidate_lines.add(contact_line - 1)
+    candidates = set()
+    for index in candidate_lines:
+        name = _name_candidate(lines[index]) if _is_name_position(index, contact_line) else None
+        if name:
+            candidates.add(name)
+    if len(candidates) == 1:
+        return candidates.pop(), ''
+    
+    # Top lines up to the contact details, plus the lines above a contact block further down
+    top_end = contact_line + 1 if 0 < contact_line < HEADER_TOP_LINES else HEADER_TOP_LINES
+    header_lines = lines[:top_end]
+    if contact_line >= top_end:
+        header_lines += lines[max(contact_line - HEADER_CONTACT_LINES, top_end):contact_line + 1]
+    return None, '\n'.join(header_lines)[:NER_HEADER_CHARS]
+
+def get_ner_header(source: Union[str, ResumeDocument]) -> Optional[str]:
+    """Return the header text of a resume to run through spaCy NER, or None if the name was found without it"""
+    name, header = detect_name_header(source)
+    return None if name else header
+
+def _email_at(text: str, at: int) -> Optional[str]:
+    """Return the email whose '@' is at position at, walking back over its local part"""
+    start = at
+    while start and text[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+    for position in range(start, at):
+        match = EMAIL_PATTERN.match(text, position)
+        if match:
+            return match.group()
+    return None
+
+def _scan_contacts(text: str, scan_text: str, scanner: 're.Pattern',
+                   fields: Optional[Set[str]] = None) -> Dict[str, Tuple[int, int, str]]:
+    """Run a contact scanner over scan_text, whose positions line up with text
+    
+    Returns (priority, position, matched text) of the best match per field.
+    """
+    field_count = len(fields) if fields is not None else CONTACT_FIELDS
+    best = {}
+    website_from = 0
+    for match in scanner.finditer(scan_text):
+        position = match.start()
+        for group, field, priority, value_group in CONTACT_GROUPS.get(scan_text[position].lower(), ()):
+            if match.start(group) < 0 or (field in best and best[field][0] <= priority):
+                continue
+            if fields is not None and field not in fields:
+                continue
+            if field == 'email':
+                value = _email_at(text, position)
+                if value is None:
+                    continue
+            elif field == 'website':
+                if position < website_from:
+                    continue
+                website_from = match.end(group)
+                value = scan_text[position:website_from].lower()
+                if 'linkedin' in value or 'github' in value:
+                    continue
+            else:
+                # Spans line up with the original text, which keeps the case
+                start = position if value_group == group else match.start(value_group)
+                value = text[start:match.end(value_group)]
+            best[field] = (priority, position, value)
+        
+        # Nothing later can beat a first-priority match for every field
+        if len(best) == field_count and not any(entry[0] for entry in best.values()):
+            break
+    
+    return best
+
+def scan_contact_info(document: ResumeDocument) -> Dict[str, str]:
+    """Walk the text once and return the best match per contact field (the whole line for 'address')
+    
+    Gives the same result as trying each field's patterns in priority order
+    with re.search. Websites are taken like findall: the first
+    non-overlapping candidate that is not a LinkedIn or GitHub link.
+    """
+    text = document.text
+    if len(document.text_lower) == len(text):
+        best = _scan_contacts(text, document.text_lower, CONTACT_SCANNER)
+        if 'address' in best:
+            best['address'] = (0, 0, document.lines[document.line_index_at(best['address'][1])])
+    else:
+        # Lower-casing changed the length (e.g. 'İ'), so positions no longer line up:
+        # match email and links case-insensitively on the original text, and the
+        # website and location on the lower-cased text
+        best = _scan_contacts(text, text, CONTACT_SCANNER_IGNORECASE, {'email', 'phone', 'linkedin', 'github'})
+        lower_best = _scan_contacts(document.text_lower, document.text_lower, CONTACT_SCANNER, {'website', 'address'})
+        if 'website' in lower_best:
+            best['website'] = lower_best['website']
+        if 'address' in lower_best:
+            line_number = document.text_lower.count('\n', 0, lower_best['address'][1])
+            best['address'] = (0, 0, text.split('\n')[line_number].strip())
+    
+    return {field: value for field, (_, _, value) in best.items()}
+
+def extract_personal_info(source: Union[str, ResumeDocument], ner_doc: Optional[Any] = None) -> Dict[str, str]:
+    """Extract personal information with enhanced clickable link detection
+    
+    ner_doc may be a spaCy Doc already computed for get_ner_header(source),
+    e.g. by parse_resume_texts running many headers through nlp.pipe. NER
+    is skipped when detect_name_header finds the name line on its own.
+    """
+    document = ResumeDocument.coerce(source)
     personal_info = {
         "name": "",
         "email": "",
@@ -63,13 +552,16 @@ def extract_personal_info(text: str) -> Dict[str, str]:
         "website": ""
     }
     
-    lines = text.split('\n')
-    clean_lines = [line.strip() for line in lines if line.strip()]
+    clean_lines = document.lines
     
     # Enhanced name extraction with spaCy NLP or fallback
-    if USE_SPACY and nlp:
-        # Use spaCy for intelligent name extraction
-        doc = nlp(text[:1000])
+    nlp_model = get_nlp() if ner_doc is None else None
+    name_line, header = detect_name_header(document) if nlp_model else (None, '')
+    if name_line:
+        personal_info['name'] = name_line
+    elif ner_doc is not None or nlp_model:
+        # Use spaCy for intelligent name extraction on the header region only
+        doc = ner_doc if ner_doc is not None else nlp_model(header)
         persons = []
         locations = set()
         
@@ -82,218 +574,102 @@ def extract_personal_info(text: str) -> Dict[str, str]:
                 name_candidate = ent.text.strip()
                 if (name_candidate.lower() not in locations and 
                     len(name_candidate.split()) >= 1 and
-                    not any(loc in name_candidate.lower() for loc in ['bengaluru', 'bangalore', 'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata', 'karnataka', 'maharashtra', 'india'])):
+                    not any(loc in name_candidate.lower() for loc in LOCATION_KEYWORDS)):
                     persons.append(name_candidate)
         
         if persons:
             personal_info['name'] = persons[0]
         else:
-            personal_info['name'] = "Name not clearly identified in resume"
+            personal_info['name'] = NAME_PLACEHOLDER
     else:
         # Fallback name extraction
-        for line in clean_lines[:5]:
-            if any(keyword in line.lower() for keyword in ['email', 'phone', 'mobile', '@', 'linkedin', 'github', 'www']):
+        for line, line_lower in zip(clean_lines[:5], document.lines_lower):
+            if any(keyword in line_lower for keyword in ['email', 'phone', 'mobile', '@', 'linkedin', 'github', 'www']):
                 continue
             if re.search(r'[0-9]', line):
                 continue
             if len(line.split()) >= 2 and len(line.split()) <= 4:
                 name_parts = []
                 for part in line.split():
-                    if part.lower() not in ['bengaluru', 'bangalore', 'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata', 'karnataka', 'maharashtra', 'india']:
+                    if part.lower() not in LOCATION_KEYWORDS:
                         name_parts.append(part)
                 if len(name_parts) >= 1:
                     personal_info["name"] = " ".join(name_parts)
                     break
         
         if not personal_info["name"]:
-            for line in clean_lines[:3]:
-                line = line.strip()
+            for line, line_lower in zip(clean_lines[:3], document.lines_lower):
                 if (len(line) > 2 and len(line) < 50 and 
                     not any(char.isdigit() for char in line) and
-                    not '@' in line and not 'phone' in line.lower()):
+                    not '@' in line and not 'phone' in line_lower):
                     personal_info["name"] = line
                     break
             else:
-                personal_info["name"] = "Name not clearly identified in resume"
+                personal_info["name"] = NAME_PLACEHOLDER
+    
+    # Email, phone, location and links in one pass over the text
+    contacts = scan_contact_info(document)
     
-    # Extract email
-    email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    emails = email_pattern.findall(text)
-    if emails:
-        personal_info["email"] = emails[0]
+    if 'email' in contacts:
+        personal_info["email"] = contacts['email']
     else:
-        personal_info["email"] = "Email address not found in resume"
+        personal_info["email"] = EMAIL_PLACEHOLDER
     
     # Enhanced Indian phone number extraction
-    phone_patterns = [
-        r'\+91[\s-]?[6-9]\d{9}',
-        r'91[\s-]?[6-9]\d{9}',
-        r'[6-9]\d{9}'
-    ]
-    
-    phone_found = False
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            phone = matches[0]
-            phone = re.sub(r'[\s-]', '', phone)
-            if not phone.startswith('+91'):
-                if phone.startswith('91'):
-                    phone = '+' + phone
-                else:
-                    phone = '+91-' + phone
-            else:
-                phone = phone.replace('+91', '+91-')
-            personal_info["phone"] = phone
-            phone_found = True
-            break
-    
-    if not phone_found:
-        personal_info["phone"] = "Phone number not provided"
-    
-    # Extract address/location
-    location_keywords = ['bengaluru', 'bangalore', 'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata', 'karnataka', 'maharashtra', 'india']
-    for line in clean_lines:
-        for keyword in location_keywords:
-            if keyword in line.lower():
-                personal_info["address"] = line
-                break
-        if personal_info["address"]:
-            break
-    
-    if not personal_info["address"]:
-        personal_info["address"] = "Location not specified"
-    
-    # ENHANCED LinkedIn Detection - Multiple Patterns
-    linkedin_patterns = [
-        r'https?://(?:www\.)?linkedin\.com/in/[\w-]+/?',      # Full URL
-        r'linkedin\.com/in/[\w-]+/?',                         # Without protocol
-        r'www\.linkedin\.com/in/[\w-]+/?',                    # With www
-        r'(?:linkedin|LinkedIn):\s*([^\s\n]+)',               # "LinkedIn: username"
-        r'(?:linkedin|LinkedIn)\s*-\s*([^\s\n]+)',            # "LinkedIn - username"
-        r'(?:linkedin|LinkedIn)\s*:\s*linkedin\.com/in/([\w-]+)', # "LinkedIn: linkedin.com/in/username"
-    ]
-    
-    linkedin_found = False
-    for pattern in linkedin_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            match = matches[0]
-            # Clean up the match
-            if match.startswith('http'):
-                personal_info["linkedin"] = match
-            elif match.startswith('linkedin.com') or match.startswith('www.linkedin'):
-                personal_info["linkedin"] = match
+    if 'phone' in contacts:
+        phone = re.sub(r'[\s-]', '', contacts['phone'])
+        if not phone.startswith('+91'):
+            if phone.startswith('91'):
+                phone = '+' + phone
             else:
-                # It's just a username, construct the full URL
-                clean_username = match.strip('/')
-                personal_info["linkedin"] = f"linkedin.com/in/{clean_username}"
-            linkedin_found = True
-            break
-    
-    if not linkedin_found:
-        personal_info["linkedin"] = "LinkedIn profile not provided"
-    
-    # ENHANCED GitHub Detection - Multiple Patterns
-    github_patterns = [
-        r'https?://(?:www\.)?github\.com/[\w-]+/?',           # Full URL
-        r'github\.com/[\w-]+/?',                              # Without protocol
-        r'www\.github\.com/[\w-]+/?',                         # With www
-        r'(?:github|GitHub):\s*([^\s\n]+)',                   # "GitHub: username"
-        r'(?:github|GitHub)\s*-\s*([^\s\n]+)',                # "GitHub - username"
-        r'(?:github|GitHub)\s*:\s*github\.com/([\w-]+)',      # "GitHub: github.com/username"
-    ]
+                phone = '+91-' + phone
+        else:
+            phone = phone.replace('+91', '+91-')
+        personal_info["phone"] = phone
+    else:
+        personal_info["phone"] = PHONE_PLACEHOLDER
     
-    github_found = False
-    for pattern in github_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            match = matches[0]
-            # Clean up the match
-            if match.startswith('http'):
-                personal_info["github"] = match
-            elif match.startswith('github.com') or match.startswith('www.github'):
-                personal_info["github"] = match
-            else:
-                # It's just a username, construct the full URL
-                clean_username = match.strip('/')
-                personal_info["github"] = f"github.com/{clean_username}"
-            github_found = True
-            break
+    # Extract address/location: the line holding the first location keyword
+    if 'address' in contacts:
+        personal_info["address"] = contacts['address']
+    else:
+        personal_info["address"] = LOCATION_PLACEHOLDER
     
-    if not github_found:
-        personal_info["github"] = "GitHub profile not found"
+    # ENHANCED LinkedIn and GitHub Detection - bare usernames become profile URLs
+    for field, domain, placeholder in (('linkedin', 'linkedin.com/in', LINKEDIN_PLACEHOLDER),
+                                       ('github', 'github.com', GITHUB_PLACEHOLDER)):
+        if field not in contacts:
+            personal_info[field] = placeholder
+            continue
+        match = contacts[field]
+        if match.startswith('http') or match.startswith(domain.split('/')[0]) or match.startswith(f'www.{field}'):
+            personal_info[field] = match
+        else:
+            # It's just a username, construct the full URL
+            personal_info[field] = f"{domain}/{match.strip('/')}"
     
-    # Extract website
-    website_pattern = re.compile(r'www\.[\w.-]+\.[a-z]{2,}|https?://[\w.-]+\.[a-z]{2,}')
-    website_matches = website_pattern.findall(text.lower())
-    for match in website_matches:
-        if 'linkedin' not in match and 'github' not in match:
-            personal_info["website"] = match
-            break
+    if 'website' in contacts:
+        personal_info["website"] = contacts['website']
     else:
-        personal_info["website"] = "Personal website not mentioned"
+        personal_info["website"] = WEBSITE_PLACEHOLDER
     
     return personal_info
 
-def extract_skills(text: str) -> List[str]:
+def extract_skills(source: Union[str, ResumeDocument], taxonomy: Optional[SkillTaxonomy] = None) -> List[str]:
     """Extract technical skills from resume text with enhanced detection"""
-    # Comprehensive skills database
-    skills_database = [
-        # Programming Languages
-        'Python', 'Java', 'JavaScript', 'C++', 'C#', 'C', 'PHP', 'Ruby', 'Go', 'Swift', 
-        'Kotlin', 'Scala', 'R', 'MATLAB', 'TypeScript', 'Dart', 'Rust', 'Perl',
-        
-        # Web Technologies
-        'HTML', 'CSS', 'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 
-        'Flask', 'Spring', 'Laravel', 'Bootstrap', 'jQuery', 'Sass', 'Less',
-        
-        # Databases
-        'MySQL', 'PostgreSQL', 'MongoDB', 'SQLite', 'Redis', 'Oracle', 'SQL Server',
-        'Firebase', 'DynamoDB', 'Cassandra', 'Neo4j', 'SQL',
-        
-        # Cloud & DevOps
-        'AWS', 'Azure', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins', 'Git',
-        'GitHub', 'GitLab', 'CI/CD', 'Terraform', 'Ansible',
-        
-        # Data Science & ML
-        'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Scikit-learn',
-        'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Jupyter', 'Keras', 'OpenCV',
-        'Data Science', 'Data Analysis', 'Statistics', 'Big Data', 'Hadoop', 'Spark',
-        
-        # Mobile Development
-        'Android', 'iOS', 'React Native', 'Flutter', 'Xamarin',
-        
-        # Other Technologies
-        'Linux', 'Windows', 'MacOS', 'REST API', 'GraphQL', 'Microservices',
-        'Blockchain', 'Unity', 'Unreal Engine', 'AI', 'Artificial Intelligence',
-        'Computer Vision', 'NLP', 'Natural Language Processing'
-    ]
-    
-    found_skills = set()
-    text_lower = text.lower()
-    
-    for skill in skills_database:
-        # Check for exact match and common variations
-        skill_variations = [skill, skill.lower(), skill.upper(), skill.replace(' ', '')]
-        
-        for variation in skill_variations:
-            if variation.lower() in text_lower:
-                found_skills.add(skill)
-                break
-    
-    skills_list = sorted(list(found_skills))
+    text = source.text if isinstance(source, ResumeDocument) else source
+    taxonomy = taxonomy or get_skill_taxonomy()
+    skills_list = sorted(taxonomy.skill_matcher.find_set(text))
     
     if not skills_list:
-        return ["No technical skills clearly identified - consider adding a skills section"]
+        return [SKILLS_PLACEHOLDER]
     
     return skills_list
 
-def extract_experience(text: str) -> List[Dict[str, str]]:
+def extract_experience(source: Union[str, ResumeDocument]) -> List[Dict[str, str]]:
     """Enhanced work experience extraction that completely avoids false positives"""
+    document = ResumeDocument.coerce(source)
     experience = []
-    lines = text.split('\n')
-    clean_lines = [line.strip() for line in lines if line.strip()]
     
     # STRICT keywords that indicate actual work experience (not academic projects)
     work_keywords = [
@@ -315,9 +691,7 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
     has_real_work = False
     work_sections = []
     
-    for line in clean_lines:
-        line_lower = line.lower()
-        
+    for line, line_lower in zip(document.lines, document.lines_lower):
         # Must have work keywords AND not have exclude keywords
         has_work_indicators = any(keyword in line_lower for keyword in work_keywords)
         has_exclude_indicators = any(keyword in line_lower for keyword in exclude_keywords)
@@ -328,166 +702,118 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
     
     # If no real work experience found, return student-appropriate message
     if not has_real_work:
-        return [{
-            'company': 'No professional work experience',
-            'position': 'Student - No work history found',
-            'duration': '0 years',
-            'description': 'This is a student resume with academic projects only. Consider highlighting internships, part-time work, or volunteer experience.'
-        }]
+        return [dict(STUDENT_EXPERIENCE)]
     
     # Process actual work experience (this won't execute for student resumes)
     for work_line in work_sections:
         experience.append({
-            'company': 'Company from resume',
-            'position': 'Position from resume', 
+            'company': EXPERIENCE_COMPANY_PLACEHOLDER,
+            'position': EXPERIENCE_POSITION_PLACEHOLDER,
             'duration': work_line,
-            'description': 'Professional work experience extracted from resume'
+            'description': EXPERIENCE_DESCRIPTION_PLACEHOLDER
         })
     
     return experience
 
-def extract_education(text: str) -> List[Dict[str, str]]:
+def extract_education(source: Union[str, ResumeDocument]) -> List[Dict[str, str]]:
     """Enhanced education extraction with summary exclusion and improved patterns"""
+    document = ResumeDocument.coerce(source)
+    clean_lines = document.lines
+    lines_lower = document.lines_lower
     education = []
-    lines = text.split('\n')
-    clean_lines = [line.strip() for line in lines if line.strip()]
-    
-    # Summary/objective exclusion keywords
-    summary_keywords = [
-        'results-driven', 'seeking', 'objective', 'summary', 'profile',
-        'committed to', 'specializing in', 'passionate about', 'looking for',
-        'dedicated', 'motivated', 'experienced in', 'skilled in'
-    ]
+    seen_degrees = set()
     
-    # ENHANCED academic education patterns - more comprehensive
-    academic_patterns = [
-        r'\b(?:b\.?e\.?|bachelor.*?engineering|be\s+computer)\b',
-        r'\b(?:b\.?tech|bachelor.*?technology)\b', 
-        r'\b(?:b\.?sc\.?|bachelor.*?science)\b',
-        r'\b(?:b\.?a\.?|bachelor.*?arts)\b',
-        r'\b(?:m\.?e\.?|master.*?engineering)\b',
-        r'\b(?:m\.?tech|master.*?technology)\b',
-        r'\b(?:m\.?sc\.?|master.*?science)\b',
-        r'\b(?:m\.?a\.?|master.*?arts)\b',
-        r'\b(?:mba|master.*?business)\b',
-        r'\b(?:phd|ph\.d\.?|doctorate)\b',
-        r'\b(?:computer science|electronics|mechanical|civil)\b',
-        r'\b(?:engineering college|institute of technology)\b',
-        r'\b(?:university|college|institute).*?(?:technology|engineering|science)\b',
-        r'\b(?:kseeb|cbse|icse|state board).*?(?:12th|plus.*?two|intermediate|puc)\b',
-        r'\b(?:10th|sslc|matriculation)\b',
-        r'\b(?:high school|secondary school)\b'
-    ]
+    # Per-line facts used by the context window, computed at most once per line
+    line_facts: Dict[int, tuple] = {}
     
-    # Keywords to EXCLUDE (certifications, training, etc.)
-    exclude_keywords = [
-        'certification', 'certificate', 'certified', 'training', 'course',
-        'workshop', 'seminar', 'bootcamp', 'online course', 'mooc',
-        'udemy', 'coursera', 'edx', 'khan academy', 'pluralsight',
-        'aws certified', 'google certified', 'microsoft certified',
-        'oracle certified', 'cisco certified', 'comptia', 'pmp',
-        'scrum master', 'agile', 'itil', 'six sigma', 'lean'
-    ]
+    def facts(index: int) -> tuple:
+        if index not in line_facts:
+            line_lower = lines_lower[index]
+            line_facts[index] = (
+                EDUCATION_EXCLUDE_PATTERN.search(line_lower) is not None,
+                EDUCATION_INSTITUTION_PATTERN.search(line_lower) is not None,
+                YEAR_PATTERN.findall(clean_lines[index])
+            )
+        return line_facts[index]
     
     in_education_section = False
     
     for i, line in enumerate(clean_lines):
-        line_lower = line.lower()
+        line_lower = lines_lower[i]
         
         # Skip summary/objective lines
-        if any(summary_word in line_lower for summary_word in summary_keywords):
-            continue
-            
-        # Skip if it's clearly a summary (contains multiple summary indicators)
-        summary_indicators = sum(1 for keyword in summary_keywords if keyword in line_lower)
-        if summary_indicators >= 2:
+        if EDUCATION_SUMMARY_PATTERN.search(line_lower):
             continue
         
+        short_line = len(line.split()) <= 3
+        
         # Check if we're entering education section
-        if 'education' in line_lower and len(line.split()) <= 3:
+        if short_line and 'education' in line_lower:
             in_education_section = True
             continue
         
         # Stop at projects, experience, or skills section
-        if in_education_section and any(header in line_lower for header in ['project', 'experience', 'skill', 'certification', 'training']) and len(line.split()) <= 3:
+        if in_education_section and short_line and EDUCATION_SECTION_END_PATTERN.search(line_lower):
             break
         
         # Skip lines with certification/training keywords
-        if any(exclude_word in line_lower for exclude_word in exclude_keywords):
+        is_excluded, _, years = facts(i)
+        if is_excluded:
             continue
         
         # Look for ONLY academic education patterns
-        if in_education_section or any(re.search(pattern, line_lower) for pattern in academic_patterns):
-            # Check for academic degree patterns
-            for pattern in academic_patterns:
-                if re.search(pattern, line_lower):
-                    # Skip if it contains certification keywords
-                    if any(exclude_word in line_lower for exclude_word in exclude_keywords):
-                        continue
-                    
-                    # Look for years
-                    year_pattern = r'\b(20\d{2}|19\d{2})\b'
-                    years = re.findall(year_pattern, line)
-                    
-                    # Check next few lines for institution context - ENHANCED
-                    context_lines = clean_lines[i:i+5] if i+5 < len(clean_lines) else clean_lines[i:]
-                    institution_match = None
-                    
-                    # Improved institution detection
-                    for context_line in context_lines:
-                        # Skip certification lines in context too
-                        if any(exclude_word in context_line.lower() for exclude_word in exclude_keywords):
-                            continue
-                        
-                        # Enhanced institution keywords
-                        if any(keyword in context_line.lower() for keyword in 
-                               ['college', 'university', 'institute', 'school', 'iit', 'nit', 
-                                'technology', 'engineering', 'science']):
-                            institution_match = context_line
-                            break
-                        
-                        # Also look for years in context
-                        context_years = re.findall(year_pattern, context_line)
-                        years.extend(context_years)
-                    
-                    # Only create entry if it's clearly academic
-                    if re.search(r'\b(?:engineering|science|arts|technology|bachelor|master|phd|school|college|university)\b', line_lower):
-                        education_entry = {
-                            'institution': institution_match if institution_match else 'Educational Institution',
-                            'degree': line.strip()[:150] + ('...' if len(line) > 150 else ''),  # Increased length
-                            'year': ' - '.join(years[:2]) if len(years) >= 2 else (years[0] if years else 'Year not specified'),
-                            'gpa': 'Not provided'
-                        }
-                        
-                        # Avoid duplicates and ensure it's academic
-                        if not any(edu['degree'].lower() == education_entry['degree'].lower() for edu in education):
-                            education.append(education_entry)
-                    break
+        if not EDUCATION_ACADEMIC_PATTERN.search(line_lower):
+            continue
+        
+        years = list(years)
+        institution_match = None
+        
+        # Check next few lines for institution context - ENHANCED
+        for j in range(i, min(i + EDUCATION_CONTEXT_LINES, len(clean_lines))):
+            context_excluded, has_institution, context_years = facts(j)
+            # Skip certification lines in context too
+            if context_excluded:
+                continue
+            if has_institution:
+                institution_match = clean_lines[j]
+                break
+            # Also look for years in context
+            years.extend(context_years)
+        
+        # Only create entry if it's clearly academic
+        if EDUCATION_DEGREE_PATTERN.search(line_lower):
+            degree = line[:150] + ('...' if len(line) > 150 else '')
+            degree_key = degree.lower()
+            
+            # Avoid duplicates and ensure it's academic
+            if degree_key not in seen_degrees:
+                seen_degrees.add(degree_key)
+                education.append({
+                    'institution': institution_match if institution_match else INSTITUTION_PLACEHOLDER,
+                    'degree': degree,
+                    'year': ' - '.join(years[:2]) if len(years) >= 2 else (years[0] if years else YEAR_PLACEHOLDER),
+                    'gpa': GPA_PLACEHOLDER
+                })
     
     # If no academic education found, provide helpful placeholder
     if not education:
-        return [{
-            'institution': 'Academic education information not clearly identified',
-            'degree': 'Please ensure academic qualifications are clearly formatted in your resume',
-            'year': 'N/A',
-            'gpa': 'Not provided'
-        }]
+        return [dict(NO_EDUCATION)]
     
     return education
 
-def extract_projects(text: str) -> List[Dict[str, Any]]:
+def extract_projects(source: Union[str, ResumeDocument], taxonomy: Optional[SkillTaxonomy] = None) -> List[Dict[str, Any]]:
     """Enhanced project extraction with duplicate prevention and better technology detection"""
+    document = ResumeDocument.coerce(source)
     projects = []
     seen_projects = set()  # Track project names we've already added
-    lines = text.split('\n')
-    clean_lines = [line.strip() for line in lines if line.strip()]
+    clean_lines = document.lines
     
     in_projects_section = False
     current_project = {}
     project_count = 0
     
     for i, line in enumerate(clean_lines):
-        line_lower = line.lower()
+        line_lower = document.lines_lower[i]
         
         # Check if we're entering projects section
         if 'project' in line_lower and len(line.split()) <= 3:
@@ -558,57 +884,55 @@ def extract_projects(text: str) -> List[Dict[str, Any]]:
             seen_projects.add(project_name_lower)
     
     # Enhanced technology extraction and cleanup
-    all_technologies = [
-        'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'MongoDB', 'MySQL', 
-        'AI', 'ML', 'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch',
-        'OpenCV', 'Flutter', 'Android', 'iOS', 'HTML', 'CSS', 'PHP', 'C++', 'C#',
-        'Angular', 'Vue', 'Django', 'Flask', 'Spring', 'Docker', 'Kubernetes',
-        'AWS', 'Azure', 'Git', 'GitHub', 'SQL', 'NoSQL', 'Redis', 'Firebase'
-    ]
-    
+    taxonomy = taxonomy or get_skill_taxonomy()
     for project in projects:
         if project["description"]:
             # Extract technologies from both name and description
-            combined_text = (project["name"] + " " + project["description"]).lower()
-            tech_found = []
+            combined_text = project["name"] + " " + project["description"]
             
-            for tech in all_technologies:
-                if tech.lower() in combined_text:
-                    tech_found.append(tech)
-            
-            # Remove duplicates and limit
-            project["technologies"] = list(set(tech_found))[:8]
+            # Matcher output is already de-duplicated; keep the first few
+            project["technologies"] = taxonomy.project_matcher.find(combined_text)[:8]
             
             # Add placeholder if no technologies found
             if not project["technologies"]:
-                project["technologies"] = ["Technologies not specified in resume"]
+                project["technologies"] = [TECHNOLOGIES_PLACEHOLDER]
         else:
-            project["technologies"] = ["Technologies not specified in resume"]
+            project["technologies"] = [TECHNOLOGIES_PLACEHOLDER]
             if not project["description"]:
-                project["description"] = "Project description not provided in resume"
+                project["description"] = PROJECT_DESCRIPTION_PLACEHOLDER
     
     # If no projects found, provide helpful placeholder
     if not projects:
-        return [{
-            'name': 'No projects section found',
-            'description': 'Consider adding academic or personal projects to strengthen your resume and demonstrate your technical abilities',
-            'technologies': ['Project technologies not specified']
-        }]
+        return [dict(NO_PROJECTS, technologies=list(NO_PROJECTS['technologies']))]
     
     return projects
 
-def parse_resume_text(text: str) -> Dict[str, Any]:
-    """Enhanced parsing with intelligent fallbacks and better error handling"""
+def parse_resume_text(text: str, ner_doc: Optional[Any] = None,
+                      timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Enhanced parsing with intelligent fallbacks and better error handling
+    
+    If timings is given, the seconds spent in each extractor are added to it.
+    """
     if not text or not text.strip():
         raise Exception("No text provided for parsing")
     
     try:
+        # Normalize once and share the document across every extractor
+        document = ResumeDocument(text)
+        # One taxonomy version for the whole parse, even if a reload lands meanwhile
+        taxonomy = get_skill_taxonomy()
+        
         # Extract different sections with enhanced algorithms
-        personal_info = extract_personal_info(text)
-        skills = extract_skills(text)
-        experience = extract_experience(text)
-        education = extract_education(text)
-        projects = extract_projects(text)
+        with timed(timings, 'personal_info'):
+            personal_info = extract_personal_info(document, ner_doc)
+        with timed(timings, 'skills'):
+            skills = extract_skills(document, taxonomy)
+        with timed(timings, 'experience'):
+            experience = extract_experience(document)
+        with timed(timings, 'education'):
+            education = extract_education(document)
+        with timed(timings, 'projects'):
+            projects = extract_projects(document, taxonomy)
         
         # Structure the parsed data
         parsed_data = {
@@ -619,63 +943,222 @@ def parse_resume_text(text: str) -> Dict[str, Any]:
             'projects': projects,
             'raw_text_length': len(text),
             'parsing_timestamp': datetime.now().isoformat(),
-            'spacy_enabled': USE_SPACY
+            'spacy_enabled': get_nlp() is not None,
+            'taxonomy_version': taxonomy.version
         }
         
         return parsed_data
         
+    except MemoryError:
+        raise
     except Exception as e:
         raise Exception(f"Error parsing resume text: {str(e)}")
 
-def process_resume_file(file_path: str) -> Dict[str, Any]:
-    """Main function to process resume file with comprehensive error handling"""
-    try:
-        # Validate file exists
-        if not os.path.exists(file_path):
-            raise Exception(f"File not found: {file_path}")
-        
-        # Determine file type and extract text
-        file_extension = os.path.splitext(file_path)[1].lower()
-        
+def parse_resume_texts(texts: List[str], batch_size: int = NER_BATCH_SIZE, n_process: int = 1,
+                       timings: Optional[List[Optional[Dict[str, float]]]] = None) -> List[Union[Dict[str, Any], Exception]]:
+    """Parse many resume texts, running all NER headers through one nlp.pipe stream
+    
+    Results are returned in input order and match parse_resume_text output;
+    a text that cannot be parsed gets its Exception in its slot instead of
+    failing the batch. n_process > 1 lets spaCy fan the NER batches out over
+    worker processes. timings, if given, holds one dict (or None) per text.
+    """
+    item_timings = timings if timings is not None else [None] * len(texts)
+    results: List[Union[Dict[str, Any], Exception]] = [
+        Exception("No text provided for parsing") for _ in texts
+    ]
+    positions = [index for index, text in enumerate(texts) if text and text.strip()]
+    
+    nlp_model = get_nlp()
+    # Resumes whose name line is found without NER skip the pipe entirely
+    headers = {index: get_ner_header(texts[index]) for index in positions} if nlp_model else {}
+    ner_docs = nlp_model.pipe(
+        (header for header in headers.values() if header is not None), batch_size=batch_size, n_process=n_process
+    ) if nlp_model else iter(())
+    
+    for index in positions:
+        ner_doc = next(ner_docs) if headers.get(index) is not None else None
+        try:
+            results[index] = parse_resume_text(texts[index], ner_doc, item_timings[index])
+        except Exception as e:
+            results[index] = e
+    return results
+
+def _extract_resume_text(source: Union[str, bytes], filename: str, file_size: int,
+                         timings: Optional[Dict[str, float]] = None) -> Tuple[str, Dict[str, Any]]:
+    """Extract and validate the text of a resume given as a path or as bytes; returns the text and file_info"""
+    # Determine file type and extract text
+    file_extension = os.path.splitext(filename)[1].lower()
+    
+    with timed(timings, 'extract_text'):
         if file_extension == '.pdf':
-            text = extract_text_from_pdf(file_path)
+            text, extraction_info = extract_pdf_text(source)
         elif file_extension in ['.docx', '.doc']:
-            text = extract_text_from_docx(file_path)
+            text, extraction_info = extract_docx_text(source)
         else:
             raise Exception(f"Unsupported file type: {file_extension}")
+    
+    # Validate extracted text
+    if not text or not text.strip():
+        raise Exception("No text could be extracted from the file")
+    
+    if len(text.strip()) < 50:
+        raise Exception("Extracted text is too short to be a valid resume")
+    
+    return text, {
+        'filename': os.path.basename(filename),
+        'file_type': file_extension,
+        'file_size': file_size,
+        'text_length': len(text),
+        **extraction_info
+    }
+
+def _parse_resume_source(source: Union[str, bytes], filename: str, file_size: int,
+                         timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Extract, validate and parse a resume given as a path or as bytes"""
+    text, file_info = _extract_resume_text(source, filename, file_size, timings)
+    
+    # Parse the extracted text and add metadata
+    parsed_data = parse_resume_text(text, timings=timings)
+    parsed_data['file_info'] = file_info
+    
+    return parsed_data
+
+# Sandboxes belong to the process that started them; forked server workers create their own
+_parse_sandbox = None
+_parse_sandbox_pid = None
+
+def _get_parse_sandbox() -> SandboxPool:
+    global _parse_sandbox, _parse_sandbox_pid
+    if _parse_sandbox is None or _parse_sandbox_pid != os.getpid():
+        _parse_sandbox = SandboxPool(PARSE_SANDBOX_WORKERS, PARSE_TIMEOUT, PARSE_MEMORY_LIMIT_MB)
+        _parse_sandbox_pid = os.getpid()
+    return _parse_sandbox
+
+def _parse_resume_source_timed(source: Union[str, bytes], filename: str, file_size: int) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Run in the sandbox child; timings come back alongside the result"""
+    timings = {}
+    return _parse_resume_source(source, filename, file_size, timings), timings
+
+def _run_parse(source: Union[str, bytes], filename: str, file_size: int,
+               timings: Optional[Dict[str, float]], sandboxed: Optional[bool]) -> Dict[str, Any]:
+    if not (PARSE_SANDBOX if sandboxed is None else sandboxed):
+        return _parse_resume_source(source, filename, file_size, timings)
+    
+    parsed_data, child_timings = _get_parse_sandbox().run(_parse_resume_source_timed, source, filename, file_size)
+    if timings is not None:
+        for stage, seconds in child_timings.items():
+            timings[stage] = timings.get(stage, 0.0) + seconds
+    return parsed_data
+
+def process_resume_file(file_path: str, timings: Optional[Dict[str, float]] = None,
+                        sandboxed: Optional[bool] = None) -> Dict[str, Any]:
+    """Main function to process resume file with comprehensive error handling
+    
+    If timings is given, per-stage seconds (text extraction and each extractor) are added to it.
+    sandboxed runs the parse in a supervised subprocess with PARSE_TIMEOUT and
+    PARSE_MEMORY_LIMIT_MB limits (default: the PARSE_SANDBOX setting); a
+    document that hits a limit raises ParseLimitError.
+    """
+    try:
+        # Validate file exists
+        if not os.path.exists(file_path):
+            raise Exception(f"File not found: {file_path}")
         
-        # Validate extracted text
-        if not text or not text.strip():
-            raise Exception("No text could be extracted from the file")
-        
-        if len(text.strip()) < 50:
-            raise Exception("Extracted text is too short to be a valid resume")
-        
-        # Parse the extracted text
-        parsed_data = parse_resume_text(text)
-        
-        # Add metadata
-        parsed_data['file_info'] = {
-            'filename': os.path.basename(file_path),
-            'file_type': file_extension,
-            'file_size': os.path.getsize(file_path),
-            'text_length': len(text)
-        }
-        
-        return parsed_data
+        return _run_parse(file_path, file_path, os.path.getsize(file_path), timings, sandboxed)
+    
+    except (ParseLimitError, MemoryError):
+        raise
+    except Exception as e:
+        raise Exception(f"Error processing resume file: {str(e)}")
+
+def process_resume_bytes(data: bytes, filename: str, timings: Optional[Dict[str, float]] = None,
+                         sandboxed: Optional[bool] = None) -> Dict[str, Any]:
+    """Process an in-memory resume; filename only determines the file type"""
+    try:
+        return _run_parse(data, filename, len(data), timings, sandboxed)
     
+    except (ParseLimitError, MemoryError):
+        raise
     except Exception as e:
         raise Exception(f"Error processing resume file: {str(e)}")
 
+def process_resume_batch(items: List[Tuple[Union[str, bytes], str]],
+                         timings: Optional[List[Optional[Dict[str, float]]]] = None,
+                         sandboxed: Optional[bool] = None) -> List[Union[Dict[str, Any], Exception]]:
+    """Process many resumes, running their NER headers through one nlp.pipe stream
+    
+    items are (file path or bytes, filename) pairs. Returns one entry per
+    item in input order: the parse result, or the Exception that item
+    raised, so one bad file does not fail the rest. timings, if given, holds
+    one dict (or None) per item. Sandboxed parses keep one document per
+    child so each gets its own limits, and so skip NER batching.
+    """
+    item_timings = timings if timings is not None else [None] * len(items)
+    results: List[Union[Dict[str, Any], Exception]] = []
+    
+    if PARSE_SANDBOX if sandboxed is None else sandboxed:
+        for (source, filename), stage_timings in zip(items, item_timings):
+            try:
+                if isinstance(source, (bytes, bytearray)):
+                    results.append(process_resume_bytes(source, filename, stage_timings, sandboxed=True))
+                else:
+                    results.append(process_resume_file(source, stage_timings, sandboxed=True))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    texts = []
+    file_infos = []
+    for (source, filename), stage_timings in zip(items, item_timings):
+        try:
+            file_size = len(source) if isinstance(source, (bytes, bytearray)) else os.path.getsize(source)
+            text, file_info = _extract_resume_text(source, filename, file_size, stage_timings)
+        except Exception as e:
+            text, file_info = '', Exception(f"Error processing resume file: {str(e)}")
+        texts.append(text)
+        file_infos.append(file_info)
+    
+    # Items that failed extraction go through as empty texts and keep their own error
+    parsed = parse_resume_texts(texts, timings=item_timings)
+    for result, file_info in zip(parsed, file_infos):
+        if isinstance(file_info, Exception):
+            results.append(file_info)
+        elif isinstance(result, Exception):
+            results.append(Exception(f"Error processing resume file: {str(result)}"))
+        else:
+            result['file_info'] = file_info
+            results.append(result)
+    return results
+
 # Export all functions
 __all__ = [
+    'PARSER_VERSION',
+    'current_parser_version',
     'extract_text_from_pdf',
     'extract_text_from_docx', 
+    'extract_pdf_text',
+    'extract_docx_text',
+    'iter_pdf_pages',
     'parse_resume_text',
+    'parse_resume_texts',
+    'get_nlp',
+    'get_nlp_status',
     'process_resume_file',
+    'process_resume_bytes',
+    'process_resume_batch',
+    'ParseLimitError',
     'extract_personal_info',
+    'detect_name_header',
+    'scan_contact_info',
     'extract_skills',
     'extract_experience',
     'extract_education',
-    'extract_projects'
+    'extract_projects',
+    'ResumeDocument'
 ]
+
+if __name__ == '__main__':
+    # Bulk command-line parsing: python -m resume_parser --help
+    from utils.bulk_parse import main
+    main()
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from job_matcher import analyze_job_match
+from job_ranker import EncodedJobs, EncodedResumes, rank_resumes, score_matrices
+from resume_models import (
+    EXPERIENCE_COMPANY_PLACEHOLDER, EXPERIENCE_DESCRIPTION_PLACEHOLDER, EXPERIENCE_POSITION_PLACEHOLDER,
+    SKILLS_PLACEHOLDER, STUDENT_EXPERIENCE
+)
+from utils.skill_taxonomy import get_skill_taxonomy
+
+PROFESSIONAL_EXPERIENCE = {
+    'company': EXPERIENCE_COMPANY_PLACEHOLDER,
+    'position': EXPERIENCE_POSITION_PLACEHOLDER,
+    'duration': '2 years',
+    'description': EXPERIENCE_DESCRIPTION_PLACEHOLDER
+}
+
+
+def generate_resumes(rng, count=40):
+    taxonomy = get_skill_taxonomy()
+    marketing = taxonomy.field_keywords['marketing']
+    resumes = [
+        {'skills': [], 'experience': []},
+        {'skills': [SKILLS_PLACEHOLDER], 'experience': [dict(STUDENT_EXPERIENCE)]},
+        {'skills': ['Python', 'Not A Real Skill'], 'experience': [dict(PROFESSIONAL_EXPERIENCE)]},
+        # One clearly technical and one clearly marketing resume, to exercise the field-mismatch caps
+        {'skills': ['Python', 'Java', 'JavaScript', 'Machine Learning'], 'experience': [dict(PROFESSIONAL_EXPERIENCE)]},
+        {'skills': ['Marketing', 'Branding', 'Advertising', 'Campaign Analytics'], 'experience': [dict(PROFESSIONAL_EXPERIENCE)]},
+    ]
+    for _ in range(count):
+        skills = rng.sample(taxonomy.skills, rng.randint(0, 12)) + rng.sample(marketing, rng.randint(0, 5))
+        rng.shuffle(skills)
+        experience = STUDENT_EXPERIENCE if rng.random() < 0.3 else PROFESSIONAL_EXPERIENCE
+        resumes.append({'skills': skills, 'experience': [dict(experience)]})
+    return resumes
+
+
+def generate_jobs(rng, count=12):
+    taxonomy = get_skill_taxonomy()
+    marketing = taxonomy.field_keywords['marketing']
+    jobs = [
+        "Office manager for a busy clinic.",
+        "Marketing lead owning branding, advertising and campaign analytics.",
+        "Software development role: Python and Java programming on ML algorithms.",
+    ]
+    for _ in range(count):
+        skills = rng.sample(taxonomy.skills, rng.randint(0, 8))
+        keywords = rng.sample(marketing, rng.randint(0, 4))
+        jobs.append(f"We are hiring. Requirements: {', '.join(skills)}. Nice to have: {', '.join(keywords)}.")
+    return jobs
+
+
+@pytest.fixture(scope='module')
+def pairs():
+    rng = random.Random(7)
+    return generate_resumes(rng), generate_jobs(rng)
+
+
+def test_score_matrices_match_analyze_job_match(pairs):
+    resumes, jobs = pairs
+    scores = score_matrices(EncodedResumes(resumes), EncodedJobs(jobs))
+
+    for row, resume in enumerate(resumes):
+        for column, job in enumerate(jobs):
+            expected = analyze_job_match(resume, job)
+            assert scores['overall'][row, column] == pytest.approx(expected['overall_score'])
+            assert scores['skills'][row, column] == pytest.approx(expected['skills_match']['match_percentage'])
+            assert bool(scores['field_mismatch'][row, column]) == expected['field_mismatch']
+
+
+def test_generated_pairs_cover_edge_cases(pairs):
+    resumes, jobs = pairs
+    scores = score_matrices(EncodedResumes(resumes), EncodedJobs(jobs))
+
+    assert scores['field_mismatch'].any()
+    assert (scores['skills'] == 50).any()  # a job listing no known skills
+    assert (scores['skills'] == 0).any()
+
+
+def test_rank_resumes_orders_by_analyze_job_match(pairs):
+    resumes, jobs = pairs
+    rankings = rank_resumes(resumes, jobs, top_k=5)
+
+    assert len(rankings) == len(jobs)
+    for job, ranking in zip(jobs, rankings):
+        expected = sorted(
+            range(len(resumes)),
+            key=lambda index: -analyze_job_match(resumes[index], job)['overall_score']
+        )[:5]
+        assert [entry['resume_index'] for entry in ranking] == expected
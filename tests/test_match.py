@@ -0,0 +1,92 @@
+import sqlite3
+
+import pytest
+
+import app as app_module
+from job_matcher import analyze_job_match
+from resume_parser import parse_resume_text
+from utils.resume_store import ResumeStore
+
+BACKEND_JOB = "Backend Engineer with Python, SQL and Docker experience."
+FRONTEND_JOB = "Frontend Developer skilled in React and Node.js."
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ResumeStore(str(tmp_path / 'resumes.sqlite3'), max_rows=2, ttl_seconds=3600)
+    monkeypatch.setattr(app_module, 'resume_store', store)
+    monkeypatch.setattr(app_module, 'relevance_seq', None)
+    return store
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture(scope='module')
+def parsed():
+    return parse_resume_text(app_module.WARM_UP_RESUME)
+
+
+def test_match_stored_resume(store, client, parsed):
+    resume_id = store.add(parsed, 'resume-1')
+    response = client.post('/match', data={'resume_id': resume_id, 'job_description': [BACKEND_JOB, FRONTEND_JOB]})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['resume_id'] == resume_id
+    assert [result['overall_score'] for result in body['results']] == [
+        analyze_job_match(parsed, job)['overall_score'] for job in (BACKEND_JOB, FRONTEND_JOB)
+    ]
+
+
+def test_match_unknown_resume_id(store, client):
+    response = client.post('/match', data={'resume_id': 12345, 'job_description': BACKEND_JOB})
+    assert response.status_code == 404
+
+
+def test_match_requires_resume_id(store, client):
+    response = client.post('/match', data={'job_description': BACKEND_JOB})
+    assert response.status_code == 400
+
+
+def test_match_too_many_job_descriptions(store, client, parsed):
+    resume_id = store.add(parsed, 'resume-1')
+    job_descriptions = [BACKEND_JOB] * (app_module.app.config['MATCH_MAX_JOBS'] + 1)
+    response = client.post('/match', data={'resume_id': resume_id, 'job_description': job_descriptions})
+
+    assert response.status_code == 400
+    assert 'Too many job descriptions' in response.get_json()['error']
+
+
+def test_match_bm25_scoring(store, client, parsed):
+    resume_id = store.add(parsed, 'resume-1')
+    response = client.post('/match', data={'resume_id': resume_id, 'job_description': BACKEND_JOB, 'scoring': 'bm25'})
+
+    assert response.status_code == 200
+    result = response.get_json()['results'][0]
+    assert result['scoring'] == 'bm25'
+    assert result['relevance_match']['match_percentage'] > 0
+
+
+def test_match_evicted_resume_id(store, client, parsed):
+    first_id = store.add(parsed, 'resume-1')
+    app_module.get_relevance_index()
+    store.add(parsed, 'resume-2')
+    store.add(parsed, 'resume-3')
+
+    response = client.post('/match', data={'resume_id': first_id, 'job_description': BACKEND_JOB})
+    assert response.status_code == 404
+    assert store.count() == 2
+    assert first_id not in app_module.get_relevance_index()
+
+
+def test_match_expired_resume_id(store, client, parsed):
+    resume_id = store.add(parsed, 'resume-1')
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute('UPDATE resumes SET created_at = created_at - 7200 WHERE id = ?', (resume_id,))
+
+    response = client.post('/match', data={'resume_id': resume_id, 'job_description': BACKEND_JOB})
+    assert response.status_code == 404
+    assert store.id_for('resume-1') is None
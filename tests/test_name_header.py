@@ -0,0 +1,32 @@
+import pytest
+
+from resume_parser import detect_name_header
+
+
+@pytest.mark.parametrize('text, name', [
+    ("Jane Doe\nData Scientist\njane@x.com\n", "Jane Doe"),
+    ("Marketing Specialist\nJane Doe\njane@x.com\n", "Jane Doe"),
+    ("Cover Letter\nJane Doe\njane@x.com\n\nDear Hiring Manager,\n", "Jane Doe"),
+    ("Product Owner\nAmit Kumar\n+91 9876543210\n", "Amit Kumar"),
+    ("JOHN SMITH | Engineer\nNew York City\njohn@x.com\n", "JOHN SMITH"),
+])
+def test_single_name_candidate_skips_ner(text, name):
+    assert detect_name_header(text) == (name, '')
+
+
+def test_title_lines_are_not_names():
+    name, header = detect_name_header("Cover Letter\nDear Hiring Manager,\nI am applying for the role.\n")
+    assert name is None
+    assert header.startswith("Cover Letter")
+
+
+def test_several_name_candidates_fall_back_to_ner():
+    name, header = detect_name_header("Jane Doe\nSan Francisco\njane@x.com\n")
+    assert name is None
+    assert header == "Jane Doe\nSan Francisco\njane@x.com"
+
+
+def test_contact_block_at_the_bottom():
+    lines = ["Summary", "Built data pipelines in Python.", "Experience", "Acme Corp", "Analyst", "Education",
+             "Ravi Menon", "ravi@x.com"]
+    assert detect_name_header("\n".join(lines)) == ("Ravi Menon", '')
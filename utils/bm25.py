@@ -0,0 +1,236 @@
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from resume_models import NO_EDUCATION, NO_PROJECTS, PROJECT_DESCRIPTION_PLACEHOLDER, SKILLS_PLACEHOLDER, TECHNOLOGIES_PLACEHOLDER
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have',
+    'in', 'is', 'it', 'its', 'of', 'on', 'or', 'our', 'that', 'the', 'their', 'this',
+    'to', 'was', 'we', 'were', 'will', 'with', 'you', 'your', 'who', 'can', 'all'
+])
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens, keeping forms like 'c++', 'c#' and 'node.js' intact"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def index_text(parsed_data: Dict[str, Any]) -> str:
+    """Return the free text a parsed resume is scored on for relevance ranking
+
+    Skills, degrees and projects only: experience entries and the
+    placeholders the extractors emit when a section is missing carry no
+    text from the resume itself.
+    """
+    parts = [skill for skill in parsed_data.get('skills', []) if skill != SKILLS_PLACEHOLDER]
+    for entry in parsed_data.get('education', []):
+        if entry.get('year') != NO_EDUCATION['year']:
+            parts.append(entry.get('degree', ''))
+    for project in parsed_data.get('projects', []):
+        if project.get('name') == NO_PROJECTS['name']:
+            continue
+        parts.append(project.get('name', ''))
+        if project.get('description', '') != PROJECT_DESCRIPTION_PLACEHOLDER:
+            parts.append(project.get('description', ''))
+        parts.extend(tech for tech in project.get('technologies', []) if tech != TECHNOLOGIES_PLACEHOLDER)
+    return '\n'.join(part for part in parts if part)
+
+
+class BM25Index:
+    """Incremental BM25 index over a corpus of documents with integer ids.
+
+    Term statistics are kept as compact posting arrays (internal document
+    number and term frequency per term), so adding a document only appends
+    to the postings of its own terms. The IDF table is refreshed for just the
+    terms whose document frequency changed, and fully whenever the corpus
+    has changed size by more than idf_refresh_ratio since the last full
+    refresh. Scoring a query is a sparse dot product over the query terms'
+    postings. Removing documents (replaced or evicted resumes) rewrites the
+    postings in one pass and leaves holes in the internal numbering, which
+    are compacted away once they outnumber the live documents.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, idf_refresh_ratio: float = 0.05):
+        self.k1 = k1
+        self.b = b
+        self.idf_refresh_ratio = idf_refresh_ratio
+
+        self.doc_ids = array('q')        # internal number -> external id
+        self.doc_lengths = array('I')    # internal number -> token count
+        self._doc_numbers: Dict[int, int] = {}
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._total_length = 0
+
+        self.idf: Dict[str, float] = {}
+        self._dirty_terms = set()
+        self._idf_doc_count = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._doc_numbers
+
+    @property
+    def average_length(self) -> float:
+        return self._total_length / len(self._doc_numbers) if self._doc_numbers else 0.0
+
+    def add(self, doc_id: int, text: str) -> bool:
+        """Index a document; returns False if doc_id is already indexed"""
+        term_counts = Counter(tokenize(text))
+        with self._lock:
+            if doc_id in self._doc_numbers:
+                return False
+            number = len(self.doc_ids)
+            self._doc_numbers[doc_id] = number
+            self.doc_ids.append(doc_id)
+            length = sum(term_counts.values())
+            self.doc_lengths.append(length)
+            self._total_length += length
+
+            for term, count in term_counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = (array('I'), array('H'))
+                    self._postings[term] = postings
+                postings[0].append(number)
+                postings[1].append(min(count, 65535))
+                self._dirty_terms.add(term)
+            return True
+
+    def remove(self, doc_ids: Iterable[int]) -> int:
+        """Drop documents from the index; returns how many of them were indexed
+
+        Every term's postings are rewritten in one pass, so remove documents
+        in batches rather than one call each.
+        """
+        with self._lock:
+            numbers = [self._doc_numbers.pop(doc_id) for doc_id in set(doc_ids) if doc_id in self._doc_numbers]
+            if not numbers:
+                return 0
+            for number in numbers:
+                self._total_length -= self.doc_lengths[number]
+                self.doc_lengths[number] = 0
+
+            removed = np.array(numbers, dtype=np.uint32)
+            for term in list(self._postings):
+                numbers_array, counts_array = self._postings[term]
+                keep = ~np.isin(np.frombuffer(numbers_array, dtype=np.uint32), removed)
+                if keep.all():
+                    continue
+                if keep.any():
+                    self._postings[term] = (
+                        array('I', np.frombuffer(numbers_array, dtype=np.uint32)[keep].tobytes()),
+                        array('H', np.frombuffer(counts_array, dtype=np.uint16)[keep].tobytes())
+                    )
+                    self._dirty_terms.add(term)
+                else:
+                    del self._postings[term]
+                    self.idf.pop(term, None)
+                    self._dirty_terms.discard(term)
+
+            if len(self.doc_ids) > 2 * len(self._doc_numbers):
+                self._compact()
+            return len(numbers)
+
+    def _compact(self) -> None:
+        """Renumber the live documents densely, dropping the holes left by remove()"""
+        live = np.array(sorted(self._doc_numbers.values()), dtype=np.int64)
+        renumber = np.zeros(len(self.doc_ids), dtype=np.uint32)
+        renumber[live] = np.arange(len(live), dtype=np.uint32)
+        self.doc_ids = array('q', [self.doc_ids[number] for number in live])
+        self.doc_lengths = array('I', [self.doc_lengths[number] for number in live])
+        self._doc_numbers = {doc_id: number for number, doc_id in enumerate(self.doc_ids)}
+        for term, (numbers_array, counts_array) in self._postings.items():
+            numbers = renumber[np.frombuffer(numbers_array, dtype=np.uint32)]
+            self._postings[term] = (array('I', numbers.tobytes()), counts_array)
+
+    def _idf_for(self, document_frequency: int, doc_count: int) -> float:
+        return math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def refresh_idf(self, full: bool = False) -> None:
+        """Bring the IDF table up to date with the documents added so far"""
+        with self._lock:
+            doc_count = len(self._doc_numbers)
+            changed = abs(doc_count - self._idf_doc_count)
+            if full or changed > self._idf_doc_count * self.idf_refresh_ratio:
+                terms: Iterable[str] = self._postings
+                self._idf_doc_count = doc_count
+            else:
+                terms = self._dirty_terms
+            for term in terms:
+                self.idf[term] = self._idf_for(len(self._postings[term][0]), doc_count)
+            self._dirty_terms = set()
+
+    def _query_weights(self, query: str) -> Dict[str, float]:
+        """Return idf-weighted query terms that occur in the corpus"""
+        self.refresh_idf()
+        counts = Counter(tokenize(query))
+        return {term: self.idf[term] * count for term, count in counts.items() if term in self.idf}
+
+    def max_score(self, query: str) -> float:
+        """Upper bound of any document's score for query (all terms, saturated tf)"""
+        with self._lock:
+            return sum(self._query_weights(query).values()) * (self.k1 + 1)
+
+    def score_all(self, query: str) -> np.ndarray:
+        """BM25 score of every indexed document for query, by internal number"""
+        with self._lock:
+            weights = self._query_weights(query)
+            scores = np.zeros(len(self.doc_ids), dtype=np.float64)
+            if not weights:
+                return scores
+
+            lengths = np.frombuffer(self.doc_lengths, dtype=np.uint32).astype(np.float64)
+            norms = self.k1 * (1 - self.b + self.b * lengths / (self.average_length or 1.0))
+            for term, weight in weights.items():
+                numbers_array, counts_array = self._postings[term]
+                numbers = np.frombuffer(numbers_array, dtype=np.uint32)
+                counts = np.frombuffer(counts_array, dtype=np.uint16).astype(np.float64)
+                scores[numbers] += weight * counts * (self.k1 + 1) / (counts + norms[numbers])
+            return scores
+
+    def score(self, query: str, text: str) -> float:
+        """BM25 score of an arbitrary text for query using the corpus statistics"""
+        with self._lock:
+            weights = self._query_weights(query)
+            if not weights:
+                return 0.0
+            term_counts = Counter(tokenize(text))
+            length = sum(term_counts.values())
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1.0))
+            return sum(
+                weight * term_counts[term] * (self.k1 + 1) / (term_counts[term] + norm)
+                for term, weight in weights.items() if term_counts[term]
+            )
+
+    def rank(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """Return (doc_id, score) for the top_k documents, best first"""
+        with self._lock:
+            scores = self.score_all(query)
+            if not len(scores):
+                return []
+            top_k = min(top_k, len(scores))
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+            order = candidates[np.lexsort((candidates, -scores[candidates]))]
+            return [(int(self.doc_ids[number]), float(scores[number])) for number in order if scores[number] > 0]
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            return {
+                'documents': len(self._doc_numbers),
+                'terms': len(self._postings),
+                'average_length': round(self.average_length, 1)
+            }
+
+
+__all__ = ['BM25Index', 'tokenize', 'index_text']
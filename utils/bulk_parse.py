@@ -0,0 +1,202 @@
+"""
+Bulk resume parsing from the command line
+Parses every resume under the given directories (or listed in a file) on a
+process pool and streams one JSON line per resume, so archives far larger
+than memory can be backfilled. Invoked as `python -m resume_parser`.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO
+
+import resume_parser
+from job_matcher import JobProfile, analyze_job_match, compile_job_profile
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+# Each pool worker loads its own NLP model and compiles the job description once
+_worker_job_profile: Optional[JobProfile] = None
+
+
+def _init_worker(job_description: str) -> None:
+    global _worker_job_profile
+    resume_parser.get_nlp()
+    _worker_job_profile = compile_job_profile(job_description) if job_description.strip() else None
+
+
+def _parse_chunk(paths: List[str]) -> List[Dict[str, Any]]:
+    """Parse a chunk of files in a pool worker with batched NER, returning a result or error record per file"""
+    records = []
+    for path, parsed in zip(paths, resume_parser.process_resume_batch([(path, path) for path in paths])):
+        try:
+            if isinstance(parsed, Exception):
+                raise parsed
+            if _worker_job_profile is not None:
+                parsed['job_match'] = analyze_job_match(parsed, _worker_job_profile)
+            records.append({'path': path, 'ok': True, 'result': parsed})
+        except Exception as e:
+            records.append({'path': path, 'ok': False, 'error': str(e)})
+    return records
+
+
+def iter_resume_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """Yield resume files from files and directories (walked recursively in sorted order)"""
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(RESUME_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield item
+
+
+def iter_file_list(list_path: str) -> Iterator[str]:
+    """Yield the non-empty lines of a file list ('-' reads stdin)"""
+    stream = sys.stdin if list_path == '-' else open(list_path, encoding='utf-8')
+    try:
+        for line in stream:
+            if line.strip():
+                yield line.strip()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """Return the paths already recorded in an earlier run's output
+
+    A line cut short by an interrupted run is truncated away so appending
+    continues on a clean line boundary.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, 'rb+') as f:
+        valid_bytes = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError):
+                pass
+            valid_bytes += len(line)
+        f.truncate(valid_bytes)
+    return done
+
+
+def run_bulk_parse(paths: Iterable[str], output: TextIO, workers: int, job_description: str = '',
+                   skip: Optional[Set[str]] = None, max_in_flight: Optional[int] = None,
+                   progress: Optional[TextIO] = None, chunk_size: int = 8) -> Dict[str, int]:
+    """Parse paths on a process pool and write one JSON record per line to output
+
+    Files go to the pool in chunks of chunk_size so each worker runs NER
+    over a whole chunk in one batch. At most max_in_flight chunks are
+    submitted at a time, so memory stays bounded however many paths there
+    are. Records are written in completion order and flushed as they
+    arrive. Returns parsed/failed/skipped counts.
+    """
+    skip = skip or set()
+    max_in_flight = max_in_flight or workers * 2
+    chunk_size = max(chunk_size, 1)
+    counts = {'parsed': 0, 'failed': 0, 'skipped': 0}
+    started = time.perf_counter()
+
+    def write(record: Dict[str, Any]) -> None:
+        output.write(json.dumps(record, ensure_ascii=False) + '\n')
+        output.flush()
+        counts['parsed' if record['ok'] else 'failed'] += 1
+        done = counts['parsed'] + counts['failed']
+        if progress is not None and done % 100 == 0:
+            rate = done / (time.perf_counter() - started)
+            progress.write(f"{done} resumes ({counts['failed']} failed), {rate:.1f}/s\n")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(job_description,)) as executor:
+        in_flight = set()
+        chunk: List[str] = []
+
+        def submit(chunk: List[str]) -> None:
+            nonlocal in_flight
+            if len(in_flight) >= max_in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    for record in future.result():
+                        write(record)
+            in_flight.add(executor.submit(_parse_chunk, chunk))
+
+        try:
+            for path in paths:
+                if path in skip:
+                    counts['skipped'] += 1
+                    continue
+                chunk.append(path)
+                if len(chunk) >= chunk_size:
+                    submit(chunk)
+                    chunk = []
+            if chunk:
+                submit(chunk)
+
+            for future in wait(in_flight).done:
+                for record in future.result():
+                    write(record)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return counts
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m resume_parser',
+        description='Parse resumes in bulk and write one JSON record per line.'
+    )
+    parser.add_argument('inputs', nargs='*', help='Resume files or directories to walk')
+    parser.add_argument('--file-list', help="File with one resume path per line ('-' for stdin)")
+    parser.add_argument('-o', '--output', help='JSONL output file (default: stdout)')
+    parser.add_argument('--job-description', default='', help='Match every resume against this job description')
+    parser.add_argument('--job-description-file', help='Read the job description from this file')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parser processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=8,
+                        help='Files per pool task; NER runs over each chunk in one batch (default: 8)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip files already recorded in --output and append to it')
+    args = parser.parse_args(argv)
+
+    if not args.inputs and not args.file_list:
+        parser.error('give at least one file or directory, or --file-list')
+    if args.resume and not args.output:
+        parser.error('--resume needs --output to read the checkpoint from')
+
+    job_description = args.job_description
+    if args.job_description_file:
+        with open(args.job_description_file, encoding='utf-8') as f:
+            job_description = f.read()
+
+    listed = iter_file_list(args.file_list) if args.file_list else ()
+    paths = iter_resume_paths(itertools.chain(args.inputs, listed))
+
+    skip = load_checkpoint(args.output) if args.resume else set()
+    output = open(args.output, 'a' if args.resume else 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        counts = run_bulk_parse(paths, output, max(args.workers, 1), job_description, skip,
+                                progress=sys.stderr, chunk_size=args.chunk_size)
+    except KeyboardInterrupt:
+        sys.stderr.write('Interrupted; rerun with --resume to continue\n')
+        sys.exit(130)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    sys.stderr.write(f"Done: {counts['parsed']} parsed, {counts['failed']} failed, {counts['skipped']} skipped\n")
+
+
+__all__ = ['run_bulk_parse', 'iter_resume_paths', 'iter_file_list', 'load_checkpoint', 'main']
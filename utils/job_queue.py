@@ -0,0 +1,210 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+@contextmanager
+def _connect(db_path: str) -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(db_path, timeout=5)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _run_job(db_path: str, job_id: str, func: Callable, args: tuple) -> Any:
+    """Executed in a pool worker: mark the job running, then do the work"""
+    with _connect(db_path) as conn:
+        conn.execute(
+            'UPDATE jobs SET status = ?, started_at = ? WHERE id = ? AND status = ?',
+            (RUNNING, time.time(), job_id, QUEUED)
+        )
+    return func(*args)
+
+
+class JobQueue:
+    """Background jobs run on a local worker pool with state kept in SQLite.
+
+    Job state lives in a SQLite file rather than in process memory, so any
+    web worker on the host can answer a status poll for a job submitted to
+    another one. Finished jobs are purged after result_ttl seconds, and new
+    submissions are refused once max_pending jobs are queued or running.
+
+    Each job records the pid of the server worker that submitted it, since
+    only that process can store its result. A job whose owner has exited
+    (worker recycling, timeout kills) or that has been queued or running
+    for longer than job_timeout seconds is marked failed by a sweep that
+    runs before every submit, poll and stats call, so orphans never count
+    against max_pending.
+    """
+
+    def __init__(self, db_path: str, executor_factory: Callable[[], Executor],
+                 max_pending: int = 1000, result_ttl: float = 3600,
+                 job_timeout: float = 900):
+        self.db_path = db_path
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.job_timeout = job_timeout
+        self._executor_factory = executor_factory
+        self._executor: Optional[Executor] = None
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with _connect(self.db_path) as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, created_at REAL NOT NULL, '
+                'started_at REAL, finished_at REAL, result TEXT, error TEXT, owner_pid INTEGER)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, finished_at)')
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'owner_pid' not in columns:
+                # Job files written before owners were recorded
+                try:
+                    conn.execute('ALTER TABLE jobs ADD COLUMN owner_pid INTEGER')
+                except sqlite3.OperationalError:
+                    pass  # another server worker added it first
+
+    @property
+    def executor(self) -> Executor:
+        # Created on first use so each server worker process gets its own pool
+        if self._executor is None:
+            self._executor = self._executor_factory()
+        return self._executor
+
+    def _sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        """Mark failed the pending jobs that can no longer finish"""
+        conn.execute(
+            'UPDATE jobs SET status = ?, finished_at = ?, error = ? '
+            'WHERE status IN (?, ?) AND COALESCE(started_at, created_at) < ?',
+            (FAILED, now, 'Job timed out', QUEUED, RUNNING, now - self.job_timeout)
+        )
+        owners = conn.execute(
+            'SELECT DISTINCT owner_pid FROM jobs WHERE status IN (?, ?)', (QUEUED, RUNNING)
+        ).fetchall()
+        for (pid,) in owners:
+            if pid is None or pid == os.getpid() or _pid_alive(pid):
+                continue
+            conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, error = ? '
+                'WHERE status IN (?, ?) AND owner_pid = ?',
+                (FAILED, now, 'Job was lost when its server worker exited', QUEUED, RUNNING, pid)
+            )
+
+    def submit(self, func: Callable, *args: Any,
+               on_result: Optional[Callable[[Any], Any]] = None) -> str:
+        """Queue func(*args) on the worker pool and return the job id straight away
+
+        func and args must be picklable. on_result runs in this process on the
+        return value before it is stored; its return value becomes the result.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with _connect(self.db_path) as conn:
+            self._sweep(conn, now)
+            conn.execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?',
+                (DONE, FAILED, now - self.result_ttl)
+            )
+            pending = conn.execute(
+                'SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)', (QUEUED, RUNNING)
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise RuntimeError(f'Job queue is full ({pending} jobs pending). Try again later.')
+            conn.execute(
+                'INSERT INTO jobs (id, status, created_at, owner_pid) VALUES (?, ?, ?, ?)',
+                (job_id, QUEUED, now, os.getpid())
+            )
+
+        future = self.executor.submit(_run_job, self.db_path, job_id, func, args)
+        future.add_done_callback(lambda done: self._finish(job_id, done, on_result))
+        return job_id
+
+    def complete(self, result: Any) -> str:
+        """Record a job whose result is already known (e.g. a cache hit)"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with _connect(self.db_path) as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, status, created_at, started_at, finished_at, result) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, DONE, now, now, now, json.dumps(result))
+            )
+        return job_id
+
+    def _finish(self, job_id: str, future: Future, on_result: Optional[Callable[[Any], Any]]) -> None:
+        status, result, error = DONE, None, None
+        try:
+            result = future.result()
+            if on_result is not None:
+                result = on_result(result)
+            result = json.dumps(result)
+        except Exception as e:
+            status, error = FAILED, str(e)
+
+        # A job the sweep already failed (timed out) keeps that outcome
+        with _connect(self.db_path) as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ? '
+                'WHERE id = ? AND status IN (?, ?)',
+                (status, time.time(), result, error, job_id, QUEUED, RUNNING)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the status (and result or error once finished) of a job, or None"""
+        with _connect(self.db_path) as conn:
+            self._sweep(conn, time.time())
+            row = conn.execute(
+                'SELECT status, created_at, started_at, finished_at, result, error FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        status, created_at, started_at, finished_at, result, error = row
+        job = {
+            'job_id': job_id,
+            'status': status,
+            'created_at': created_at,
+            'started_at': started_at,
+            'finished_at': finished_at
+        }
+        if status == DONE:
+            job['results'] = json.loads(result)
+        elif status == FAILED:
+            job['error'] = error
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of jobs in each status"""
+        with _connect(self.db_path) as conn:
+            self._sweep(conn, time.time())
+            rows = conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+
+__all__ = ['JobQueue', 'QUEUED', 'RUNNING', 'DONE', 'FAILED']
@@ -0,0 +1,300 @@
+import atexit
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers a fast cached match up to a slow scanned PDF
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@contextmanager
+def timed(timings: Optional[Dict[str, float]], stage: str) -> Iterator[None]:
+    """Add the seconds spent in the block to timings[stage]; does nothing if timings is None"""
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+
+def page_count_label(page_count: Optional[int]) -> str:
+    """Bucket a page count into a small fixed set of label values"""
+    if page_count is None:
+        return 'n/a'
+    if page_count <= 2:
+        return str(page_count)
+    if page_count <= 5:
+        return '3-5'
+    if page_count <= 10:
+        return '6-10'
+    return '11+'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    """A monotonically increasing count per label combination"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 on_update: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+        self._on_update = on_update
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+        if self._on_update is not None:
+            self._on_update()
+
+    def _drain(self) -> List[Tuple[Tuple[str, ...], int, float]]:
+        """Take the values recorded so far as (labels, slot, amount) rows, leaving zero behind"""
+        with self._lock:
+            values, self._values = self._values, {}
+        return [(labels, 0, value) for labels, value in values.items()]
+
+    def _add_rows(self, rows: Iterable[Tuple[Tuple[str, ...], int, float]]) -> None:
+        with self._lock:
+            for labels, _, value in rows:
+                self._values[labels] = self._values.get(labels, 0.0) + value
+
+    def render(self, rows: Optional[Iterable[Tuple[Tuple[str, ...], int, float]]] = None) -> List[str]:
+        """Render this process's values, or the given (labels, slot, amount) rows if passed"""
+        if rows is None:
+            with self._lock:
+                values = dict(self._values)
+        else:
+            values = {labels: value for labels, _, value in rows}
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        for labels, value in sorted(values.items()):
+            lines.append(f'{self.name}{_format_labels(self.labelnames, labels)} {value:g}')
+        return lines
+
+
+class Histogram:
+    """Observations counted into cumulative buckets per label combination"""
+
+    # Row slot holding the sum of observations; bucket counts use slots 0..len(buckets)
+    SUM_SLOT = -1
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, on_update: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (per-bucket counts with a final +Inf slot, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+        self._on_update = on_update
+
+    def _new_series(self) -> Tuple[List[int], List[float]]:
+        return [0] * (len(self.buckets) + 1), [0.0]
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._new_series()
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1][0] += value
+        if self._on_update is not None:
+            self._on_update()
+
+    def _drain(self) -> List[Tuple[Tuple[str, ...], int, float]]:
+        """Take the observations recorded so far as (labels, slot, amount) rows, leaving zero behind"""
+        with self._lock:
+            all_series, self._series = self._series, {}
+        rows = []
+        for labels, (counts, total) in all_series.items():
+            rows.extend((labels, slot, count) for slot, count in enumerate(counts) if count)
+            rows.append((labels, self.SUM_SLOT, total[0]))
+        return rows
+
+    def _merge(self, series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]],
+               rows: Iterable[Tuple[Tuple[str, ...], int, float]]) -> None:
+        for labels, slot, amount in rows:
+            target = series.get(labels)
+            if target is None:
+                target = self._new_series()
+                series[labels] = target
+            if slot == self.SUM_SLOT:
+                target[1][0] += amount
+            elif 0 <= slot < len(target[0]):
+                target[0][slot] += int(amount)
+
+    def _add_rows(self, rows: Iterable[Tuple[Tuple[str, ...], int, float]]) -> None:
+        with self._lock:
+            self._merge(self._series, rows)
+
+    def render(self, rows: Optional[Iterable[Tuple[Tuple[str, ...], int, float]]] = None) -> List[str]:
+        """Render this process's observations, or the given (labels, slot, amount) rows if passed"""
+        if rows is None:
+            with self._lock:
+                all_series = {labels: (list(counts), list(total)) for labels, (counts, total) in self._series.items()}
+        else:
+            all_series = {}
+            self._merge(all_series, rows)
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for labels, (counts, total) in sorted(all_series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                bucket_labels = _format_labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {total[0]:.6f}')
+            lines.append(f'{self.name}_count{label_text} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text exposition format.
+
+    Without a path, values live in process memory: with several server
+    worker processes a scrape only sees the requests served by the worker
+    that answered it. With a path, every process adds what it recorded to
+    a SQLite file shared by the workers on the host from a background thread
+    every flush_interval seconds, before each render and at exit; recording
+    a value never touches the file, and a failed background write is logged
+    and retried on the next flush. render() then
+    reports the totals across every process, so counters never go backwards
+    when a different worker answers a scrape or a worker is recycled. A
+    worker killed outright loses at most flush_interval seconds of values.
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = 5.0):
+        self._metrics: List = []
+        self.path = path
+        self.flush_interval = flush_interval
+        self._flush_lock = threading.Lock()
+        self._flusher_pid = None
+        self._flusher_lock = threading.Lock()
+
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS metric_values ('
+                    'name TEXT NOT NULL, labels TEXT NOT NULL, slot INTEGER NOT NULL, value REAL NOT NULL, '
+                    'PRIMARY KEY (name, labels, slot)) WITHOUT ROWID'
+                )
+            atexit.register(self._flush_logged)
+            if hasattr(os, 'register_at_fork'):
+                # Values recorded before a fork (e.g. in a preloading server master) belong to the parent
+                os.register_at_fork(after_in_child=self._discard)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _updated(self) -> None:
+        # Threads do not survive fork, so each process starts its own flusher on first use
+        if self._flusher_pid != os.getpid():
+            with self._flusher_lock:
+                if self._flusher_pid != os.getpid():
+                    self._flusher_pid = os.getpid()
+                    threading.Thread(target=self._flush_periodically, name='metrics-flush', daemon=True).start()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self._flush_logged()
+
+    def _flush_logged(self) -> None:
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.warning(f'Could not write metrics to {self.path}: {str(e)}')
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames, on_update=self._updated if self.path else None)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets, on_update=self._updated if self.path else None)
+        self._metrics.append(metric)
+        return metric
+
+    def _discard(self) -> None:
+        for metric in self._metrics:
+            metric._drain()
+        self._flush_lock = threading.Lock()
+        self._flusher_lock = threading.Lock()
+
+    def flush(self) -> None:
+        """Add the values recorded since the last flush to the shared file (no-op without a path)
+
+        Raises sqlite3.Error if the file cannot be written; the values are kept for the next flush.
+        """
+        if not self.path:
+            return
+        with self._flush_lock:
+            drained = [(metric, metric._drain()) for metric in self._metrics]
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        'INSERT INTO metric_values (name, labels, slot, value) VALUES (?, ?, ?, ?) '
+                        'ON CONFLICT (name, labels, slot) DO UPDATE SET value = value + excluded.value',
+                        [(metric.name, json.dumps(labels), slot, amount)
+                         for metric, rows in drained for labels, slot, amount in rows]
+                    )
+            except sqlite3.Error:
+                # Keep the values for the next flush rather than losing them
+                for metric, rows in drained:
+                    metric._add_rows(rows)
+                raise
+
+    def render(self) -> str:
+        lines = []
+        if self.path:
+            self.flush()
+            with self._connect() as conn:
+                stored = conn.execute('SELECT name, labels, slot, value FROM metric_values').fetchall()
+            rows_by_name: Dict[str, List[Tuple[Tuple[str, ...], int, float]]] = {}
+            for name, labels, slot, value in stored:
+                rows_by_name.setdefault(name, []).append((tuple(json.loads(labels)), slot, value))
+            for metric in self._metrics:
+                lines.extend(metric.render(rows_by_name.get(metric.name, [])))
+        else:
+            for metric in self._metrics:
+                lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+__all__ = ['timed', 'page_count_label', 'Counter', 'Histogram', 'MetricsRegistry', 'DEFAULT_BUCKETS']
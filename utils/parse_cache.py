@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+
+class ParseCache:
+    """Content-addressed cache of parse results.
+
+    Keys are the SHA-256 of the uploaded file bytes combined with the parser
+    version, so identical files share one entry and a parser upgrade never
+    serves stale output. parser_version may be a callable for versions that
+    change at runtime (e.g. a reloaded skill taxonomy). A bounded in-process
+    LRU of zlib-compressed JSON (about a third of the plain JSON's size)
+    sits in front of a SQLite file shared by every worker on the host. Both
+    tiers expire entries after ttl_seconds; the disk tier also drops least
+    recently used rows once it holds more than max_disk_entries.
+    """
+
+    def __init__(self, db_path: Optional[str], parser_version: Union[str, Callable[[], str]],
+                 max_memory_entries: int = 256, max_disk_entries: int = 10000,
+                 ttl_seconds: float = 7 * 24 * 3600):
+        self.db_path = db_path
+        self._parser_version = parser_version
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+
+        # key -> (compressed JSON, expiry time)
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS parse_cache ('
+                    'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                    'expires_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+                )
+                conn.execute('CREATE INDEX IF NOT EXISTS parse_cache_accessed ON parse_cache (accessed_at)')
+
+    @property
+    def parser_version(self) -> str:
+        return self._parser_version() if callable(self._parser_version) else self._parser_version
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def key_for(self, data: bytes) -> str:
+        """Return the cache key for a file's bytes"""
+        return f'{self.parser_version}:{hashlib.sha256(data).hexdigest()}'
+
+    def with_version(self, key: str, parser_version: str) -> str:
+        """Return key for the same file bytes under another parser version"""
+        return f'{parser_version}:{key.rsplit(":", 1)[1]}'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached result for key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self._counters['memory_hits'] += 1
+                    return json.loads(zlib.decompress(entry[0]))
+                del self._memory[key]
+
+        serialized = self._disk_get(key, now) if self.db_path else None
+        with self._lock:
+            if serialized is None:
+                self._counters['misses'] += 1
+                return None
+            self._counters['disk_hits'] += 1
+        compressed = zlib.compress(serialized.encode())
+        with self._lock:
+            self._remember(key, compressed, now + self.ttl_seconds)
+        return json.loads(serialized)
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a parse result under key in both tiers"""
+        serialized = json.dumps(result)
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        compressed = zlib.compress(serialized.encode())
+        with self._lock:
+            self._remember(key, compressed, expires_at)
+            self._counters['stores'] += 1
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO parse_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, serialized, expires_at, now)
+                )
+                self._disk_evict(conn, now)
+
+    def _remember(self, key: str, compressed: bytes, expires_at: float) -> None:
+        self._memory[key] = (compressed, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT value, expires_at FROM parse_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                conn.execute('DELETE FROM parse_cache WHERE key = ?', (key,))
+                return None
+            conn.execute('UPDATE parse_cache SET accessed_at = ? WHERE key = ?', (now, key))
+            return row[0]
+
+    def _disk_evict(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute('DELETE FROM parse_cache WHERE expires_at <= ?', (now,)).rowcount
+        overflow = conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0] - self.max_disk_entries
+        if overflow > 0:
+            conn.execute(
+                'DELETE FROM parse_cache WHERE key IN ('
+                'SELECT key FROM parse_cache ORDER BY accessed_at LIMIT ?)', (overflow,)
+            )
+        with self._lock:
+            self._counters['evictions'] += max(expired, 0) + max(overflow, 0)
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute('DELETE FROM parse_cache')
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+        if self.db_path:
+            with self._connect() as conn:
+                stats['disk_entries'] = conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+        else:
+            stats['disk_entries'] = 0
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['parser_version'] = self.parser_version
+        return stats
+
+
+__all__ = ['ParseCache']
@@ -0,0 +1,49 @@
+from bisect import bisect_right
+from typing import List, Union
+
+
+class ResumeDocument:
+    """Resume text normalized once and shared by every extractor.
+
+    Holds the raw text, its lower-cased form, the non-empty stripped lines,
+    their lower-cased forms and the character offset at which each stripped
+    line starts in the raw text.
+    """
+
+    __slots__ = ('text', 'text_lower', 'lines', 'lines_lower', 'line_offsets')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.text_lower = text.lower()
+        self.lines: List[str] = []
+        self.lines_lower: List[str] = []
+        self.line_offsets: List[int] = []
+
+        offset = 0
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if line:
+                self.lines.append(line)
+                self.lines_lower.append(line.lower())
+                self.line_offsets.append(offset + len(raw_line) - len(raw_line.lstrip()))
+            offset += len(raw_line) + 1
+
+    @classmethod
+    def coerce(cls, source: Union[str, 'ResumeDocument']) -> 'ResumeDocument':
+        """Return source unchanged if already a ResumeDocument, else build one"""
+        if isinstance(source, cls):
+            return source
+        return cls(source)
+
+    def line_index_at(self, position: int) -> int:
+        """Return the index of the clean line containing a character position, or -1"""
+        index = bisect_right(self.line_offsets, position) - 1
+        if index < 0 or position >= self.line_offsets[index] + len(self.lines[index]):
+            return -1
+        return index
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
+__all__ = ['ResumeDocument']
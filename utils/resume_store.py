@@ -0,0 +1,277 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from resume_models import LOCATION_PLACEHOLDER, SKILLS_PLACEHOLDER
+from utils.text_normalization import normalize_degree, normalize_location, normalize_skill
+
+SKILL = 'skill'
+LOCATION = 'location'
+DEGREE = 'degree'
+
+# SQLite caps compound SELECTs at 500 terms; stay well below it
+MAX_QUERY_TERMS = 50
+
+# Change log entries kept for readers that sync incrementally (see changes_since)
+MAX_CHANGES = 10000
+
+
+def index_terms(parsed_data: Dict[str, Any]) -> Set[Tuple[str, str]]:
+    """Return the (kind, term) pairs a parsed resume is indexed under"""
+    terms = set()
+    for skill in parsed_data.get('skills', []):
+        if skill != SKILLS_PLACEHOLDER:
+            terms.add((SKILL, normalize_skill(skill)))
+
+    address = parsed_data.get('personal_info', {}).get('address', '')
+    if address and address != LOCATION_PLACEHOLDER:
+        terms.update((LOCATION, token) for token in normalize_location(address))
+
+    for entry in parsed_data.get('education', []):
+        terms.update((DEGREE, kind) for kind in normalize_degree(entry.get('degree', '')))
+    return terms
+
+
+class ResumeStore:
+    """Parsed resumes in SQLite with an inverted index over skills, locations and degrees.
+
+    Each resume is stored once per distinct file (by content key). The
+    resume_terms table maps every normalized (kind, term) pair to the ids
+    of the resumes carrying it, so searches read posting lists through the
+    primary-key index instead of re-parsing or scanning stored JSON.
+
+    The store is bounded: a resume expires ttl_seconds after it was last
+    stored, and once more than max_rows are held the oldest are deleted.
+    Expired and deleted resumes are no longer returned by get() or id_for(),
+    so their ids simply stop resolving.
+
+    Every add, replace or deletion also appends the resume id to a change
+    log, so in-memory indexes built from the store (the BM25 relevance index
+    in each server worker) can catch up with changes_since() instead of
+    re-reading every row. Only the latest MAX_CHANGES entries are kept.
+    """
+
+    def __init__(self, db_path: str, max_rows: int = 100000, ttl_seconds: float = 30 * 24 * 3600):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS resumes ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, content_key TEXT UNIQUE, '
+                'name TEXT, filename TEXT, created_at REAL NOT NULL, data TEXT NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS resume_terms ('
+                'kind TEXT NOT NULL, term TEXT NOT NULL, resume_id INTEGER NOT NULL, '
+                'PRIMARY KEY (kind, term, resume_id)) WITHOUT ROWID'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS resume_terms_resume ON resume_terms (resume_id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS resumes_created ON resumes (created_at)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS resume_changes ('
+                'seq INTEGER PRIMARY KEY AUTOINCREMENT, resume_id INTEGER NOT NULL)'
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, parsed_data: Dict[str, Any], content_key: Optional[str] = None) -> int:
+        """Store a parsed resume and index it; re-adding the same content_key replaces it (and renews it)"""
+        data = {key: value for key, value in parsed_data.items() if key != 'job_match'}
+        terms = index_terms(data)
+        name = data.get('personal_info', {}).get('name', '')
+        filename = data.get('file_info', {}).get('filename', '')
+        now = time.time()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT id FROM resumes WHERE content_key = ?', (content_key,)
+            ).fetchone() if content_key else None
+
+            if row is None:
+                resume_id = conn.execute(
+                    'INSERT INTO resumes (content_key, name, filename, created_at, data) VALUES (?, ?, ?, ?, ?)',
+                    (content_key, name, filename, now, json.dumps(data))
+                ).lastrowid
+            else:
+                resume_id = row[0]
+                conn.execute(
+                    'UPDATE resumes SET name = ?, filename = ?, created_at = ?, data = ? WHERE id = ?',
+                    (name, filename, now, json.dumps(data), resume_id)
+                )
+                conn.execute('DELETE FROM resume_terms WHERE resume_id = ?', (resume_id,))
+
+            conn.executemany(
+                'INSERT OR IGNORE INTO resume_terms (kind, term, resume_id) VALUES (?, ?, ?)',
+                [(kind, term, resume_id) for kind, term in terms]
+            )
+            self._log_changes(conn, [resume_id])
+            self._evict(conn, now)
+        return resume_id
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        expired = [row[0] for row in conn.execute(
+            'SELECT id FROM resumes WHERE created_at <= ?', (now - self.ttl_seconds,)
+        )]
+        overflow = conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0] - len(expired) - self.max_rows
+        if overflow > 0:
+            expired.extend(row[0] for row in conn.execute(
+                'SELECT id FROM resumes WHERE created_at > ? ORDER BY created_at, id LIMIT ?',
+                (now - self.ttl_seconds, overflow)
+            ))
+        if expired:
+            conn.executemany('DELETE FROM resume_terms WHERE resume_id = ?', [(resume_id,) for resume_id in expired])
+            conn.executemany('DELETE FROM resumes WHERE id = ?', [(resume_id,) for resume_id in expired])
+            self._log_changes(conn, expired)
+        return len(expired)
+
+    def evict(self) -> int:
+        """Delete expired resumes and any beyond max_rows now; returns how many were deleted"""
+        with self._connect() as conn:
+            return self._evict(conn, time.time())
+
+    def _log_changes(self, conn: sqlite3.Connection, resume_ids: List[int]) -> None:
+        conn.executemany('INSERT INTO resume_changes (resume_id) VALUES (?)', [(resume_id,) for resume_id in resume_ids])
+        conn.execute(
+            'DELETE FROM resume_changes WHERE seq <= (SELECT MAX(seq) FROM resume_changes) - ?', (MAX_CHANGES,)
+        )
+
+    def last_change(self) -> int:
+        """Return the sequence number of the latest change, to pass to changes_since later"""
+        with self._connect() as conn:
+            return conn.execute('SELECT COALESCE(MAX(seq), 0) FROM resume_changes').fetchone()[0]
+
+    def changes_since(self, seq: int) -> Optional[Tuple[int, List[int]]]:
+        """Return the latest sequence number and the ids added, replaced or deleted after seq
+
+        Returns None when the log no longer reaches back to seq (or the
+        store was recreated); the caller must then re-read every resume.
+        """
+        with self._connect() as conn:
+            oldest, latest = conn.execute('SELECT MIN(seq), COALESCE(MAX(seq), 0) FROM resume_changes').fetchone()
+            if latest < seq or (oldest is not None and oldest > seq + 1):
+                return None
+            rows = conn.execute('SELECT DISTINCT resume_id FROM resume_changes WHERE seq > ? AND seq <= ?',
+                                (seq, latest)).fetchall()
+        return latest, [row[0] for row in rows]
+
+    def id_for(self, content_key: str) -> Optional[int]:
+        """Return the id of the unexpired resume stored under content_key, or None"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT id FROM resumes WHERE content_key = ? AND created_at > ?',
+                (content_key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get(self, resume_id: int) -> Optional[Dict[str, Any]]:
+        """Return a stored parse result by id, or None if it was never stored, expired or was evicted"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT data FROM resumes WHERE id = ? AND created_at > ?', (resume_id, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_since(self, last_id: int = 0, batch_size: int = 1000) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (id, parse result) for every unexpired resume stored after last_id, in id order"""
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    'SELECT id, data, created_at FROM resumes WHERE id > ? ORDER BY id LIMIT ?', (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            cutoff = time.time() - self.ttl_seconds
+            for resume_id, data, created_at in rows:
+                if created_at > cutoff:
+                    yield resume_id, json.loads(data)
+            last_id = rows[-1][0]
+
+    def search(self, skills: Iterable[str] = (), locations: Iterable[str] = (),
+               degrees: Iterable[str] = (), match_all: bool = True,
+               limit: int = 20) -> Dict[str, Any]:
+        """Find resumes by skill, location and degree terms
+
+        With match_all every term must be present (boolean AND); otherwise
+        resumes with any term are ranked by how many terms they match, most
+        recent first among equals.
+        """
+        terms = {(SKILL, normalize_skill(skill)) for skill in skills if skill.strip()}
+        for location in locations:
+            terms.update((LOCATION, token) for token in normalize_location(location))
+        for degree in degrees:
+            terms.update((DEGREE, kind) for kind in normalize_degree(degree))
+
+        if not terms:
+            return {'total': 0, 'results': [], 'terms': []}
+        if len(terms) > MAX_QUERY_TERMS:
+            raise ValueError(f'Too many search terms. Maximum is {MAX_QUERY_TERMS}.')
+
+        # One posting-list read per term through the (kind, term) primary key
+        ordered_terms = sorted(terms)
+        params: List[Any] = [value for term in ordered_terms for value in term]
+        posting = 'SELECT resume_id FROM resume_terms WHERE kind = ? AND term = ?'
+        if match_all:
+            matches_sql = (
+                f'SELECT resume_id, {len(terms)} AS hits, COUNT(*) OVER () AS total '
+                f'FROM ({" INTERSECT ".join([posting] * len(terms))}) '
+                f'ORDER BY resume_id DESC LIMIT ?'
+            )
+        else:
+            matches_sql = (
+                f'SELECT resume_id, COUNT(*) AS hits, COUNT(*) OVER () AS total '
+                f'FROM ({" UNION ALL ".join([posting] * len(terms))}) '
+                f'GROUP BY resume_id ORDER BY hits DESC, resume_id DESC LIMIT ?'
+            )
+
+        with self._connect() as conn:
+            matches = conn.execute(matches_sql, params + [limit]).fetchall()
+            total = matches[0][2] if matches else 0
+            stored = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    f'SELECT id, name, filename, data FROM resumes '
+                    f'WHERE id IN ({",".join("?" * len(matches))}) AND created_at > ?',
+                    [resume_id for resume_id, _, _ in matches] + [time.time() - self.ttl_seconds]
+                )
+            } if matches else {}
+        rows = [(resume_id, hits) + stored[resume_id] for resume_id, hits, _ in matches if resume_id in stored]
+
+        results = []
+        for resume_id, hits, name, filename, data in rows:
+            parsed = json.loads(data)
+            results.append({
+                'resume_id': resume_id,
+                'matched_terms': hits,
+                'score': round(hits / len(terms), 3),
+                'name': name,
+                'filename': filename,
+                'skills': parsed.get('skills', []),
+                'location': parsed.get('personal_info', {}).get('address', '')
+            })
+        return {
+            'total': total,
+            'results': results,
+            'terms': [f'{kind}:{term}' for kind, term in ordered_terms]
+        }
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+
+__all__ = ['ResumeStore', 'index_terms']
@@ -0,0 +1,161 @@
+import multiprocessing
+import os
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; only the time limit applies there
+    resource = None
+
+TIMEOUT = 'timeout'
+MEMORY = 'memory'
+CRASHED = 'crashed'
+
+_OK = 'ok'
+_ERROR = 'error'
+
+
+class ParseLimitError(Exception):
+    """A sandboxed call was stopped by its time or memory limit (reason: timeout, memory or crashed)"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Keep the reason when the error crosses a process pool boundary
+        return (ParseLimitError, (self.reason, str(self)))
+
+
+def _address_space_bytes() -> Optional[int]:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _is_memory_error(error: BaseException) -> bool:
+    """Whether error is a MemoryError or was raised while handling or re-wrapping one"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, MemoryError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _serve(conn, memory_limit_bytes: int) -> None:
+    """Child process loop: run requested calls under the address-space cap"""
+    if memory_limit_bytes and resource is not None:
+        # The cap is headroom on top of what the forked worker already maps (models, libraries)
+        limit = (_address_space_bytes() or 0) + memory_limit_bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            func, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send((_OK, func(*args)))
+        except Exception as e:
+            # After any failure the heap may be in a bad state (a MemoryError is often
+            # caught and re-raised as another exception); report it and exit so the
+            # parent starts a fresh child
+            conn.send((MEMORY, None) if _is_memory_error(e) else (_ERROR, str(e)))
+            return
+
+
+class Sandbox:
+    """One supervised child process that runs calls with a wall-clock timeout and a memory cap.
+
+    The child is started on first use and reused between successful calls.
+    When a call runs past timeout seconds, or the child runs out of memory
+    or dies, it is killed and replaced and ParseLimitError is raised; after
+    any other error the child is replaced too. Calls run one at a time.
+    """
+
+    def __init__(self, timeout: float, memory_limit_mb: int = 0):
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(child_conn, self.memory_limit_bytes), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def _replace(self) -> None:
+        self._stop()
+        self._start()
+
+    def _stop(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        """Return func(*args) computed in the child; func and args must be picklable"""
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._stop()
+                self._start()
+
+            self._conn.send((func, args))
+            if not self._conn.poll(self.timeout):
+                self._replace()
+                raise ParseLimitError(TIMEOUT, f'Parse timed out after {self.timeout:g} seconds')
+
+            try:
+                status, payload = self._conn.recv()
+            except (EOFError, OSError):
+                self._process.join(1)
+                exitcode = self._process.exitcode
+                self._replace()
+                raise ParseLimitError(CRASHED, f'Parse worker crashed (exit code {exitcode})')
+
+            if status == MEMORY:
+                self._replace()
+                raise ParseLimitError(
+                    MEMORY, f'Parse exceeded memory limit of {self.memory_limit_bytes // (1024 * 1024)} MB'
+                )
+            if status == _ERROR:
+                self._replace()
+                raise Exception(payload)
+            return payload
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+
+class SandboxPool:
+    """A fixed number of Sandboxes so concurrent requests (e.g. threaded workers) do not queue on one"""
+
+    def __init__(self, size: int, timeout: float, memory_limit_mb: int = 0):
+        self._idle: 'queue.Queue[Sandbox]' = queue.Queue()
+        for _ in range(max(size, 1)):
+            self._idle.put(Sandbox(timeout, memory_limit_mb))
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        sandbox = self._idle.get()
+        try:
+            return sandbox.run(func, *args)
+        finally:
+            self._idle.put(sandbox)
+
+
+__all__ = ['Sandbox', 'SandboxPool', 'ParseLimitError', 'TIMEOUT', 'MEMORY', 'CRASHED']
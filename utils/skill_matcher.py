@@ -0,0 +1,104 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class SkillMatcher:
+    """Find every taxonomy term in a text with one compiled regex pass.
+
+    All variations of every term (as written, and with spaces removed) are
+    folded into a single case-insensitive alternation, longest first, so the
+    text is scanned once instead of once per skill. Terms must stand on their
+    own: a term is only matched when it is not glued to surrounding letters
+    or digits, which stops 'C' or 'R' from matching inside every word.
+    """
+
+    # A term may not be preceded or followed by an alphanumeric character.
+    # '+' and '#' are excluded after a match so 'C' never wins inside 'C++'/'C#'.
+    _LEFT_BOUNDARY = r'(?<![A-Za-z0-9])'
+    _RIGHT_BOUNDARY = r'(?![A-Za-z0-9+#])'
+
+    def __init__(self, terms: Iterable[str], aliases: Optional[Dict[str, Iterable[str]]] = None):
+        self.terms: List[str] = list(dict.fromkeys(terms))
+        self._order = {term: index for index, term in enumerate(self.terms)}
+
+        # Map every lower-cased variation back to its canonical term
+        self._variations: Dict[str, str] = {}
+        for term in self.terms:
+            for variation in (term, term.replace(' ', '')):
+                self._variations.setdefault(variation.lower(), term)
+        for term, synonyms in (aliases or {}).items():
+            if term not in self._order:
+                continue
+            for synonym in synonyms:
+                self._variations.setdefault(synonym.lower(), term)
+
+        # Terms that contain other terms as whole words ('React Native' -> 'React')
+        self._implied: Dict[str, List[str]] = {}
+        for term in self.terms:
+            implied = [
+                other for other in self.terms
+                if other != term and self._contains_word(term.lower(), other.lower())
+            ]
+            if implied:
+                self._implied[term] = implied
+
+        alternation = '|'.join(
+            re.escape(variation)
+            for variation in sorted(self._variations, key=len, reverse=True)
+        )
+        self.pattern = re.compile(
+            f'{self._LEFT_BOUNDARY}(?:{alternation}){self._RIGHT_BOUNDARY}',
+            re.IGNORECASE
+        ) if alternation else None
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return the compiled matcher as plain data (JSON-serializable) for from_state"""
+        return {
+            'terms': self.terms,
+            'variations': self._variations,
+            'implied': self._implied,
+            'pattern': self.pattern.pattern if self.pattern is not None else None
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'SkillMatcher':
+        """Rebuild a matcher from to_state output without re-deriving variations or implied terms"""
+        matcher = cls.__new__(cls)
+        matcher.terms = list(state['terms'])
+        matcher._order = {term: index for index, term in enumerate(matcher.terms)}
+        matcher._variations = dict(state['variations'])
+        matcher._implied = {term: list(implied) for term, implied in state['implied'].items()}
+        matcher.pattern = re.compile(state['pattern'], re.IGNORECASE) if state['pattern'] else None
+        return matcher
+
+    @classmethod
+    def _contains_word(cls, haystack: str, needle: str) -> bool:
+        return re.search(
+            f'{cls._LEFT_BOUNDARY}{re.escape(needle)}{cls._RIGHT_BOUNDARY}', haystack
+        ) is not None
+
+    def find_set(self, text: str) -> Set[str]:
+        """Return the set of canonical terms present in text"""
+        found: Set[str] = set()
+        if not text or self.pattern is None:
+            return found
+
+        for match in self.pattern.finditer(text):
+            term = self._variations[match.group(0).lower()]
+            if term not in found:
+                found.add(term)
+                found.update(self._implied.get(term, ()))
+        return found
+
+    def find(self, text: str) -> List[str]:
+        """Return canonical terms present in text, in taxonomy order"""
+        return sorted(self.find_set(text), key=self._order.__getitem__)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._order
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+
+__all__ = ['SkillMatcher']
@@ -0,0 +1,338 @@
+"""
+Skill taxonomy compilation and hot reload
+The taxonomy source (data/models/skill_taxonomy.json) lists every skill once,
+with its category, synonyms and the narrower scopes it is also matched in,
+plus the keywords that mark text as technical or marketing. It is compiled
+into an artifact holding the finished matchers, so a process loads it with
+one JSON read and a regex compile per scope instead of re-deriving every
+variation and implied term. Invoked as `python -m utils.skill_taxonomy` to
+rebuild the artifact after editing the source.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.skill_matcher import SkillMatcher
+
+_MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'models')
+DEFAULT_SOURCE_PATH = os.path.join(_MODELS_DIR, 'skill_taxonomy.json')
+DEFAULT_ARTIFACT_PATH = os.path.join(_MODELS_DIR, 'skill_taxonomy.compiled.json')
+
+# Workers reload the artifact when it is replaced; SKILL_TAXONOMY_RELOAD_INTERVAL=0 loads it once
+SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH', DEFAULT_SOURCE_PATH)
+SKILL_TAXONOMY_ARTIFACT = os.environ.get('SKILL_TAXONOMY_ARTIFACT', DEFAULT_ARTIFACT_PATH)
+SKILL_TAXONOMY_RELOAD_INTERVAL = float(os.environ.get('SKILL_TAXONOMY_RELOAD_INTERVAL', 5))
+
+# Bump when the artifact layout changes; artifacts in another format are ignored
+ARTIFACT_FORMAT = 1
+
+# Every skill is matched in resumes; these scopes opt a skill into the narrower matchers too
+SCOPES = ('projects', 'job_descriptions')
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class SkillTaxonomy:
+    """A compiled skill taxonomy: one SkillMatcher per scope plus field keywords.
+
+    skill_matcher finds every skill in resume text, project_matcher the
+    technologies named in projects and job_skill_matcher the skills a job
+    description can require. field_keywords maps a field ('technical',
+    'marketing') to the lower-case substrings that mark text as belonging to
+    it. Instances are never modified after construction, so a reference taken
+    at the start of a parse stays consistent while a reload swaps in a newer
+    version.
+    """
+
+    def __init__(self, version: str, skill_matcher: SkillMatcher, project_matcher: SkillMatcher,
+                 job_skill_matcher: SkillMatcher, categories: Dict[str, str],
+                 field_keywords: Dict[str, List[str]], source_sha256: str = ''):
+        self.version = version
+        self.skill_matcher = skill_matcher
+        self.project_matcher = project_matcher
+        self.job_skill_matcher = job_skill_matcher
+        self.categories = categories
+        self.field_keywords = field_keywords
+        self.source_sha256 = source_sha256
+
+    @property
+    def skills(self) -> List[str]:
+        """Every canonical skill name, in taxonomy order"""
+        return self.skill_matcher.terms
+
+    @classmethod
+    def compile(cls, source: Dict[str, Any], source_sha256: str = '') -> 'SkillTaxonomy':
+        """Validate a parsed taxonomy source and build its matchers"""
+        version = source.get('version')
+        if not isinstance(version, str) or not version:
+            raise ValueError('Invalid skill taxonomy: version must be a non-empty string')
+        fields = source.get('fields', {})
+        if not isinstance(fields, dict) or not all(
+            isinstance(keywords, list) and all(isinstance(keyword, str) for keyword in keywords)
+            for keywords in fields.values()
+        ):
+            raise ValueError('Invalid skill taxonomy: fields must map each field to a list of keywords')
+
+        names: List[str] = []
+        categories: Dict[str, str] = {}
+        aliases: Dict[str, List[str]] = {}
+        scoped: Dict[str, List[str]] = {scope: [] for scope in SCOPES}
+        # Lower-cased spelling -> skill, so no spelling can mean two skills
+        spellings: Dict[str, str] = {}
+
+        for entry in source.get('skills', []):
+            name = entry.get('name')
+            if not isinstance(name, str) or not name:
+                raise ValueError(f'Invalid skill taxonomy: skill without a name: {entry!r}')
+            if name in categories:
+                raise ValueError(f'Invalid skill taxonomy: {name} is listed twice')
+            synonyms = entry.get('synonyms', [])
+            for spelling in [name, name.replace(' ', '')] + synonyms:
+                owner = spellings.setdefault(spelling.lower(), name)
+                if owner != name:
+                    raise ValueError(f'Invalid skill taxonomy: {spelling!r} names both {owner} and {name}')
+            for scope in entry.get('also_match_in', []):
+                if scope not in scoped:
+                    raise ValueError(f"Invalid skill taxonomy: unknown scope {scope!r} for {name}")
+                scoped[scope].append(name)
+
+            names.append(name)
+            categories[name] = entry.get('category', '')
+            if synonyms:
+                aliases[name] = synonyms
+
+        if not names:
+            raise ValueError('Invalid skill taxonomy: no skills listed')
+
+        return cls(
+            version,
+            SkillMatcher(names, aliases),
+            SkillMatcher(scoped['projects'], aliases),
+            SkillMatcher(scoped['job_descriptions'], aliases),
+            categories,
+            {field: [keyword.lower() for keyword in keywords] for field, keywords in fields.items()},
+            source_sha256
+        )
+
+    def to_artifact(self) -> Dict[str, Any]:
+        """Return the compiled taxonomy as plain data for from_artifact"""
+        return {
+            'format': ARTIFACT_FORMAT,
+            'version': self.version,
+            'source_sha256': self.source_sha256,
+            'categories': self.categories,
+            'fields': self.field_keywords,
+            'matchers': {
+                'skills': self.skill_matcher.to_state(),
+                'projects': self.project_matcher.to_state(),
+                'job_descriptions': self.job_skill_matcher.to_state()
+            }
+        }
+
+    @classmethod
+    def from_artifact(cls, data: Dict[str, Any]) -> 'SkillTaxonomy':
+        """Rebuild a compiled taxonomy without recompiling the source"""
+        if data.get('format') != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported skill taxonomy artifact format: {data.get('format')!r}")
+        matchers = data['matchers']
+        return cls(
+            data['version'],
+            SkillMatcher.from_state(matchers['skills']),
+            SkillMatcher.from_state(matchers['projects']),
+            SkillMatcher.from_state(matchers['job_descriptions']),
+            data['categories'],
+            data['fields'],
+            data['source_sha256']
+        )
+
+
+def compile_taxonomy_file(source_path: str) -> SkillTaxonomy:
+    """Compile a taxonomy source file"""
+    with open(source_path, 'rb') as f:
+        raw = f.read()
+    return SkillTaxonomy.compile(json.loads(raw), hashlib.sha256(raw).hexdigest())
+
+
+def load_artifact(artifact_path: str) -> SkillTaxonomy:
+    """Load a compiled taxonomy artifact"""
+    with open(artifact_path, encoding='utf-8') as f:
+        return SkillTaxonomy.from_artifact(json.load(f))
+
+
+def write_artifact(taxonomy: SkillTaxonomy, artifact_path: str) -> None:
+    """Write the artifact atomically: readers see either the old file or the complete new one"""
+    directory = os.path.dirname(os.path.abspath(artifact_path))
+    fd, temp_path = tempfile.mkstemp(prefix='.skill_taxonomy.', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(taxonomy.to_artifact(), f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, artifact_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class TaxonomyLoader:
+    """Serves the current SkillTaxonomy and swaps in a new one when the artifact is replaced.
+
+    The artifact is used as long as it was compiled from the current source
+    file; a missing, unreadable or stale artifact falls back to compiling
+    the source in memory. current() checks the artifact's file identity at
+    most every reload_interval seconds (0 disables reloading) and, when it
+    has been replaced, loads it and swaps it in with a single reference
+    assignment, so callers never see a half-built taxonomy. Callers should
+    fetch the taxonomy once per unit of work. An unreadable artifact is
+    reported in last_error; if the source cannot be compiled either, the
+    previous version keeps being served.
+    """
+
+    def __init__(self, source_path: str = DEFAULT_SOURCE_PATH, artifact_path: str = DEFAULT_ARTIFACT_PATH,
+                 reload_interval: float = 5.0):
+        self.source_path = source_path
+        self.artifact_path = artifact_path
+        self.reload_interval = reload_interval
+        self.last_error: Optional[str] = None
+        self._taxonomy: Optional[SkillTaxonomy] = None
+        self._artifact_stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.artifact_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self, stamp: Optional[Tuple[int, int, int]]) -> SkillTaxonomy:
+        self.last_error = None
+        taxonomy = None
+        if stamp is not None:
+            try:
+                taxonomy = load_artifact(self.artifact_path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self.last_error = f'Could not load {self.artifact_path}: {str(e)}'
+        if taxonomy is not None and os.path.exists(self.source_path):
+            if taxonomy.source_sha256 != _file_sha256(self.source_path):
+                taxonomy = None
+        if taxonomy is None:
+            taxonomy = compile_taxonomy_file(self.source_path)
+        return taxonomy
+
+    def current(self) -> SkillTaxonomy:
+        """Return the taxonomy to use, reloading it first if the artifact was replaced"""
+        taxonomy = self._taxonomy
+        if taxonomy is None:
+            with self._lock:
+                if self._taxonomy is None:
+                    self._checked_at = time.monotonic()
+                    stamp = self._stamp()
+                    self._taxonomy = self._load(stamp)
+                    self._artifact_stamp = stamp
+                return self._taxonomy
+
+        if self.reload_interval <= 0 or time.monotonic() - self._checked_at < self.reload_interval:
+            return taxonomy
+        # One thread checks; the others keep using the current version meanwhile
+        if not self._lock.acquire(blocking=False):
+            return taxonomy
+        try:
+            self._checked_at = time.monotonic()
+            stamp = self._stamp()
+            if stamp != self._artifact_stamp:
+                # Recorded even if loading fails, so a bad artifact is not retried until replaced
+                self._artifact_stamp = stamp
+                try:
+                    self._taxonomy = self._load(stamp)
+                except Exception as e:
+                    self.last_error = f'Skill taxonomy reload failed: {str(e)}'
+            return self._taxonomy
+        finally:
+            self._lock.release()
+
+    def status(self) -> Dict[str, Any]:
+        """Report the loaded version and the last reload error"""
+        taxonomy = self.current()
+        return {
+            'version': taxonomy.version,
+            'skills': len(taxonomy.skill_matcher),
+            'artifact': self.artifact_path,
+            'error': self.last_error
+        }
+
+
+# The process-wide taxonomy shared by the parser, the job matcher and the ranker
+_skill_taxonomy = TaxonomyLoader(SKILL_TAXONOMY_PATH, SKILL_TAXONOMY_ARTIFACT, SKILL_TAXONOMY_RELOAD_INTERVAL)
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Return the current compiled skill taxonomy, picking up a replaced artifact"""
+    return _skill_taxonomy.current()
+
+
+def get_skill_taxonomy_status() -> Dict[str, Any]:
+    """Report the loaded skill taxonomy version and any reload error"""
+    return _skill_taxonomy.status()
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.skill_taxonomy',
+        description='Compile the skill taxonomy into the artifact that running workers load.'
+    )
+    parser.add_argument('source', nargs='?', default=SKILL_TAXONOMY_PATH,
+                        help='Taxonomy source file')
+    parser.add_argument('-o', '--output', default=SKILL_TAXONOMY_ARTIFACT,
+                        help='Artifact to write (replaced atomically)')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit non-zero if the artifact is missing or out of date instead of writing it')
+    args = parser.parse_args(argv)
+
+    try:
+        started = time.perf_counter()
+        taxonomy = compile_taxonomy_file(args.source)
+        compile_seconds = time.perf_counter() - started
+    except (OSError, ValueError) as e:
+        sys.exit(f'Error compiling skill taxonomy: {str(e)}')
+
+    if args.check:
+        try:
+            current = load_artifact(args.output).source_sha256 == taxonomy.source_sha256
+        except (OSError, ValueError, KeyError, TypeError):
+            current = False
+        if not current:
+            sys.exit(f'{args.output} is out of date; run python -m utils.skill_taxonomy')
+        print(f'{args.output} is up to date (version {taxonomy.version})')
+        return
+
+    write_artifact(taxonomy, args.output)
+    started = time.perf_counter()
+    load_artifact(args.output)
+    load_seconds = time.perf_counter() - started
+    print(
+        f'Compiled skill taxonomy {taxonomy.version} ({len(taxonomy.skill_matcher)} skills) '
+        f'in {compile_seconds * 1000:.1f} ms -> {args.output} (loads in {load_seconds * 1000:.1f} ms)'
+    )
+
+
+__all__ = [
+    'SkillTaxonomy', 'TaxonomyLoader', 'compile_taxonomy_file', 'load_artifact', 'write_artifact', 'main',
+    'get_skill_taxonomy', 'get_skill_taxonomy_status', 'DEFAULT_SOURCE_PATH', 'DEFAULT_ARTIFACT_PATH',
+    'SKILL_TAXONOMY_PATH', 'SKILL_TAXONOMY_ARTIFACT', 'SKILL_TAXONOMY_RELOAD_INTERVAL'
+]
+
+if __name__ == '__main__':
+    main()
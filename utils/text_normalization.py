@@ -0,0 +1,28 @@
+import re
+from typing import Set
+
+from resume_models import EDUCATION_ACADEMIC_PATTERN
+
+_LOCATION_TOKEN = re.compile(r'[a-z]{3,}')
+
+
+def normalize_skill(skill: str) -> str:
+    return ' '.join(skill.lower().split())
+
+
+def normalize_location(location: str) -> Set[str]:
+    """Split a location into the lower-cased words it can be searched by"""
+    return set(_LOCATION_TOKEN.findall(location.lower()))
+
+
+def normalize_degree(degree: str) -> Set[str]:
+    """Map a degree string to the academic pattern names it matches (e.g. 'bachelor_technology')"""
+    degree_lower = degree.lower()
+    kinds = {match.lastgroup for match in EDUCATION_ACADEMIC_PATTERN.finditer(degree_lower)}
+    # Allow searching by the normalized name itself
+    if not kinds and degree_lower in EDUCATION_ACADEMIC_PATTERN.groupindex:
+        kinds.add(degree_lower)
+    return kinds
+
+
+__all__ = ['normalize_skill', 'normalize_location', 'normalize_degree']